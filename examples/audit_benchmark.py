@@ -0,0 +1,103 @@
+"""Benchmark audit logging throughput in each logger mode.
+
+Run with ``python examples/audit_benchmark.py``.
+"""
+
+from __future__ import annotations
+
+import json
+import multiprocessing
+import tempfile
+import time
+from dataclasses import asdict
+from pathlib import Path
+from typing import Callable, List
+
+from promptshield.compliance import AuditLogger, SQLiteAuditStore
+from promptshield.compliance.audit import AuditEvent, _to_audit_event
+from promptshield.engine.events import SecurityEvent
+
+EVENTS = 50_000
+PROCESSES = 8
+EVENTS_PER_PROCESS = 20_000
+
+
+def _events(count: int) -> List[SecurityEvent]:
+    return [
+        SecurityEvent(
+            event_type="promptshield.scan",
+            message="Prompt scanned",
+            metadata={"risk_score": index % 100, "blocked": index % 7 == 0, "category": "NONE", "request_id": str(index)},
+        )
+        for index in range(count)
+    ]
+
+
+def _open_per_event(path: Path, events: List[SecurityEvent]) -> None:
+    # how 0.1.0 wrote every event
+    for event in events:
+        with path.open("a", encoding="utf-8") as handle:
+            handle.write(json.dumps(asdict(_to_audit_event(event))) + "\n")
+
+
+def _with_logger(**options) -> Callable[[Path, List[SecurityEvent]], None]:
+    def write(path: Path, events: List[SecurityEvent]) -> None:
+        logger = AuditLogger(str(path), **options)
+        for event in events:
+            logger.log_security_event(event)
+        logger.close()
+
+    return write
+
+
+def _sqlite(path: Path, events: List[SecurityEvent]) -> None:
+    store = SQLiteAuditStore(str(path.with_suffix(".db")))
+    for event in events:
+        store(event)
+    store.close()
+
+
+def _worker(path: str, buffered: bool) -> None:
+    logger = AuditLogger(path, buffered=buffered, multiprocess=True)
+    for index in range(EVENTS_PER_PROCESS):
+        logger.log_event(AuditEvent(event_type="stress", timestamp=str(index), message=str(index)))
+    logger.close()
+
+
+def _shared_file(directory: Path, buffered: bool) -> float:
+    path = directory / f"shared-{buffered}.jsonl"
+    started = time.perf_counter()
+    processes = [multiprocessing.Process(target=_worker, args=(str(path), buffered)) for _ in range(PROCESSES)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+    elapsed = time.perf_counter() - started
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == PROCESSES * EVENTS_PER_PROCESS and all(json.loads(line) for line in lines)
+    return len(lines) / elapsed
+
+
+def main() -> None:
+    events = _events(EVENTS)
+    modes = {
+        "unbuffered, open/close per event (0.1.0)": _open_per_event,
+        "unbuffered": _with_logger(),
+        'buffered, fsync="never"': _with_logger(buffered=True, fsync="never"),
+        'buffered, fsync="batch"': _with_logger(buffered=True, fsync="batch"),
+        "SQLiteAuditStore": _sqlite,
+    }
+    with tempfile.TemporaryDirectory() as directory:
+        for index, (name, write) in enumerate(modes.items()):
+            path = Path(directory) / f"audit-{index}.jsonl"
+            started = time.perf_counter()
+            write(path, events)
+            print(f"{name:<42} {EVENTS / (time.perf_counter() - started):>10,.0f} events/s")
+        for buffered in (False, True):
+            rate = _shared_file(Path(directory), buffered)
+            label = f"{PROCESSES} processes, shared file, {'buffered' if buffered else 'unbuffered'}"
+            print(f"{label:<42} {rate:>10,.0f} events/s")
+
+
+if __name__ == "__main__":
+    main()
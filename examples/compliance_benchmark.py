@@ -0,0 +1,75 @@
+"""Benchmark output compliance scanning on digit-heavy and prose outputs.
+
+Run with ``python examples/compliance_benchmark.py``.
+"""
+
+from __future__ import annotations
+
+import random
+import time
+
+from promptshield.compliance import ComplianceConfig, ComplianceEngine
+
+
+def _log_lines(rng: random.Random, count: int) -> str:
+    return "\n".join(
+        f"2024-05-{rng.randint(1, 28):02d} {rng.randint(0, 23):02d}:{rng.randint(0, 59):02d}:"
+        f"{rng.randint(0, 59):02d}.{rng.randint(0, 999999):06d} pid={rng.randint(1000, 99999)} "
+        f"req={rng.randint(10**11, 10**12)} took {rng.randint(1, 5000)}ms bytes={rng.randint(0, 10**9)}"
+        for _ in range(count)
+    )
+
+
+def _table(rng: random.Random, count: int) -> str:
+    return "\n".join(
+        " | ".join(str(rng.randint(0, 10**rng.randint(1, 16))) for _ in range(8)) for _ in range(count)
+    )
+
+
+def _prose(rng: random.Random, count: int) -> str:
+    words = ["the", "model", "returned", "a", "summary", "of", "quarterly", "results", "for", "review"]
+    return " ".join(rng.choice(words) for _ in range(count))
+
+
+def _config_dump(rng: random.Random, count: int) -> str:
+    alphabet = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789"
+    lines = []
+    for index in range(count):
+        value = rng.choice(
+            [
+                f"/var/lib/service-{index}/data",
+                f"{rng.getrandbits(128):032x}",
+                "true",
+                str(rng.randint(0, 65535)),
+                "".join(rng.choice(alphabet) for _ in range(24)).lower(),
+            ]
+        )
+        lines.append(f"  setting_{index}_name: {value}")
+    return "\n".join(lines)
+
+
+def _bench(engine: ComplianceEngine, text: str, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        engine.scan(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    rng = random.Random(0)
+    engine = ComplianceEngine(ComplianceConfig())
+    samples = {
+        "logs (2k lines)": _log_lines(rng, 2000),
+        "numeric table (2k rows)": _table(rng, 2000),
+        "prose (20k words)": _prose(rng, 20000),
+        "config dump (100k keys)": _config_dump(rng, 100_000),
+    }
+    for name, text in samples.items():
+        result = engine.scan(text)
+        print(f"{name:<26} {len(text) / 1e3:8.0f} kB {_bench(engine, text) * 1e3:8.2f} ms  risk={result.risk_score}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,30 @@
 """PromptShield public API."""
 
+from typing import Any
+
 from .engine.config import EngineConfig, Thresholds
 from .engine.scanner import PromptShieldEngine, scan_messages, scan_prompt
 from .engine.types import Message, RiskCategory
 from .engine.verdict import DetectorResult, ScanResult
 from .engine.events import SecurityError, SecurityEvent
-from .compliance.scanner import ComplianceEngine, scan_output
-from .compliance.types import ComplianceIssue, ComplianceResult, ComplianceCategory
-from .compliance.audit import AuditLogger, AuditEvent
+from .engine.dispatch import EventDispatcher, OverflowPolicy
+from .engine.sampling import SamplingPolicy, SamplingSink
+
+# compliance names are imported on first access so that importing the engine
+# (or the CLI) does not load the compliance stack
+_LAZY_EXPORTS = {
+    "ComplianceEngine": "promptshield.compliance.scanner",
+    "scan_output": "promptshield.compliance.scanner",
+    "StreamingComplianceScanner": "promptshield.compliance.streaming",
+    "RedactionMode": "promptshield.compliance.redact",
+    "redact_output": "promptshield.compliance.redact",
+    "scan_structured": "promptshield.compliance.structured",
+    "ComplianceIssue": "promptshield.compliance.types",
+    "ComplianceResult": "promptshield.compliance.types",
+    "ComplianceCategory": "promptshield.compliance.types",
+    "AuditLogger": "promptshield.compliance.audit",
+    "AuditEvent": "promptshield.compliance.audit",
+}
 
 __all__ = [
     "scan_prompt",
@@ -21,11 +38,34 @@ __all__ = [
     "DetectorResult",
     "SecurityEvent",
     "SecurityError",
+    "EventDispatcher",
+    "OverflowPolicy",
+    "SamplingPolicy",
+    "SamplingSink",
     "ComplianceEngine",
+    "StreamingComplianceScanner",
     "scan_output",
+    "redact_output",
+    "RedactionMode",
+    "scan_structured",
     "ComplianceIssue",
     "ComplianceResult",
     "ComplianceCategory",
     "AuditLogger",
     "AuditEvent",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_path = _LAZY_EXPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    value = getattr(import_module(module_path), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
@@ -0,0 +1,167 @@
+"""Streaming, ordered batch processing of line-oriented files for CLI commands."""
+
+from __future__ import annotations
+
+import math
+import mmap
+import sys
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import IO, Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, TypeVar
+
+Line = Tuple[int, bytes]
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def iter_lines(path: str) -> Iterator[Line]:
+    """Yield ``(line_number, bytes)`` for each non-blank line, reading through mmap.
+
+    Pages are mapped on demand and can be dropped by the OS again, so files
+    larger than RAM are streamed. ``-`` reads standard input instead.
+    """
+    if path == "-":
+        for number, line in enumerate(sys.stdin.buffer, start=1):
+            if line.strip():
+                yield number, line.rstrip(b"\r\n")
+        return
+    with open(path, "rb") as handle:
+        try:
+            mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty file
+            return
+        with mapped:
+            position = 0
+            number = 0
+            size = len(mapped)
+            while position < size:
+                end = mapped.find(b"\n", position)
+                if end == -1:
+                    end = size
+                number += 1
+                line = mapped[position:end]
+                position = end + 1
+                if line.strip():
+                    yield number, line.rstrip(b"\r")
+
+
+def chunked(items: Iterable[T], size: int) -> Iterator[List[T]]:
+    chunk: List[T] = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def map_ordered(
+    func: Callable[[List[T]], R],
+    chunks: Iterable[List[T]],
+    workers: int = 1,
+    initializer: Optional[Callable[..., Any]] = None,
+    initargs: Sequence[Any] = (),
+    prefetch: int = 2,
+) -> Iterator[R]:
+    """Apply ``func`` to each chunk and yield results in input order.
+
+    With more than one worker, chunks go to a process pool, whose workers
+    run ``initializer`` once (e.g. to build an engine). At most
+    ``workers * prefetch`` chunks are in flight, so memory stays bounded
+    however long the input is.
+    """
+    if workers <= 1:
+        if initializer is not None:
+            initializer(*initargs)
+        for chunk in chunks:
+            yield func(chunk)
+        return
+    with ProcessPoolExecutor(max_workers=workers, initializer=initializer, initargs=tuple(initargs)) as pool:
+        pending: Deque[Future] = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(func, chunk))
+            if len(pending) >= workers * prefetch:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+class LatencyHistogram:
+    """Latency percentiles in constant memory (log buckets, about 5% resolution)."""
+
+    _BASE = 1.05
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.max = 0.0
+        self._buckets: Dict[int, int] = {}
+
+    def add(self, seconds: float) -> None:
+        micros = max(seconds * 1_000_000, 1.0)
+        bucket = int(math.log(micros, self._BASE))
+        self._buckets[bucket] = self._buckets.get(bucket, 0) + 1
+        self.count += 1
+        self.max = max(self.max, seconds)
+
+    def percentile(self, fraction: float) -> float:
+        """Upper bound, in seconds, of the latency at ``fraction`` (0-1) of the records."""
+        if not self.count:
+            return 0.0
+        rank = fraction * self.count
+        seen = 0
+        for bucket in sorted(self._buckets):
+            seen += self._buckets[bucket]
+            if seen >= rank:
+                return min(self._BASE ** (bucket + 1) / 1_000_000, self.max)
+        return self.max
+
+
+@dataclass
+class BatchStats:
+    """Running totals for a batch run."""
+
+    records: int = 0
+    flagged: int = 0
+    errors: int = 0
+    bytes: int = 0
+    started: float = 0.0
+    latency: Optional[LatencyHistogram] = None
+
+    def __post_init__(self) -> None:
+        self.started = self.started or time.perf_counter()
+
+    def counted(self, lines: Iterable[Line]) -> Iterator[Line]:
+        """Pass ``lines`` through, adding their sizes to ``bytes``."""
+        for number, line in lines:
+            self.bytes += len(line) + 1
+            yield number, line
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    def summary(self, flagged_label: str = "blocked") -> str:
+        elapsed = max(self.elapsed, 1e-9)
+        text = (
+            f"{self.records} records, {self.flagged} {flagged_label}, {self.errors} errors "
+            f"in {elapsed:.2f}s ({self.records / elapsed:.0f} records/s, "
+            f"{self.bytes / elapsed / 1_000_000:.1f} MB/s)"
+        )
+        if self.latency is not None and self.latency.count:
+            p50, p95 = (self.latency.percentile(fraction) * 1000 for fraction in (0.5, 0.95))
+            text += f"; scan latency p50 {p50:.2f} ms, p95 {p95:.2f} ms, max {self.latency.max * 1000:.2f} ms"
+        return text
+
+
+@contextmanager
+def open_output(path: Optional[str]) -> Iterator[IO[str]]:
+    """Open ``path`` for writing, or yield stdout when it is missing or ``-``."""
+    if not path or path == "-":
+        yield sys.stdout
+        return
+    with open(path, "w", encoding="utf-8") as handle:
+        yield handle
@@ -4,14 +4,71 @@ from __future__ import annotations
 
 import json
 import sys
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
 import typer
 
-from promptshield.compliance import ComplianceEngine
+from promptshield.compliance import ComplianceEngine, ComplianceResult
+from promptshield.sdk.extract import FieldPath, compile_path
+
+from .batch import BatchStats, Line, chunked, iter_lines, map_ordered, open_output
 
 app = typer.Typer(help="Scan outputs for PII or secrets")
 
+_ENGINE: Optional[ComplianceEngine] = None
+_FIELD: Optional[FieldPath] = None
+_ID_FIELD: Optional[FieldPath] = None
+
+
+def _init_worker(field: Optional[str], id_field: Optional[str]) -> None:
+    global _ENGINE, _FIELD, _ID_FIELD
+    _ENGINE = ComplianceEngine()
+    _FIELD = compile_path(field) if field else None
+    _ID_FIELD = compile_path(id_field) if id_field else None
+
+
+def _first(path: FieldPath, payload: Any) -> Any:
+    return next(path.extract(payload), None)
+
+
+def _scan_record(number: int, line: bytes) -> Dict[str, Any]:
+    assert _ENGINE is not None
+    record: Dict[str, Any] = {"line": number}
+    if _FIELD is None:
+        value: Any = line.decode("utf-8", errors="replace")
+    else:
+        try:
+            payload = json.loads(line)
+        except ValueError:
+            record["error"] = "invalid JSON"
+            return record
+        if _ID_FIELD is not None:
+            record["id"] = _first(_ID_FIELD, payload)
+        value = _first(_FIELD, payload)
+
+    if isinstance(value, (dict, list)):
+        result = _ENGINE.scan_structured(value).result
+    elif isinstance(value, str) and value.strip():
+        result = _ENGINE.scan(value)
+    else:
+        record["error"] = "field missing or empty"
+        return record
+    record.update(_result_summary(result))
+    return record
+
+
+def _scan_chunk(chunk: List[Line]) -> List[Dict[str, Any]]:
+    return [_scan_record(number, line) for number, line in chunk]
+
+
+def _result_summary(result: ComplianceResult) -> Dict[str, Any]:
+    return {
+        "block": result.block,
+        "risk_score": result.risk_score,
+        "category": result.category,
+        "matches": [match for issue in result.issues for match in issue.matches],
+    }
+
 
 @app.command("scan")
 def scan_output(
@@ -57,3 +114,41 @@ def scan_output(
         typer.echo(f"Category: {result.category}")
         typer.echo(f"Confidence: {result.confidence:.2f}")
         typer.echo(f"Reason: {result.explanation}")
+
+
+@app.command("scan-file")
+def scan_file(
+    path: str = typer.Argument(..., help="JSONL or text file to scan ('-' for stdin)"),
+    field: Optional[str] = typer.Option(
+        "output", "--field", help="Field path holding the output, e.g. choices[0].message.content"
+    ),
+    text: bool = typer.Option(False, "--text", help="Treat each line as plain output text instead of JSON"),
+    id_field: Optional[str] = typer.Option(None, "--id-field", help="Field path copied into each result"),
+    output: Optional[str] = typer.Option(None, "--output", "-o", help="Results JSONL path (defaults to stdout)"),
+    workers: int = typer.Option(1, "--workers", min=1, help="Worker processes"),
+    chunk_size: int = typer.Option(500, "--chunk-size", min=1, help="Records per work unit"),
+    progress: int = typer.Option(100_000, "--progress-every", min=0, help="Report progress every N records (0: off)"),
+) -> None:
+    """Scan every record of a JSONL (or text) file and write one JSONL result per record, in input order."""
+    field_path = None if text else field
+    for option in (field_path, id_field):
+        if option:
+            try:
+                compile_path(option)
+            except ValueError as exc:
+                raise typer.BadParameter(str(exc)) from exc
+    stats = BatchStats()
+    chunks = chunked(stats.counted(iter_lines(path)), chunk_size)
+    results = map_ordered(
+        _scan_chunk, chunks, workers=workers, initializer=_init_worker, initargs=(field_path, id_field)
+    )
+    with open_output(output) as handle:
+        for records in results:
+            for record in records:
+                stats.records += 1
+                stats.flagged += bool(record.get("block"))
+                stats.errors += "error" in record
+                handle.write(json.dumps(record) + "\n")
+                if progress and stats.records % progress == 0:
+                    typer.echo(f"progress: {stats.summary()}", err=True)
+    typer.echo(f"done: {stats.summary()}", err=True)
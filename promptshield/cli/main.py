@@ -4,38 +4,64 @@ from __future__ import annotations
 
 import json
 import sys
-from typing import Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 try:
     import typer
+    from typer.core import TyperGroup
 except ImportError as exc:  # pragma: no cover - optional dependency
     raise ImportError(
         "PromptShield CLI requires typer. Install with: pip install promptshield[cli]"
     ) from exc
 
-from promptshield import scan_messages, scan_prompt
+from promptshield.engine.scanner import scan_messages, scan_prompt
 
-app = typer.Typer(add_completion=False)
+if TYPE_CHECKING:
+    import click
 
+# sub-command name -> (module:attribute of its Typer app, message when its extras are missing)
+LAZY_SUBCOMMANDS: Dict[str, Tuple[str, str]] = {
+    "redteam": ("promptshield.cli.redteam:app", "Red-team commands require promptshield[redteam]."),
+    "compliance": ("promptshield.cli.compliance:app", "Compliance commands require promptshield[compliance]."),
+    "modelscan": ("promptshield.cli.modelscan:app", "Model scan commands require promptshield[modelscan]."),
+}
 
-def _register_optional(app: typer.Typer, name: str, importer: str, message: str) -> None:
+
+class LazyGroup(TyperGroup):
+    """Resolve sub-command groups on first use, so only the invoked command's modules are imported."""
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        commands = super().list_commands(ctx)
+        return commands + [name for name in LAZY_SUBCOMMANDS if name not in commands]
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        command = super().get_command(ctx, cmd_name)
+        if command is None and cmd_name in LAZY_SUBCOMMANDS:
+            command = _load_subcommand(cmd_name, *LAZY_SUBCOMMANDS[cmd_name])
+            self.commands[cmd_name] = command
+        return command
+
+
+def _load_subcommand(name: str, importer: str, message: str) -> click.Command:
     try:
         module_path, attr = importer.split(":")
         module = __import__(module_path, fromlist=[attr])
-        sub_app = getattr(module, attr)
-        app.add_typer(sub_app, name=name)
+        command = typer.main.get_group(getattr(module, attr))
+        command.name = name
+        return command
     except ImportError:
+        placeholder = typer.Typer(add_completion=False)
 
-        @app.command(name)
+        @placeholder.command(name)
         def _unavailable() -> None:
             """Placeholder when optional extras are not installed."""
             typer.echo(message)
             raise typer.Exit(code=1)
 
+        return typer.main.get_command(placeholder)
 
-_register_optional(app, "redteam", "promptshield.cli.redteam:app", "Red-team commands require promptshield[redteam].")
-_register_optional(app, "compliance", "promptshield.cli.compliance:app", "Compliance commands require promptshield[compliance].")
-_register_optional(app, "modelscan", "promptshield.cli.modelscan:app", "Model scan commands require promptshield[modelscan].")
+
+app = typer.Typer(add_completion=False, cls=LazyGroup)
 
 
 def _format_result(result) -> str:
@@ -125,6 +151,36 @@ def scan(
         typer.echo(_format_result(result))
 
 
+@app.command("scan-file")
+def scan_file(
+    path: str = typer.Argument(..., help="JSONL file of prompt records ('-' for stdin)"),
+    output: Optional[str] = typer.Option(None, "--output", "-o", help="Verdicts JSONL path (defaults to stdout)"),
+    workers: int = typer.Option(1, "--workers", min=1, help="Worker processes"),
+    chunk_size: int = typer.Option(200, "--chunk-size", min=1, help="Records per work unit"),
+    progress: int = typer.Option(100_000, "--progress-every", min=0, help="Report progress every N records (0: off)"),
+) -> None:
+    """Scan JSONL records with prompt, system_prompt and/or messages; write ordered JSONL verdicts."""
+    from .batch import BatchStats, LatencyHistogram, chunked, iter_lines, map_ordered, open_output
+    from .prompts import init_worker, scan_chunk
+
+    latency = LatencyHistogram()
+    stats = BatchStats(latency=latency)
+    chunks = chunked(stats.counted(iter_lines(path)), chunk_size)
+    with open_output(output) as handle:
+        for verdicts in map_ordered(scan_chunk, chunks, workers=workers, initializer=init_worker):
+            for record, elapsed in verdicts:
+                stats.records += 1
+                stats.flagged += bool(record.get("block"))
+                if elapsed is None:
+                    stats.errors += 1
+                else:
+                    latency.add(elapsed)
+                handle.write(json.dumps(record) + "\n")
+                if progress and stats.records % progress == 0:
+                    typer.echo(f"progress: {stats.summary()}", err=True)
+    typer.echo(f"done: {stats.summary()}", err=True)
+
+
 def main() -> None:
     app()
 
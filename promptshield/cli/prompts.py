@@ -0,0 +1,78 @@
+"""Batch prompt scanning over JSONL records for the ``scan-file`` command."""
+
+from __future__ import annotations
+
+import json
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from promptshield.engine.scanner import PromptShieldEngine
+
+from .batch import Line
+
+_ENGINE: Optional[PromptShieldEngine] = None
+
+
+def init_worker() -> None:
+    """Build the worker's engine once; every record in the process shares it."""
+    global _ENGINE
+    _ENGINE = PromptShieldEngine()
+
+
+def _shape_error(payload: Dict[str, Any]) -> Optional[str]:
+    for field in ("prompt", "system_prompt"):
+        if not isinstance(payload.get(field), (str, type(None))):
+            return f"{field} must be a string"
+    messages = payload.get("messages")
+    if messages is not None and not (
+        isinstance(messages, list) and all(isinstance(message, dict) for message in messages)
+    ):
+        return "messages must be a list of objects"
+    return None
+
+
+def scan_record(number: int, line: bytes) -> Tuple[Dict[str, Any], Optional[float]]:
+    """Scan one JSONL record and return its verdict and the scan time in seconds."""
+    assert _ENGINE is not None
+    record: Dict[str, Any] = {"line": number}
+    try:
+        payload = json.loads(line)
+    except ValueError:
+        record["error"] = "invalid JSON"
+        return record, None
+    if not isinstance(payload, dict):
+        record["error"] = "record must be a JSON object"
+        return record, None
+    if "id" in payload:
+        record["id"] = payload["id"]
+    error = _shape_error(payload)
+    if error is not None:
+        record["error"] = error
+        return record, None
+
+    started = time.perf_counter()
+    try:
+        result = _ENGINE.scan(
+            prompt=payload.get("prompt"),
+            system_prompt=payload.get("system_prompt"),
+            messages=payload.get("messages"),
+        )
+    except ValueError as exc:  # missing prompt, or messages without role/content
+        record["error"] = str(exc)
+        return record, None
+    elapsed = time.perf_counter() - started
+
+    record.update(
+        {
+            "block": result.block,
+            "risk_score": result.risk_score,
+            "category": result.category,
+            "confidence": result.confidence,
+            "matches": [match for signal in result.signals for match in signal.matches],
+        }
+    )
+    return record, elapsed
+
+
+def scan_chunk(chunk: List[Line]) -> List[Tuple[Dict[str, Any], Optional[float]]]:
+    return [scan_record(number, line) for number, line in chunk]
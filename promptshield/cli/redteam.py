@@ -2,49 +2,126 @@
 
 from __future__ import annotations
 
-from typing import Optional
+from pathlib import Path
+from typing import Dict, List, Optional
 
 import typer
 
-from promptshield.redteam import load_attack_pack, run_attack_pack, write_reports
+from promptshield.redteam import (
+    AttackPack,
+    PackCache,
+    StreamingReportWriter,
+    WorkerTiming,
+    combine_packs,
+    iter_attack_pack,
+    load_attack_pack,
+    resolve_pack_paths,
+    run_attack_pack,
+    run_attack_pack_parallel,
+    write_reports,
+)
+from promptshield.redteam.parallel import TimingCollector, iter_attack_pack_chunks
 from promptshield.redteam.runner import summarize_run
 
 app = typer.Typer(help="Run red-team attack packs")
 
+_CACHE_OPTION = typer.Option(True, "--cache/--no-cache", help="Reuse parsed, validated packs that did not change")
+_CACHE_DIR_OPTION = typer.Option(None, "--cache-dir", help="Pack cache directory (default: ~/.cache/promptshield/packs)")
+
+
+def _pack_cache(enabled: bool, directory: Optional[str]) -> Optional[PackCache]:
+    return PackCache(Path(directory) if directory else None) if enabled else None
+
+
+def _resolve(pack_paths: List[str]) -> List[Path]:
+    try:
+        return resolve_pack_paths(pack_paths)
+    except FileNotFoundError as exc:
+        raise typer.BadParameter(str(exc)) from exc
+
 
 @app.command("run")
 def run_pack(
-    pack_path: str = typer.Argument(..., help="Path to attack pack YAML"),
+    pack_paths: List[str] = typer.Argument(..., help="Attack pack YAML files, directories or glob patterns"),
     threshold: int = typer.Option(70, "--threshold", help="Block threshold"),
     reports_dir: str = typer.Option("reports", "--reports-dir", help="Report output directory"),
     system_prompt: Optional[str] = typer.Option(None, "--system", help="Override system prompt"),
+    workers: int = typer.Option(1, "--workers", min=0, help="Worker processes (0: one per CPU)"),
+    cache: bool = _CACHE_OPTION,
+    cache_dir: Optional[str] = _CACHE_DIR_OPTION,
+    stream: bool = typer.Option(
+        False, "--stream", help="Write JSONL/Markdown reports incrementally (for very large runs)"
+    ),
 ) -> None:
-    """Run a red-team pack and generate reports."""
-    pack = load_attack_pack(pack_path)
-    run = run_attack_pack(pack, threshold=threshold, system_prompt=system_prompt)
+    """Run one or more red-team packs with one engine and write one combined report."""
+    pack_cache = _pack_cache(cache, cache_dir)
+    pack = combine_packs([load_attack_pack(str(path), cache=pack_cache) for path in _resolve(pack_paths)])
+    if stream:
+        _run_streaming(pack, threshold, reports_dir, system_prompt, workers)
+        return
+    timings = []
+    if workers == 1:
+        run = run_attack_pack(pack, threshold=threshold, system_prompt=system_prompt)
+    else:
+        run, timings = run_attack_pack_parallel(
+            pack, threshold=threshold, system_prompt=system_prompt, workers=workers or None
+        )
     report_paths = write_reports(run, reports_dir=reports_dir)
-    summary = summarize_run(run)
+    _echo_summary(pack, summarize_run(run), timings)
+    typer.echo("Reports:")
+    typer.echo(f"- JSON: {report_paths.json_path}")
+    typer.echo(f"- Markdown: {report_paths.markdown_path}")
+    typer.echo(f"- Repro script: {report_paths.repro_script_path}")
 
+
+def _run_streaming(
+    pack: AttackPack,
+    threshold: int,
+    reports_dir: str,
+    system_prompt: Optional[str],
+    workers: int,
+) -> None:
+    collector = TimingCollector()
+    with StreamingReportWriter(pack, threshold=threshold, reports_dir=reports_dir) as writer:
+        if workers == 1:
+            for outcome in iter_attack_pack(pack, threshold=threshold, system_prompt=system_prompt):
+                writer.add(outcome)
+        else:
+            chunks = iter_attack_pack_chunks(pack, threshold, system_prompt, workers=workers or None)
+            for outcomes, pid, seconds in chunks:
+                collector.add(outcomes, pid, seconds)
+                for outcome in outcomes:
+                    writer.add(outcome)
+    _echo_summary(pack, writer.summary.as_dict(), collector.timings())
+    typer.echo("Reports:")
+    typer.echo(f"- JSONL: {writer.paths.jsonl_path}")
+    typer.echo(f"- Summary: {writer.paths.summary_path}")
+    typer.echo(f"- Markdown: {writer.paths.markdown_path}")
+    typer.echo(f"- Repro script: {writer.paths.repro_script_path}")
+
+
+def _echo_summary(pack: AttackPack, summary: Dict[str, object], timings: List[WorkerTiming]) -> None:
     typer.echo(f"Pack: {pack.name} ({pack.version})")
     typer.echo(f"Total: {summary['total']}")
     typer.echo(f"Blocked: {summary['blocked']}")
     typer.echo(f"Allowed: {summary['allowed']}")
     typer.echo(f"Expected mismatches: {summary['expected_mismatches']}")
-    typer.echo("Reports:")
-    typer.echo(f"- JSON: {report_paths.json_path}")
-    typer.echo(f"- Markdown: {report_paths.markdown_path}")
-    typer.echo(f"- Repro script: {report_paths.repro_script_path}")
+    for timing in timings:
+        typer.echo(f"Worker {timing.pid}: {timing.cases} cases in {timing.seconds:.2f}s")
 
 
 @app.command("lint")
 def lint_pack(
-    pack_paths: list[str] = typer.Argument(..., help="Attack pack YAML files to validate"),
+    pack_paths: list[str] = typer.Argument(..., help="Attack pack YAML files, directories or glob patterns"),
+    cache: bool = _CACHE_OPTION,
+    cache_dir: Optional[str] = _CACHE_DIR_OPTION,
 ) -> None:
     """Validate attack packs against the schema."""
+    pack_cache = _pack_cache(cache, cache_dir)
     failed = False
-    for pack_path in pack_paths:
+    for pack_path in _resolve(pack_paths):
         try:
-            load_attack_pack(pack_path)
+            load_attack_pack(str(pack_path), cache=pack_cache)
             typer.echo(f"{pack_path}: OK")
         except Exception as exc:
             failed = True
@@ -1,18 +1,41 @@
 """Compliance scanning utilities."""
 
-from .audit import AuditLogger, AuditEvent
+from .audit import AuditLogger, AuditEvent, FsyncPolicy, merge_audit_logs, worker_log_path
+from .rotation import RotationPolicy, find_segments
 from .config import ComplianceConfig, ComplianceThresholds
+from .store import SQLiteAuditStore
+from .registry import ComplianceDetectorSpec, resolve_compliance_detectors
 from .scanner import ComplianceEngine, scan_output
+from .streaming import StreamingComplianceScanner
+from .redact import RedactionMode, RedactionResult, RedactionSpan, redact_output
+from .structured import StructuredHit, StructuredScanResult, iter_string_leaves, scan_structured
 from .types import ComplianceIssue, ComplianceResult, ComplianceCategory
 
 __all__ = [
     "AuditLogger",
     "AuditEvent",
+    "FsyncPolicy",
+    "merge_audit_logs",
+    "worker_log_path",
+    "RotationPolicy",
+    "find_segments",
+    "SQLiteAuditStore",
     "ComplianceConfig",
     "ComplianceThresholds",
     "ComplianceEngine",
+    "ComplianceDetectorSpec",
+    "resolve_compliance_detectors",
+    "StreamingComplianceScanner",
     "ComplianceIssue",
     "ComplianceResult",
     "ComplianceCategory",
     "scan_output",
+    "RedactionMode",
+    "RedactionResult",
+    "RedactionSpan",
+    "redact_output",
+    "StructuredHit",
+    "StructuredScanResult",
+    "iter_string_leaves",
+    "scan_structured",
 ]
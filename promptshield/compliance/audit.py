@@ -2,14 +2,36 @@
 
 from __future__ import annotations
 
+import atexit
+import heapq
 import json
-from dataclasses import asdict, dataclass, field
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, IO, Iterable, Iterator, List, Optional, Tuple
 
 from promptshield.engine.events import SecurityEvent
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    fcntl = None  # type: ignore[assignment]
+
+from .rotation import RotationPolicy, SegmentRotator, first_timestamp
+
+logger = logging.getLogger(__name__)
+
+
+class FsyncPolicy(str, Enum):
+    NEVER = "never"
+    INTERVAL = "interval"
+    BATCH = "batch"
+
 
 @dataclass(frozen=True)
 class AuditEvent:
@@ -19,25 +41,106 @@ class AuditEvent:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
+def _to_audit_event(event: SecurityEvent) -> AuditEvent:
+    return AuditEvent(
+        event_type=event.event_type,
+        timestamp=event.timestamp.isoformat(),
+        message=event.message,
+        metadata=event.metadata,
+    )
+
+
+@dataclass
+class _SegmentState:
+    start: Optional[str]
+    size: int
+    end: Optional[str] = None
+
+
+def _serialize(event: AuditEvent) -> str:
+    return json.dumps(
+        {
+            "event_type": event.event_type,
+            "timestamp": event.timestamp,
+            "message": event.message,
+            "metadata": event.metadata,
+        }
+    ) + "\n"
+
+
 class AuditLogger:
-    """Write audit events to a JSONL file."""
+    """Write audit events to a JSONL file.
 
-    def __init__(self, path: str = "audit.log.jsonl") -> None:
+    With ``buffered=True`` the file handle stays open and a background thread
+    writes queued lines in batches of ``batch_size`` or every ``flush_interval``
+    seconds, whichever comes first. Pending lines are flushed at exit.
+
+    Passing a ``rotation`` policy rotates the log by size and/or age; rotated
+    segments are gzip-compressed in the background and listed, with their time
+    range, in ``<path>.manifest.json``.
+
+    With ``multiprocess=True`` several processes may share one path: lines are
+    appended through an ``O_APPEND`` descriptor in single ``write`` calls of at
+    most ``max_write_bytes`` (whole lines only), each under an advisory lock.
+    """
+
+    def __init__(
+        self,
+        path: str = "audit.log.jsonl",
+        buffered: bool = False,
+        batch_size: int = 512,
+        flush_interval: float = 1.0,
+        fsync: FsyncPolicy | str = FsyncPolicy.NEVER,
+        fsync_interval: float = 5.0,
+        rotation: Optional[RotationPolicy] = None,
+        multiprocess: bool = False,
+        max_write_bytes: int = 64 * 1024,
+    ) -> None:
         self.path = Path(path)
         self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.buffered = buffered
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.fsync = FsyncPolicy(fsync)
+        self.fsync_interval = fsync_interval
+        self.rotation = rotation or RotationPolicy()
+        self.rotator = SegmentRotator(self.path, self.rotation) if self.rotation.enabled else None
+        self.multiprocess = multiprocess
+        self.max_write_bytes = max(1, max_write_bytes)
+        if multiprocess and self.rotator is not None:
+            raise ValueError("rotation is not supported on a shared multiprocess log; use worker_log_path()")
+
+        self._lock = threading.Lock()
+        # batches are taken and written under one lock, so they reach the file in order;
+        # re-entrant because ``_write`` takes it too
+        self._write_lock = threading.RLock()
+        self._wakeup = threading.Condition(self._lock)
+        self._pending: List[Tuple[str, str]] = []
+        self._handle: Optional[IO[Any]] = None
+        self._last_fsync = time.monotonic()
+        self._unsynced = False
+        self._closed = False
+        self._writer: Optional[threading.Thread] = None
+        self._segment: Optional[_SegmentState] = None
+
+        if buffered:
+            self._writer = threading.Thread(target=self._run, name="promptshield-audit", daemon=True)
+            self._writer.start()
+            atexit.register(self.close)
 
     def log_event(self, event: AuditEvent) -> None:
-        with self.path.open("a", encoding="utf-8") as handle:
-            handle.write(json.dumps(asdict(event)) + "\n")
+        self._append([(event.timestamp, _serialize(event))])
+
+    def log_events(self, events: Iterable[AuditEvent]) -> None:
+        records = [(event.timestamp, _serialize(event)) for event in events]
+        if records:
+            self._append(records)
 
     def log_security_event(self, event: SecurityEvent) -> None:
-        audit_event = AuditEvent(
-            event_type=event.event_type,
-            timestamp=event.timestamp.isoformat(),
-            message=event.message,
-            metadata=event.metadata,
-        )
-        self.log_event(audit_event)
+        self.log_event(_to_audit_event(event))
+
+    def log_security_events(self, events: Iterable[SecurityEvent]) -> None:
+        self.log_events(_to_audit_event(event) for event in events)
 
     def log_custom(self, event_type: str, message: str, metadata: Optional[Dict[str, Any]] = None) -> None:
         event = AuditEvent(
@@ -47,3 +150,208 @@ class AuditLogger:
             metadata=metadata or {},
         )
         self.log_event(event)
+
+    def flush(self) -> None:
+        """Write any buffered lines to disk."""
+        if not self.buffered:
+            return
+        with self._write_lock:
+            with self._lock:
+                records, self._pending = self._pending, []
+            self._write(records, force_fsync=self.fsync is not FsyncPolicy.NEVER)
+
+    def close(self) -> None:
+        """Flush buffered lines, release the file handle and finish pending rotations."""
+        if self.buffered:
+            with self._lock:
+                if self._closed:
+                    return
+                self._closed = True
+                self._wakeup.notify_all()
+            if self._writer is not None:
+                self._writer.join()
+            self.flush()
+            with self._write_lock:
+                self._close_handle()
+            atexit.unregister(self.close)
+        if self.rotator is not None:
+            self.rotator.wait()
+
+    def rotate(self) -> Optional[Path]:
+        """Rotate the active log now; returns the new segment path, if any."""
+        if self.rotator is None:
+            raise RuntimeError("AuditLogger was created without a rotation policy")
+        self.flush()
+        with self._write_lock:
+            return self._rotate()
+
+    def _append(self, records: List[Tuple[str, str]]) -> None:
+        if self.buffered:
+            with self._lock:
+                if not self._closed:
+                    self._pending.extend(records)
+                    if len(self._pending) >= self.batch_size:
+                        self._wakeup.notify()
+                    return
+        self._write(records)
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                if len(self._pending) < self.batch_size and not self._closed:
+                    self._wakeup.wait(self.flush_interval)
+                closed = self._closed
+            with self._write_lock:
+                with self._lock:
+                    records, self._pending = self._pending, []
+                try:
+                    self._write(records)
+                except Exception as exc:  # pragma: no cover - defensive
+                    logger.warning("Dropped %d audit events after a write failure: %s", len(records), exc)
+            if closed:
+                return
+
+    def _write(self, records: List[Tuple[str, str]], force_fsync: bool = False) -> None:
+        with self._write_lock:
+            if records:
+                if self.rotator is None:
+                    self._write_data("".join(line for _, line in records))
+                else:
+                    for data in self._split_segments(records):
+                        self._write_data(data)
+            if self._handle is not None and self._unsynced and self._should_fsync(bool(records), force_fsync):
+                os.fsync(self._handle.fileno())
+                self._last_fsync = time.monotonic()
+                self._unsynced = False
+            if not self.buffered:
+                self._close_handle(sync=False)
+
+    def _write_data(self, data: str) -> None:
+        if self.multiprocess:
+            if self._handle is None:
+                self._handle = self.path.open("ab", buffering=0)
+            self._write_atomic(data.encode("utf-8"))
+        else:
+            if self._handle is None:
+                self._handle = self.path.open("a", encoding="utf-8")
+            self._handle.write(data)
+            self._handle.flush()
+        self._unsynced = True
+
+    def _write_atomic(self, payload: bytes) -> None:
+        assert self._handle is not None
+        fd = self._handle.fileno()
+        for chunk in _line_chunks(payload, self.max_write_bytes):
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+            try:
+                view = memoryview(chunk)
+                while view:
+                    view = view[os.write(fd, view) :]
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(fd, fcntl.LOCK_UN)
+
+    def _split_segments(self, records: List[Tuple[str, str]]) -> Iterator[str]:
+        """Yield chunks of ``records``, rotating the log between chunks as the policy requires."""
+        assert self.rotator is not None
+        if self._segment is None:
+            size = self.path.stat().st_size if self.path.exists() else 0
+            self._segment = _SegmentState(start=first_timestamp(self.path) if size else None, size=size)
+        chunk: List[str] = []
+        for timestamp, line in records:
+            incoming = len(line.encode("utf-8"))
+            if self.rotator.should_rotate(self._segment.size, incoming, self._segment.start):
+                if chunk:
+                    yield "".join(chunk)
+                    chunk = []
+                self._rotate()
+            segment = self._segment
+            segment.start = min(segment.start, timestamp) if segment.start else timestamp
+            segment.end = max(segment.end, timestamp) if segment.end else timestamp
+            segment.size += incoming
+            chunk.append(line)
+        if chunk:
+            yield "".join(chunk)
+
+    def _rotate(self) -> Optional[Path]:
+        assert self.rotator is not None
+        self._close_handle()
+        segment = self._segment or _SegmentState(start=first_timestamp(self.path), size=0)
+        rotated = self.rotator.rotate(start=segment.start, end=segment.end)
+        self._segment = _SegmentState(start=None, size=0)
+        return rotated
+
+    def _close_handle(self, sync: bool = True) -> None:
+        if self._handle is None:
+            return
+        if sync and self._unsynced and self.fsync is not FsyncPolicy.NEVER:
+            os.fsync(self._handle.fileno())
+        self._unsynced = False
+        self._handle.close()
+        self._handle = None
+
+    def _should_fsync(self, wrote: bool, force: bool) -> bool:
+        if self.fsync is FsyncPolicy.NEVER:
+            return False
+        if force:
+            return True
+        if self.fsync is FsyncPolicy.BATCH:
+            return wrote
+        return time.monotonic() - self._last_fsync >= self.fsync_interval
+
+
+def _line_chunks(payload: bytes, limit: int) -> Iterator[bytes]:
+    """Split newline-terminated ``payload`` into whole-line chunks of at most ``limit`` bytes.
+
+    A single line longer than ``limit`` is yielded on its own.
+    """
+    start = 0
+    end = len(payload)
+    while start < end:
+        if end - start <= limit:
+            yield payload[start:]
+            return
+        cut = payload.rfind(b"\n", start, start + limit)
+        if cut < 0:
+            cut = payload.find(b"\n", start + limit)
+            if cut < 0:
+                cut = end - 1
+        yield payload[start : cut + 1]
+        start = cut + 1
+
+
+def worker_log_path(path: str, worker_id: Optional[str] = None) -> str:
+    """Return a per-worker log path such as ``audit.log.jsonl.<pid>``."""
+    return f"{path}.{worker_id or os.getpid()}"
+
+
+def merge_audit_logs(paths: Iterable[str], output: str) -> int:
+    """Merge per-worker JSONL logs into ``output`` ordered by timestamp; returns the line count.
+
+    Each input is expected to be sorted by timestamp already (as written by one
+    worker), so the merge streams with one open handle per input.
+    """
+    handles = [Path(path).open("r", encoding="utf-8") for path in paths]
+    try:
+        streams = [_timestamped_lines(handle) for handle in handles]
+        count = 0
+        with Path(output).open("w", encoding="utf-8") as target:
+            for _, line in heapq.merge(*streams, key=lambda item: item[0]):
+                target.write(line)
+                count += 1
+        return count
+    finally:
+        for handle in handles:
+            handle.close()
+
+
+def _timestamped_lines(handle: IO[str]) -> Iterator[Tuple[str, str]]:
+    for line in handle:
+        if not line.strip():
+            continue
+        try:
+            timestamp = str(json.loads(line).get("timestamp", ""))
+        except (ValueError, AttributeError):
+            timestamp = ""
+        yield timestamp, line if line.endswith("\n") else line + "\n"
@@ -33,6 +33,7 @@ class ComplianceConfig:
     thresholds: ComplianceThresholds = field(default_factory=ComplianceThresholds)
     boost_threshold: float = 0.9
     event_sink: Optional[EventSink] = None
+    short_circuit: bool = False
 
     @classmethod
     def from_env(cls) -> "ComplianceConfig":
@@ -43,8 +44,14 @@ class ComplianceConfig:
 
         weights = _apply_weight_env_overrides(weights)
         thresholds = _apply_threshold_env_overrides(thresholds)
-
-        return cls(weights=weights, thresholds=thresholds, boost_threshold=boost_threshold)
+        short_circuit = os.getenv("PROMPTSHIELD_COMPLIANCE_SHORT_CIRCUIT", "").lower() in ("1", "true", "yes")
+
+        return cls(
+            weights=weights,
+            thresholds=thresholds,
+            boost_threshold=boost_threshold,
+            short_circuit=short_circuit,
+        )
 
 
 def _get_env_float(name: str, default: float) -> float:
@@ -0,0 +1,135 @@
+"""Entropy and character-class scoring for generic secret tokens."""
+
+from __future__ import annotations
+
+import math
+import re
+from collections import Counter
+from typing import List, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None  # type: ignore[assignment]
+
+TOKEN_CHARS = r"A-Za-z0-9+/=_.\-"
+TOKEN_PATTERN = rf"(?<![{TOKEN_CHARS}])[{TOKEN_CHARS}]{{20,}}(?![{TOKEN_CHARS}])"
+
+MIN_LENGTH = 20
+MAX_LENGTH = 512
+MAX_ENTROPY_THRESHOLD = 4.5
+PREFIXED_ENTROPY_THRESHOLD = 3.0
+MIN_CLASS_TRANSITIONS = 0.35
+BATCH_SIZE = 4096
+
+KNOWN_PREFIXES = (
+    "sk_live_",
+    "rk_live_",
+    "pk_live_",
+    "github_pat_",
+    "gho_",
+    "ghu_",
+    "ghs_",
+    "glpat-",
+    "xapp-",
+    "AIza",
+    "ya29.",
+    "SG.",
+)
+# a vendor token may follow ``=``, ``/`` or ``.`` (``key=sk_live_...``)
+VENDOR_TOKEN_PATTERN = (
+    rf"(?<![A-Za-z0-9_\-])(?:{'|'.join(map(re.escape, KNOWN_PREFIXES))})[{TOKEN_CHARS}]+(?![{TOKEN_CHARS}])"
+)
+
+
+def shannon_entropy(token: str) -> float:
+    """Bits per character of ``token``."""
+    length = len(token)
+    return -sum(count / length * math.log2(count / length) for count in Counter(token).values())
+
+
+def _char_class(char: str) -> int:
+    if char.isupper():
+        return 0
+    if char.islower():
+        return 1
+    if char.isdigit():
+        return 2
+    return 3
+
+
+def class_transitions(token: str) -> float:
+    """Fraction of adjacent characters that switch class (upper/lower/digit/symbol)."""
+    classes = [_char_class(char) for char in token]
+    return sum(left != right for left, right in zip(classes, classes[1:])) / max(1, len(token) - 1)
+
+
+def entropy_threshold(length: int) -> float:
+    # random base62 approaches log2(length) bits for short tokens
+    return min(MAX_ENTROPY_THRESHOLD, 0.85 * math.log2(length))
+
+
+def looks_like_secret(token: str) -> bool:
+    """Whether a token looks like a generated credential rather than a word, path or hash.
+
+    Tokens with a known vendor prefix only need moderate entropy. Others need
+    upper case, lower case and at least two digits (which rules out hex hashes
+    and UUIDs), frequent character-class switches (unlike camelCase names) and
+    entropy close to that of random text of the same length.
+    """
+    length = len(token)
+    if not MIN_LENGTH <= length <= MAX_LENGTH:
+        return False
+    if token.startswith(KNOWN_PREFIXES):
+        return shannon_entropy(token) >= PREFIXED_ENTROPY_THRESHOLD
+    digits = sum(char.isdigit() for char in token)
+    if digits < 2 or not (any(char.isupper() for char in token) and any(char.islower() for char in token)):
+        return False
+    if class_transitions(token) < MIN_CLASS_TRANSITIONS:
+        return False
+    return shannon_entropy(token) >= entropy_threshold(length)
+
+
+def looks_like_secret_batch(tokens: Sequence[str]) -> List[bool]:
+    """Vectorized :func:`looks_like_secret` over many tokens (NumPy when installed)."""
+    if np is None:
+        return [looks_like_secret(token) for token in tokens]
+    results: List[bool] = []
+    for offset in range(0, len(tokens), BATCH_SIZE):
+        results.extend(_score_batch(tokens[offset : offset + BATCH_SIZE]))
+    return results
+
+
+if np is not None:
+    _CLASS_TABLE = np.array([_char_class(chr(code)) for code in range(128)], dtype=np.uint8)
+
+
+def _score_batch(tokens: Sequence[str]) -> List[bool]:
+    lengths = np.fromiter((len(token) for token in tokens), dtype=np.int64, count=len(tokens))
+    data = np.frombuffer("".join(tokens).encode("ascii"), dtype=np.uint8)
+    rows = np.repeat(np.arange(len(tokens), dtype=np.int64), lengths)
+    counts = np.bincount(rows * 128 + data, minlength=len(tokens) * 128).reshape(len(tokens), 128)
+
+    probabilities = counts / lengths[:, None]
+    logs = np.log2(probabilities, out=np.zeros_like(probabilities), where=counts > 0)
+    entropy = -(probabilities * logs).sum(axis=1)
+
+    upper = counts[:, 65:91].sum(axis=1)
+    lower = counts[:, 97:123].sum(axis=1)
+    digits = counts[:, 48:58].sum(axis=1)
+    classes = _CLASS_TABLE[data]
+    changes = np.empty(len(data), dtype=np.int64)
+    changes[0] = 0
+    changes[1:] = classes[1:] != classes[:-1]
+    starts = np.cumsum(lengths) - lengths
+    changes[starts] = 0
+    transitions = np.add.reduceat(changes, starts) / np.maximum(1, lengths - 1)
+
+    thresholds = np.minimum(MAX_ENTROPY_THRESHOLD, 0.85 * np.log2(lengths))
+    prefixed = np.fromiter((token.startswith(KNOWN_PREFIXES) for token in tokens), dtype=bool, count=len(tokens))
+
+    in_range = (lengths >= MIN_LENGTH) & (lengths <= MAX_LENGTH)
+    generic = (upper > 0) & (lower > 0) & (digits >= 2) & (transitions >= MIN_CLASS_TRANSITIONS)
+    generic &= entropy >= thresholds
+    known = prefixed & (entropy >= PREFIXED_ENTROPY_THRESHOLD)
+    return (in_range & np.where(prefixed, known, generic)).tolist()
@@ -0,0 +1,79 @@
+"""Matching of all compliance rules against one shared view of a text."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .patterns import PatternRule, PatternSet, ScanText, pii_patterns, prefilter, rule_matches, secret_patterns
+from .types import ComplianceCategory
+
+Hits = Dict[str, Tuple[List[str], List[str]]]
+
+
+@dataclass(frozen=True)
+class _Entry:
+    category: str
+    critical: bool
+
+
+class CombinedMatcher:
+    """Match the rules of several categories against a text.
+
+    The text's derived views (lower-cased copy, digit count) are computed
+    once and the prefilters run over every rule together, so only rules with
+    a chance of matching are tried. Each of those still runs its own regex;
+    this is not one combined regex. Anchored rules are tried at the
+    occurrences of their anchor only. :meth:`hits` returns, per category, the
+    names of the critical and soft rules that matched, in rule order, exactly
+    as ``find_matches`` would. :meth:`category_hits` matches one category
+    only, reusing the prefilter results stored on the view.
+    """
+
+    def __init__(self, groups: Sequence[Tuple[str, PatternSet]]) -> None:
+        self.categories = tuple(category for category, _ in groups)
+        self._rules: Tuple[PatternRule, ...] = ()
+        entries: List[_Entry] = []
+        for category, patterns in groups:
+            for critical, rules in ((True, patterns.critical), (False, patterns.soft)):
+                self._rules += tuple(rules)
+                entries.extend(_Entry(category=category, critical=critical) for _ in rules)
+        self._entries = dict(zip(map(id, self._rules), entries))
+
+    def hits(self, text: str) -> Hits:
+        view = ScanText(text)
+        return {category: self.category_hits(view, category) for category in self.categories}
+
+    def category_hits(self, view: ScanText, category: str) -> Tuple[List[str], List[str]]:
+        """Names of the critical and soft rules of ``category`` that match ``view``."""
+        critical: List[str] = []
+        soft: List[str] = []
+        for rule in self._candidates(view).get(category, ()):
+            if rule_matches(rule, view.text, view):
+                (critical if self._entries[id(rule)].critical else soft).append(rule.name)
+        return critical, soft
+
+    def _candidates(self, view: ScanText) -> Dict[str, List[PatternRule]]:
+        candidates = view.memo.get(self)
+        if candidates is None:
+            candidates = {}
+            for rule in prefilter(view, self._rules):
+                candidates.setdefault(self._entries[id(rule)].category, []).append(rule)
+            view.memo[self] = candidates
+        return candidates
+
+
+@lru_cache(maxsize=None)
+def default_matcher() -> CombinedMatcher:
+    return CombinedMatcher(
+        (
+            (ComplianceCategory.PII.value, pii_patterns()),
+            (ComplianceCategory.SECRETS.value, secret_patterns()),
+        )
+    )
+
+
+def match_output(text: str, matcher: Optional[CombinedMatcher] = None) -> Hits:
+    """Return ``{category: (critical rule names, soft rule names)}`` for ``text``."""
+    return (matcher or default_matcher()).hits(text)
@@ -5,13 +5,51 @@ from __future__ import annotations
 import re
 from dataclasses import dataclass
 from functools import lru_cache
-from typing import Iterable, List, Pattern, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Pattern, Tuple
+
+from .entropy import (
+    KNOWN_PREFIXES,
+    TOKEN_CHARS,
+    TOKEN_PATTERN,
+    VENDOR_TOKEN_PATTERN,
+    looks_like_secret,
+    looks_like_secret_batch,
+)
+from .validators import digit_count, luhn_valid, phone_plausible, ssn_valid
 
 
 @dataclass(frozen=True)
 class PatternRule:
+    """A named regex, optionally with cheap prefilters and a match validator.
+
+    A rule is skipped without running the regex when the text has fewer than
+    ``min_digits`` ASCII digits or contains none of ``literals`` (compared
+    case-insensitively for ``re.IGNORECASE`` rules, so give them in lower
+    case). When every match starts with the literal ``anchor`` the regex is
+    only tried at occurrences of it (found with ``str.find``) instead of
+    being searched across the whole text. With a ``validator`` a rule only
+    matches where the matched text validates; ``batch_validator`` is an
+    equivalent that checks many candidates at once.
+
+    ``max_length`` is the longest possible match, ``None`` when unbounded or
+    unknown. An unbounded rule may name in ``charset`` (the body of a
+    character class, read with the rule's flags) every character a match can
+    contain; incremental scanners use both to decide how much text to keep.
+    """
+
     name: str
     regex: Pattern[str]
+    validator: Optional[Callable[[str], bool]] = None
+    batch_validator: Optional[Callable[[List[str]], List[bool]]] = None
+    min_digits: int = 0
+    literals: Tuple[str, ...] = ()
+    anchor: Optional[str] = None
+    max_length: Optional[int] = None
+    charset: Optional[str] = None
+
+    @property
+    def required(self) -> Tuple[str, ...]:
+        return self.literals or ((self.anchor,) if self.anchor else ())
 
 
 @dataclass(frozen=True)
@@ -20,21 +58,34 @@ class PatternSet:
     soft: Tuple[PatternRule, ...]
 
 
-def _compile(name: str, pattern: str, flags: int = 0) -> PatternRule:
-    return PatternRule(name=name, regex=re.compile(pattern, flags))
+def _compile(name: str, pattern: str, flags: int = 0, **options) -> PatternRule:
+    return PatternRule(name=name, regex=re.compile(pattern, flags), **options)
 
 
 @lru_cache(maxsize=None)
 def pii_patterns() -> PatternSet:
     critical = (
-        _compile("email", r"[A-Z0-9._%+-]+@[A-Z0-9.-]+\.[A-Z]{2,}", re.IGNORECASE),
-        _compile("ssn", r"\b\d{3}-\d{2}-\d{4}\b"),
-        _compile("phone", r"\b\+?\d{1,2}?[-.\s]?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}\b"),
-        _compile("credit_card", r"\b(?:\d[ -]*?){13,16}\b"),
+        _compile(
+            "email",
+            r"[A-Z0-9._%+-]+@[A-Z0-9.-]+\.[A-Z]{2,}",
+            re.IGNORECASE,
+            literals=("@",),
+            charset="A-Z0-9._%+@-",
+        ),
+        _compile("ssn", r"\b\d{3}-\d{2}-\d{4}\b", validator=ssn_valid, min_digits=9, literals=("-",), max_length=11),
+        _compile(
+            "phone",
+            # E.164 with any grouping, or NANP with an optional +1/1 country code
+            r"(?<![\w+])(?:\+\d{1,3}(?:[-.\s]?\d{1,4}){2,5}|(?:\+?1[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4})\b",
+            validator=phone_plausible,
+            min_digits=10,
+            max_length=29,
+        ),
+        _compile("credit_card", r"\b\d(?:[ -]?\d){12,15}\b", validator=luhn_valid, min_digits=13, max_length=31),
     )
     soft = (
-        _compile("address_hint", r"\baddress\b", re.IGNORECASE),
-        _compile("dob_hint", r"\bdate of birth\b", re.IGNORECASE),
+        _compile("address_hint", r"\baddress\b", re.IGNORECASE, anchor="address", max_length=7),
+        _compile("dob_hint", r"\bdate of birth\b", re.IGNORECASE, anchor="date of birth", max_length=13),
     )
     return PatternSet(critical=critical, soft=soft)
 
@@ -42,18 +93,160 @@ def pii_patterns() -> PatternSet:
 @lru_cache(maxsize=None)
 def secret_patterns() -> PatternSet:
     critical = (
-        _compile("aws_access_key", r"\bAKIA[0-9A-Z]{16}\b"),
-        _compile("github_token", r"\bghp_[A-Za-z0-9]{36}\b"),
-        _compile("slack_token", r"\bxox[baprs]-[A-Za-z0-9-]{10,}\b"),
-        _compile("openai_key", r"\bsk-[A-Za-z0-9]{20,}\b"),
+        _compile("aws_access_key", r"\bAKIA[0-9A-Z]{16}\b", anchor="AKIA", max_length=20),
+        _compile("github_token", r"\bghp_[A-Za-z0-9]{36}\b", anchor="ghp_", max_length=40),
+        _compile("slack_token", r"\bxox[baprs]-[A-Za-z0-9-]{10,}\b", anchor="xox", charset="A-Za-z0-9-"),
+        _compile("openai_key", r"\bsk-[A-Za-z0-9]{20,}\b", anchor="sk-", charset="A-Za-z0-9-"),
+        _compile(
+            "private_key",
+            r"-----BEGIN (?:RSA |EC |DSA |OPENSSH |ENCRYPTED )?PRIVATE KEY-----",
+            literals=("PRIVATE KEY",),
+            anchor="-----BEGIN ",
+            max_length=37,
+        ),
+        _compile(
+            "jwt",
+            r"\beyJ[A-Za-z0-9_-]{10,}\.eyJ[A-Za-z0-9_-]{10,}\.[A-Za-z0-9_-]{10,}",
+            anchor="eyJ",
+            charset="A-Za-z0-9_.-",
+        ),
+        _compile(
+            "vendor_token",
+            VENDOR_TOKEN_PATTERN,
+            validator=looks_like_secret,
+            batch_validator=looks_like_secret_batch,
+            literals=KNOWN_PREFIXES,
+            charset=TOKEN_CHARS,
+        ),
     )
     soft = (
-        _compile("api_key_phrase", r"\bapi key\b", re.IGNORECASE),
-        _compile("secret_phrase", r"\bsecret\b", re.IGNORECASE),
-        _compile("token_phrase", r"\baccess token\b", re.IGNORECASE),
+        _compile("api_key_phrase", r"\bapi key\b", re.IGNORECASE, anchor="api key", max_length=7),
+        _compile("secret_phrase", r"\bsecret\b", re.IGNORECASE, anchor="secret", max_length=6),
+        _compile("token_phrase", r"\baccess token\b", re.IGNORECASE, anchor="access token", max_length=12),
+        # random-looking text is just as often base64 data, so it only hints
+        _compile(
+            "high_entropy_token",
+            TOKEN_PATTERN,
+            validator=looks_like_secret,
+            batch_validator=looks_like_secret_batch,
+            charset=TOKEN_CHARS,
+        ),
     )
     return PatternSet(critical=critical, soft=soft)
 
 
-def find_matches(text: str, rules: Iterable[PatternRule]) -> List[str]:
-    return [rule.name for rule in rules if rule.regex.search(text)]
+class ScanText:
+    """A text plus derived views (lower-cased copy, digit count) shared by all rules.
+
+    ``memo`` holds other per-text results that several detectors share.
+    """
+
+    __slots__ = ("text", "memo", "_lowered", "_digits")
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self.memo: Dict[Any, Any] = {}
+        self._lowered: Optional[str] = None
+        self._digits: Optional[int] = None
+
+    @property
+    def lowered(self) -> str:
+        if self._lowered is None:
+            self._lowered = self.text.lower()
+        return self._lowered
+
+    @property
+    def digits(self) -> int:
+        if self._digits is None:
+            self._digits = digit_count(self.text)
+        return self._digits
+
+    def haystack(self, rule: PatternRule) -> str:
+        """The text to look for ``rule``'s literals in."""
+        return self.lowered if rule.regex.flags & re.IGNORECASE else self.text
+
+
+def rule_matches(rule: PatternRule, text: str, view: Optional[ScanText] = None) -> bool:
+    """Return whether ``rule`` matches anywhere in ``text``, honouring its validator."""
+    if rule.batch_validator is not None:
+        return _batch_matches(rule, text)
+    if rule.anchor is not None:
+        haystack = (view or ScanText(text)).haystack(rule)
+        # lower-casing can change the length of some non-ASCII text
+        if len(haystack) == len(text):
+            return _anchored_matches(rule, text, haystack)
+    match = rule.regex.search(text)
+    if rule.validator is None:
+        return match is not None
+    while match is not None:
+        if rule.validator(match.group()):
+            return True
+        # a rejected candidate may overlap a valid one that starts later
+        match = rule.regex.search(text, match.start() + 1)
+    return False
+
+
+def _anchored_matches(rule: PatternRule, text: str, haystack: str) -> bool:
+    assert rule.anchor is not None
+    position = haystack.find(rule.anchor)
+    while position != -1:
+        match = rule.regex.match(text, position)
+        if match is not None and (rule.validator is None or rule.validator(match.group())):
+            return True
+        position = haystack.find(rule.anchor, position + 1)
+    return False
+
+
+def _batch_matches(rule: PatternRule, text: str, batch_size: int = 1024) -> bool:
+    assert rule.batch_validator is not None
+    batch: List[str] = []
+    for match in rule.regex.finditer(text):
+        batch.append(match.group())
+        if len(batch) == batch_size:
+            if any(rule.batch_validator(batch)):
+                return True
+            batch = []
+    return bool(batch) and any(rule.batch_validator(batch))
+
+
+def rule_spans(rule: PatternRule, text: str) -> List[Tuple[int, int]]:
+    """Return the ``(start, end)`` of every validated, non-overlapping match of ``rule`` in ``text``."""
+    if rule.batch_validator is not None:
+        matches = list(rule.regex.finditer(text))
+        spans: List[Tuple[int, int]] = []
+        for offset in range(0, len(matches), 1024):
+            batch = matches[offset : offset + 1024]
+            valid = rule.batch_validator([match.group() for match in batch])
+            spans.extend(match.span() for match, ok in zip(batch, valid) if ok)
+        return spans
+    spans = []
+    match = rule.regex.search(text)
+    while match is not None:
+        start, end = match.span()
+        if rule.validator is None or rule.validator(match.group()):
+            spans.append((start, end))
+            match = rule.regex.search(text, max(end, start + 1))
+        else:
+            # as in ``rule_matches``: a rejected candidate may overlap a valid one that starts later
+            match = rule.regex.search(text, start + 1)
+    return spans
+
+
+def prefilter(view: ScanText, rules: Iterable[PatternRule]) -> List[PatternRule]:
+    """Return the rules whose cheap prefilters leave a possibility of matching the text."""
+    candidates = []
+    for rule in rules:
+        required = rule.required
+        if required:
+            haystack = view.haystack(rule)
+            if not any(literal in haystack for literal in required):
+                continue
+        if rule.min_digits and view.text.isascii() and view.digits < rule.min_digits:
+            continue
+        candidates.append(rule)
+    return candidates
+
+
+def find_matches(text: str, rules: Iterable[PatternRule], view: Optional[ScanText] = None) -> List[str]:
+    view = view or ScanText(text)
+    return [rule.name for rule in prefilter(view, rules) if rule_matches(rule, text, view)]
@@ -4,14 +4,25 @@ from __future__ import annotations
 
 from typing import List
 
-from .patterns import find_matches, pii_patterns
+from .matcher import default_matcher
+from .patterns import ScanText
+from .registry import ComplianceDetectorSpec
 from .types import ComplianceCategory, ComplianceIssue
 
 
+NAME = "pii"
+
+
+def detect_pii_text(view: ScanText) -> ComplianceIssue:
+    return pii_issue(*default_matcher().category_hits(view, ComplianceCategory.PII.value))
+
+
 def detect_pii(text: str) -> ComplianceIssue:
-    patterns = pii_patterns()
-    critical_hits = find_matches(text, patterns.critical)
-    soft_hits = find_matches(text, patterns.soft)
+    return detect_pii_text(ScanText(text))
+
+
+def pii_issue(critical_hits: List[str], soft_hits: List[str]) -> ComplianceIssue:
+    """Build the issue for the names of the critical and soft rules that matched."""
     matches = critical_hits + soft_hits
 
     if not matches:
@@ -34,3 +45,12 @@ def detect_pii(text: str) -> ComplianceIssue:
         explanation="Potential PII detected in output",
         matches=matches,
     )
+
+
+def get_detector() -> ComplianceDetectorSpec:
+    return ComplianceDetectorSpec(
+        name=NAME,
+        category=ComplianceCategory.PII.value,
+        detect=detect_pii_text,
+        cost=1.0,
+    )
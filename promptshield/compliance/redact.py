@@ -0,0 +1,128 @@
+"""Redaction of PII and secrets in model outputs."""
+
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass
+from enum import Enum
+from functools import lru_cache
+from typing import TYPE_CHECKING, List, Optional, Tuple
+
+from .patterns import PatternRule, ScanText, pii_patterns, prefilter, rule_spans, secret_patterns
+from .types import ComplianceCategory, ComplianceResult
+
+if TYPE_CHECKING:
+    from .scanner import ComplianceEngine
+
+
+class RedactionMode(str, Enum):
+    MASK = "mask"
+    HASH = "hash"
+    PLACEHOLDER = "placeholder"
+
+
+@dataclass(frozen=True)
+class RedactionSpan:
+    start: int
+    end: int
+    category: str
+    rules: Tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class RedactionResult:
+    text: str
+    spans: List[RedactionSpan]
+    result: ComplianceResult
+
+
+@lru_cache(maxsize=None)
+def critical_rules() -> Tuple[Tuple[str, PatternRule], ...]:
+    """Every critical secret and PII rule with its category; secrets win ties between overlapping spans."""
+    return tuple(
+        (category, rule)
+        for category, patterns in (
+            (ComplianceCategory.SECRETS.value, secret_patterns()),
+            (ComplianceCategory.PII.value, pii_patterns()),
+        )
+        for rule in patterns.critical
+    )
+
+
+def find_spans(text: str) -> List[RedactionSpan]:
+    """Return merged, ordered spans of sensitive values.
+
+    Each rule is searched on its own, so a candidate one rule's validator
+    rejects never hides another rule's match at the same place.
+    """
+    view = ScanText(text)
+    rules = critical_rules()
+    candidates = {id(rule) for rule in prefilter(view, (rule for _, rule in rules))}
+    found: List[Tuple[int, int, int]] = []
+    for order, (_, rule) in enumerate(rules):
+        if id(rule) in candidates:
+            found.extend((start, order, end) for start, end in rule_spans(rule, text))
+    found.sort()
+    spans: List[RedactionSpan] = []
+    for start, order, end in found:
+        category, rule = rules[order]
+        if spans and start <= spans[-1].end:
+            last = spans[-1]
+            names = last.rules if rule.name in last.rules else last.rules + (rule.name,)
+            spans[-1] = RedactionSpan(last.start, max(last.end, end), last.category, names)
+        else:
+            spans.append(RedactionSpan(start, end, category, (rule.name,)))
+    return spans
+
+
+def replacement(value: str, span: RedactionSpan, mode: RedactionMode, mask_char: str = "*") -> str:
+    if mode == RedactionMode.MASK:
+        return mask_char * len(value)
+    label = span.rules[0].upper()
+    if mode == RedactionMode.HASH:
+        digest = hashlib.blake2b(value.encode("utf-8"), digest_size=6).hexdigest()
+        return f"[{label}:{digest}]"
+    return f"[{label}]"
+
+
+def redact_text(
+    text: str,
+    spans: List[RedactionSpan],
+    mode: RedactionMode = RedactionMode.PLACEHOLDER,
+    mask_char: str = "*",
+) -> str:
+    """Replace ``spans`` in ``text``; the output is joined once from slices."""
+    pieces: List[str] = []
+    position = 0
+    for span in spans:
+        pieces.append(text[position : span.start])
+        pieces.append(replacement(text[span.start : span.end], span, mode, mask_char))
+        position = span.end
+    pieces.append(text[position:])
+    return "".join(pieces)
+
+
+def redact_output(
+    text: str,
+    mode: RedactionMode = RedactionMode.PLACEHOLDER,
+    engine: Optional["ComplianceEngine"] = None,
+    request_id: Optional[str] = None,
+    tenant: Optional[str] = None,
+) -> RedactionResult:
+    """Scan ``text`` and return it with PII and secrets redacted.
+
+    ``mode`` selects how values are replaced: ``mask`` keeps the length,
+    ``hash`` gives a stable pseudonym per value and ``placeholder`` a typed
+    tag such as ``[EMAIL]``. Soft hints (e.g. the word "secret") affect the
+    result but are not redacted.
+    """
+    from .scanner import ComplianceEngine
+
+    engine = engine or ComplianceEngine()
+    output = str(text)
+    spans = find_spans(output)
+    return RedactionResult(
+        text=redact_text(output, spans, RedactionMode(mode)),
+        spans=spans,
+        result=engine.scan(output, request_id=request_id, tenant=tenant),
+    )
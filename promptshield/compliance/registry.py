@@ -0,0 +1,75 @@
+"""Compliance detector registry and plugin loading."""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from importlib.metadata import entry_points
+from typing import Callable, Iterable, List, Optional
+
+from .patterns import ScanText
+from .types import ComplianceIssue
+
+logger = logging.getLogger(__name__)
+
+ComplianceDetectorFn = Callable[[ScanText], ComplianceIssue]
+
+
+@dataclass(frozen=True)
+class ComplianceDetectorSpec:
+    """A named output detector.
+
+    ``cost`` is the detector's relative cost per scan; engines run cheaper
+    detectors first so that, with short-circuiting enabled, expensive ones
+    can be skipped once the output is certain to be blocked.
+    """
+
+    name: str
+    category: str
+    detect: ComplianceDetectorFn
+    cost: float = 1.0
+
+
+def default_compliance_detectors() -> List[ComplianceDetectorSpec]:
+    from promptshield.compliance import pii, secrets
+
+    return [
+        pii.get_detector(),
+        secrets.get_detector(),
+    ]
+
+
+def load_entry_point_compliance_detectors() -> List[ComplianceDetectorSpec]:
+    detectors: List[ComplianceDetectorSpec] = []
+    for entry in entry_points(group="promptshield.compliance"):
+        try:
+            loaded = entry.load()
+            if isinstance(loaded, ComplianceDetectorSpec):
+                detectors.append(loaded)
+            elif callable(loaded):
+                detectors.append(loaded())
+            else:
+                logger.warning("Entry point %s did not return a ComplianceDetectorSpec", entry.name)
+        except Exception as exc:  # pragma: no cover - defensive
+            logger.warning("Failed to load compliance detector entry point %s: %s", entry.name, exc)
+    return detectors
+
+
+def resolve_compliance_detectors(
+    detectors: Optional[Iterable[ComplianceDetectorSpec]] = None,
+    include_entry_points: bool = True,
+) -> List[ComplianceDetectorSpec]:
+    """Return the deduplicated detectors, cheapest first (ties keep their order)."""
+    resolved = list(detectors) if detectors is not None else default_compliance_detectors()
+    if include_entry_points:
+        resolved.extend(load_entry_point_compliance_detectors())
+    if not resolved:
+        raise ValueError("No compliance detectors configured")
+    deduped: List[ComplianceDetectorSpec] = []
+    seen: set[str] = set()
+    for detector in resolved:
+        if detector.name in seen:
+            continue
+        seen.add(detector.name)
+        deduped.append(detector)
+    return sorted(deduped, key=lambda detector: detector.cost)
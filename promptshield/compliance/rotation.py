@@ -0,0 +1,201 @@
+"""Audit log rotation, compression and segment manifests."""
+
+from __future__ import annotations
+
+import gzip
+import json
+import logging
+import os
+import shutil
+import threading
+from dataclasses import asdict, dataclass, replace
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import IO, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class RotationPolicy:
+    max_bytes: Optional[int] = None
+    interval: Optional[float] = None
+    backup_count: Optional[int] = None
+    max_age: Optional[float] = None
+    compress: bool = True
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes is not None or self.interval is not None
+
+
+@dataclass(frozen=True)
+class Segment:
+    path: str
+    start: Optional[str]
+    end: Optional[str]
+    bytes: int
+    compressed: bool = False
+
+
+def manifest_path(log_path: Path) -> Path:
+    return log_path.with_name(f"{log_path.name}.manifest.json")
+
+
+def load_manifest(log_path: Path) -> List[Segment]:
+    path = manifest_path(log_path)
+    if not path.exists():
+        return []
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        logger.warning("Unreadable audit manifest: %s", path)
+        return []
+    return [Segment(**item) for item in data.get("segments", [])]
+
+
+def save_manifest(log_path: Path, segments: List[Segment]) -> None:
+    path = manifest_path(log_path)
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    payload = {"segments": [asdict(segment) for segment in segments]}
+    tmp_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+def find_segments(
+    log_path: Path,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+) -> List[Path]:
+    """Return rotated segments (oldest first) whose time range overlaps [start, end]."""
+    start_iso = start.astimezone(timezone.utc).isoformat() if start else None
+    end_iso = end.astimezone(timezone.utc).isoformat() if end else None
+    selected: List[Path] = []
+    for segment in load_manifest(log_path):
+        if start_iso and segment.end and segment.end < start_iso:
+            continue
+        if end_iso and segment.start and segment.start > end_iso:
+            continue
+        selected.append(log_path.with_name(segment.path))
+    return selected
+
+
+def open_segment(path: Path) -> IO[str]:
+    if path.suffix == ".gz":
+        return gzip.open(path, "rt", encoding="utf-8")
+    return path.open("r", encoding="utf-8")
+
+
+def iter_segment_lines(path: Path) -> Iterator[str]:
+    with open_segment(path) as handle:
+        for line in handle:
+            yield line.rstrip("\n")
+
+
+def first_timestamp(path: Path) -> Optional[str]:
+    try:
+        with path.open("r", encoding="utf-8") as handle:
+            line = handle.readline()
+    except OSError:
+        return None
+    try:
+        return json.loads(line).get("timestamp")
+    except (ValueError, AttributeError):
+        return None
+
+
+class SegmentRotator:
+    """Move full audit logs aside, compress them and enforce retention."""
+
+    def __init__(self, log_path: Path, policy: RotationPolicy) -> None:
+        self.log_path = log_path
+        self.policy = policy
+        self._lock = threading.Lock()
+        self._finish_lock = threading.Lock()
+        self._workers: List[threading.Thread] = []
+
+    def should_rotate(self, size: int, incoming: int, segment_start: Optional[str]) -> bool:
+        if size <= 0:
+            return False
+        if self.policy.max_bytes is not None and size + incoming > self.policy.max_bytes:
+            return True
+        if self.policy.interval is not None and segment_start:
+            started = datetime.fromisoformat(segment_start).timestamp()
+            return datetime.now(timezone.utc).timestamp() - started >= self.policy.interval
+        return False
+
+    def rotate(self, start: Optional[str], end: Optional[str]) -> Optional[Path]:
+        """Rename the active log to a timestamped segment; the caller must hold the file closed."""
+        if not self.log_path.exists():
+            return None
+        target = self._segment_name()
+        os.replace(self.log_path, target)
+        segment = Segment(path=target.name, start=start, end=end, bytes=target.stat().st_size)
+        with self._lock:
+            save_manifest(self.log_path, [*load_manifest(self.log_path), segment])
+
+        worker = threading.Thread(target=self._finish, args=(target,), name="promptshield-audit-rotate")
+        self._workers = [thread for thread in self._workers if thread.is_alive()]
+        self._workers.append(worker)
+        worker.start()
+        return target
+
+    def wait(self) -> None:
+        for worker in list(self._workers):
+            worker.join()
+
+    def _segment_name(self) -> Path:
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%fZ")
+        candidate = self.log_path.with_name(f"{self.log_path.name}.{stamp}")
+        counter = 1
+        while candidate.exists() or candidate.with_name(f"{candidate.name}.gz").exists():
+            candidate = self.log_path.with_name(f"{self.log_path.name}.{stamp}-{counter}")
+            counter += 1
+        return candidate
+
+    def _finish(self, segment_path: Path) -> None:
+        try:
+            with self._finish_lock:
+                if self.policy.compress and segment_path.exists():
+                    self._compress(segment_path)
+                self._apply_retention()
+        except Exception as exc:  # pragma: no cover - defensive
+            logger.warning("Audit segment rotation failed for %s: %s", segment_path, exc)
+
+    def _compress(self, segment_path: Path) -> None:
+        gz_path = segment_path.with_name(f"{segment_path.name}.gz")
+        with segment_path.open("rb") as source, gzip.open(gz_path, "wb") as target:
+            shutil.copyfileobj(source, target)
+        with self._lock:
+            segments = [
+                replace(segment, path=gz_path.name, compressed=True)
+                if segment.path == segment_path.name
+                else segment
+                for segment in load_manifest(self.log_path)
+            ]
+            save_manifest(self.log_path, segments)
+        segment_path.unlink()
+
+    def _apply_retention(self) -> None:
+        if self.policy.backup_count is None and self.policy.max_age is None:
+            return
+        with self._lock:
+            segments = load_manifest(self.log_path)
+            keep = list(segments)
+            if self.policy.max_age is not None:
+                now = datetime.now(timezone.utc).timestamp()
+                keep = [
+                    segment
+                    for segment in keep
+                    if not segment.end
+                    or now - datetime.fromisoformat(segment.end).timestamp() <= self.policy.max_age
+                ]
+            if self.policy.backup_count is not None:
+                keep = keep[-self.policy.backup_count :] if self.policy.backup_count > 0 else []
+            removed = [segment for segment in segments if segment not in keep]
+            save_manifest(self.log_path, keep)
+        for segment in removed:
+            try:
+                self.log_path.with_name(segment.path).unlink()
+            except FileNotFoundError:
+                pass
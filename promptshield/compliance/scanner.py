@@ -3,15 +3,21 @@
 from __future__ import annotations
 
 import logging
-from typing import Iterable, Optional
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Iterable, List, Optional
 
 from promptshield.engine.events import SecurityEvent
 
 from .config import ComplianceConfig
-from .pii import detect_pii
-from .secrets import detect_secrets
+from .patterns import ScanText
+from .registry import ComplianceDetectorSpec, resolve_compliance_detectors
 from .types import ComplianceIssue, ComplianceResult
 
+if TYPE_CHECKING:
+    from .redact import RedactionResult
+    from .streaming import StreamingComplianceScanner
+    from .structured import StructuredScanResult
+
 logger = logging.getLogger(__name__)
 
 
@@ -47,21 +53,78 @@ def aggregate_compliance_risk(
 
 
 class ComplianceEngine:
-    """Configurable compliance scanner."""
-
-    def __init__(self, config: Optional[ComplianceConfig] = None) -> None:
+    """Configurable compliance scanner.
+
+    Detectors are resolved once, when the engine is created, and run cheapest
+    first. With ``config.short_circuit`` the remaining detectors are skipped
+    as soon as the output is certain to be blocked; their names are listed in
+    the result's ``skipped`` metadata.
+    """
+
+    def __init__(
+        self,
+        config: Optional[ComplianceConfig] = None,
+        detectors: Optional[Iterable[ComplianceDetectorSpec]] = None,
+        include_entry_points: bool = True,
+    ) -> None:
         self.config = config or ComplianceConfig.from_env()
+        self.detectors = resolve_compliance_detectors(detectors, include_entry_points=include_entry_points)
 
-    def scan(self, text: str) -> ComplianceResult:
+    def scan(self, text: str, request_id: Optional[str] = None, tenant: Optional[str] = None) -> ComplianceResult:
         if text is None or not str(text).strip():
             raise ValueError("text must be a non-empty string")
 
         output = str(text)
-        issues = [
-            detect_pii(output),
-            detect_secrets(output),
-        ]
+        view = ScanText(output)
+        issues: List[ComplianceIssue] = []
+        skipped: List[str] = []
+        for detector in self.detectors:
+            if skipped or (self.config.short_circuit and issues and self._block_certain(issues)):
+                skipped.append(detector.name)
+                continue
+            issues.append(detector.detect(view))
+
+        result = self.evaluate(issues)
+        if skipped:
+            result.metadata["skipped"] = skipped
+        self._emit_event(result, len(output), request_id, tenant)
+        return result
 
+    def stream(self, request_id: Optional[str] = None, tenant: Optional[str] = None) -> "StreamingComplianceScanner":
+        """Return a scanner for output that arrives in chunks (see ``StreamingComplianceScanner``)."""
+        from .streaming import StreamingComplianceScanner
+
+        return StreamingComplianceScanner(self, request_id=request_id, tenant=tenant)
+
+    def redact(
+        self,
+        text: str,
+        mode: str = "placeholder",
+        request_id: Optional[str] = None,
+        tenant: Optional[str] = None,
+    ) -> "RedactionResult":
+        """Scan ``text`` and return it with PII and secrets redacted (see ``redact_output``)."""
+        from .redact import RedactionMode, redact_output
+
+        return redact_output(text, RedactionMode(mode), engine=self, request_id=request_id, tenant=tenant)
+
+    def scan_structured(
+        self,
+        value: Any,
+        request_id: Optional[str] = None,
+        skip_keys: Iterable[str] = (),
+        skip_paths: Iterable[str] = (),
+        tenant: Optional[str] = None,
+    ) -> "StructuredScanResult":
+        """Scan the string leaves of a JSON-like value (see ``scan_structured``)."""
+        from .structured import scan_structured
+
+        return scan_structured(
+            value, engine=self, request_id=request_id, skip_keys=skip_keys, skip_paths=skip_paths, tenant=tenant
+        )
+
+    def evaluate(self, issues: List[ComplianceIssue]) -> ComplianceResult:
+        """Aggregate detector issues into a result using this engine's weights and thresholds."""
         risk_score, category, confidence, explanation = aggregate_compliance_risk(
             issues,
             weights=self.config.weights,
@@ -69,7 +132,7 @@ class ComplianceEngine:
         )
         block = risk_score >= self.config.thresholds.block
 
-        result = ComplianceResult(
+        return ComplianceResult(
             block=block,
             risk_score=risk_score,
             category=category,
@@ -79,23 +142,40 @@ class ComplianceEngine:
             metadata={"threshold": self.config.thresholds.block},
         )
 
-        self._emit_event(result, output)
-        return result
-
-    def _emit_event(self, result: ComplianceResult, output: str) -> None:
+    def _block_certain(self, issues: List[ComplianceIssue]) -> bool:
+        # A later issue can take over the top spot and drop the boost, so only the
+        # weighted sum counts: with non-negative weights and scores it never falls.
+        weights = self.config.weights
+        if any(weight < 0 for weight in weights.values()):
+            return False
+        weighted_score = sum(issue.score * weights.get(issue.category, 0.0) for issue in issues)
+        return int(round(min(1.0, weighted_score) * 100)) >= self.config.thresholds.block
+
+    def _emit_event(
+        self,
+        result: ComplianceResult,
+        output_length: int,
+        request_id: Optional[str] = None,
+        tenant: Optional[str] = None,
+    ) -> None:
         if not self.config.event_sink:
             return
 
+        metadata = {
+            "risk_score": result.risk_score,
+            "blocked": result.block,
+            "category": result.category,
+            "confidence": result.confidence,
+            "output_length": output_length,
+        }
+        if request_id is not None:
+            metadata["request_id"] = request_id
+        if tenant is not None:
+            metadata["tenant"] = tenant
         event = SecurityEvent(
             event_type="promptshield.compliance",
             message="Output scanned",
-            metadata={
-                "risk_score": result.risk_score,
-                "blocked": result.block,
-                "category": result.category,
-                "confidence": result.confidence,
-                "output_length": len(output),
-            },
+            metadata=metadata,
         )
         try:
             self.config.event_sink(event)
@@ -103,9 +183,11 @@ class ComplianceEngine:
             logger.warning("Compliance event sink failed: %s", exc)
 
 
-_DEFAULT_COMPLIANCE_ENGINE = ComplianceEngine()
+@lru_cache(maxsize=None)
+def _default_compliance_engine() -> ComplianceEngine:
+    return ComplianceEngine()
 
 
 def scan_output(text: str) -> ComplianceResult:
     """Scan model output text for PII or secrets."""
-    return _DEFAULT_COMPLIANCE_ENGINE.scan(text)
+    return _default_compliance_engine().scan(text)
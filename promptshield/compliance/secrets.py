@@ -2,14 +2,27 @@
 
 from __future__ import annotations
 
-from .patterns import find_matches, secret_patterns
+from typing import List
+
+from .matcher import default_matcher
+from .patterns import ScanText
+from .registry import ComplianceDetectorSpec
 from .types import ComplianceCategory, ComplianceIssue
 
 
+NAME = "secrets"
+
+
+def detect_secrets_text(view: ScanText) -> ComplianceIssue:
+    return secrets_issue(*default_matcher().category_hits(view, ComplianceCategory.SECRETS.value))
+
+
 def detect_secrets(text: str) -> ComplianceIssue:
-    patterns = secret_patterns()
-    critical_hits = find_matches(text, patterns.critical)
-    soft_hits = find_matches(text, patterns.soft)
+    return detect_secrets_text(ScanText(text))
+
+
+def secrets_issue(critical_hits: List[str], soft_hits: List[str]) -> ComplianceIssue:
+    """Build the issue for the names of the critical and soft rules that matched."""
     matches = critical_hits + soft_hits
 
     if not matches:
@@ -32,3 +45,12 @@ def detect_secrets(text: str) -> ComplianceIssue:
         explanation="Potential secret detected in output",
         matches=matches,
     )
+
+
+def get_detector() -> ComplianceDetectorSpec:
+    return ComplianceDetectorSpec(
+        name=NAME,
+        category=ComplianceCategory.SECRETS.value,
+        detect=detect_secrets_text,
+        cost=2.0,
+    )
@@ -0,0 +1,254 @@
+"""SQLite-backed, indexed audit event store."""
+
+from __future__ import annotations
+
+import atexit
+import json
+import logging
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from promptshield.engine.events import SecurityEvent
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY,
+    timestamp TEXT NOT NULL,
+    event_type TEXT NOT NULL,
+    category TEXT,
+    blocked INTEGER,
+    risk_score INTEGER,
+    message TEXT,
+    metadata TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_events_timestamp ON events (timestamp);
+CREATE INDEX IF NOT EXISTS idx_events_event_type ON events (event_type, timestamp);
+CREATE INDEX IF NOT EXISTS idx_events_category ON events (category, timestamp);
+CREATE INDEX IF NOT EXISTS idx_events_blocked ON events (blocked, timestamp);
+"""
+
+_INSERT = (
+    "INSERT INTO events (timestamp, event_type, category, blocked, risk_score, message, metadata) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+
+_Row = Tuple[str, str, Optional[str], Optional[int], Optional[int], str, str]
+
+
+def _to_iso(value: datetime | str) -> str:
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.astimezone(timezone.utc).isoformat()
+    return value
+
+
+def _to_row(event: SecurityEvent) -> _Row:
+    metadata = event.metadata
+    blocked = metadata.get("blocked")
+    risk_score = metadata.get("risk_score")
+    return (
+        _to_iso(event.timestamp),
+        event.event_type,
+        metadata.get("category"),
+        None if blocked is None else int(bool(blocked)),
+        None if risk_score is None else int(risk_score),
+        event.message,
+        json.dumps(metadata),
+    )
+
+
+class SQLiteAuditStore:
+    """Persist security events to SQLite and query them by time, type, category and verdict.
+
+    An instance is an event sink. Events are buffered and inserted in batches
+    by a background thread (one transaction per batch) into a WAL-mode
+    database, so readers such as the dashboard never block the writer. The
+    writer thread starts with the first event, so read-only use is cheap.
+    """
+
+    def __init__(
+        self,
+        path: str = "audit.db",
+        batch_size: int = 1000,
+        flush_interval: float = 0.5,
+    ) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+
+        with self._connection() as conn:
+            conn.executescript(_SCHEMA)
+
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._flushed = threading.Condition(self._lock)
+        self._pending: List[_Row] = []
+        self._in_flight = 0
+        self._closed = False
+        self._writer: Optional[threading.Thread] = None
+
+    def __call__(self, event: SecurityEvent) -> None:
+        self.log_security_event(event)
+
+    def log_security_event(self, event: SecurityEvent) -> None:
+        self._append([_to_row(event)])
+
+    def log_security_events(self, events: Iterable[SecurityEvent]) -> None:
+        rows = [_to_row(event) for event in events]
+        if rows:
+            self._append(rows)
+
+    def flush(self) -> None:
+        """Block until every queued event has been committed."""
+        with self._lock:
+            if self._writer is None:
+                return
+            self._wakeup.notify()
+            while self._pending or self._in_flight:
+                self._flushed.wait()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._wakeup.notify_all()
+            writer = self._writer
+        if writer is not None:
+            writer.join()
+            atexit.unregister(self.close)
+
+    def query(
+        self,
+        event_type: Optional[str] = None,
+        category: Optional[str] = None,
+        blocked: Optional[bool] = None,
+        since: Optional[datetime | str] = None,
+        until: Optional[datetime | str] = None,
+        limit: int = 200,
+    ) -> List[Dict[str, Any]]:
+        """Return matching events, newest first, in the JSONL audit record shape."""
+        where, params = self._where(event_type, category, blocked, since, until)
+        sql = f"SELECT timestamp, event_type, message, metadata FROM events{where} ORDER BY timestamp DESC LIMIT ?"
+        with self._connection() as conn:
+            rows = conn.execute(sql, (*params, int(limit))).fetchall()
+        return [
+            {"event_type": event_type_, "timestamp": timestamp, "message": message, "metadata": json.loads(metadata)}
+            for timestamp, event_type_, message, metadata in rows
+        ]
+
+    def count(
+        self,
+        event_type: Optional[str] = None,
+        category: Optional[str] = None,
+        blocked: Optional[bool] = None,
+        since: Optional[datetime | str] = None,
+        until: Optional[datetime | str] = None,
+    ) -> int:
+        where, params = self._where(event_type, category, blocked, since, until)
+        with self._connection() as conn:
+            (total,) = conn.execute(f"SELECT COUNT(*) FROM events{where}", params).fetchone()
+        return int(total)
+
+    def counts_by_category(
+        self,
+        blocked: Optional[bool] = None,
+        since: Optional[datetime | str] = None,
+        until: Optional[datetime | str] = None,
+    ) -> Dict[str, int]:
+        where, params = self._where(None, None, blocked, since, until)
+        sql = f"SELECT category, COUNT(*) FROM events{where} GROUP BY category"
+        with self._connection() as conn:
+            rows = conn.execute(sql, params).fetchall()
+        return {str(category): int(total) for category, total in rows}
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        conn = self._connect()
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    @staticmethod
+    def _where(
+        event_type: Optional[str],
+        category: Optional[str],
+        blocked: Optional[bool],
+        since: Optional[datetime | str],
+        until: Optional[datetime | str],
+    ) -> Tuple[str, List[Any]]:
+        clauses: List[str] = []
+        params: List[Any] = []
+        if event_type is not None:
+            clauses.append("event_type = ?")
+            params.append(event_type)
+        if category is not None:
+            clauses.append("category = ?")
+            params.append(category)
+        if blocked is not None:
+            clauses.append("blocked = ?")
+            params.append(int(blocked))
+        if since is not None:
+            clauses.append("timestamp >= ?")
+            params.append(_to_iso(since))
+        if until is not None:
+            clauses.append("timestamp <= ?")
+            params.append(_to_iso(until))
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        return where, params
+
+    def _append(self, rows: List[_Row]) -> None:
+        with self._lock:
+            if not self._closed:
+                self._enqueue(rows)
+                return
+        with self._connection() as conn, conn:
+            conn.executemany(_INSERT, rows)
+
+    def _enqueue(self, rows: List[_Row]) -> None:
+        if self._writer is None:
+            self._writer = threading.Thread(target=self._run, name="promptshield-audit-db", daemon=True)
+            self._writer.start()
+            atexit.register(self.close)
+        self._pending.extend(rows)
+        if len(self._pending) >= self.batch_size:
+            self._wakeup.notify()
+
+    def _run(self) -> None:
+        conn = self._connect()
+        try:
+            while True:
+                with self._lock:
+                    if len(self._pending) < self.batch_size and not self._closed:
+                        self._wakeup.wait(self.flush_interval)
+                    rows, self._pending = self._pending, []
+                    self._in_flight = len(rows)
+                    closed = self._closed
+                if rows:
+                    try:
+                        with conn:
+                            conn.executemany(_INSERT, rows)
+                    except sqlite3.Error as exc:  # pragma: no cover - defensive
+                        logger.warning("Failed to write %d audit events: %s", len(rows), exc)
+                with self._lock:
+                    self._in_flight = 0
+                    self._flushed.notify_all()
+                if closed:
+                    return
+        finally:
+            conn.close()
@@ -0,0 +1,198 @@
+"""Incremental compliance scanning for streamed model output."""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, List, Optional, Tuple
+
+from .patterns import PatternRule, PatternSet, pii_patterns, secret_patterns
+from .pii import pii_issue
+from .scanner import ComplianceEngine
+from .secrets import secrets_issue
+from .types import ComplianceIssue, ComplianceResult
+
+IssueBuilder = Callable[[List[str], List[str]], ComplianceIssue]
+
+
+@dataclass(frozen=True)
+class RuleWindow:
+    """How much trailing text a rule must keep to find matches that span chunks.
+
+    ``width`` is the longest possible match, or ``None`` when unbounded. For
+    unbounded rules ``alphabet`` tells which characters a match can contain,
+    so only the trailing run of those characters has to be kept; ``None``
+    means any character (keep everything up to the scanner's cap).
+    """
+
+    width: Optional[int]
+    alphabet: Optional[Callable[[str], bool]] = None
+
+
+@lru_cache(maxsize=None)
+def rule_window(rule: PatternRule) -> RuleWindow:
+    if rule.max_length is not None:
+        return RuleWindow(width=rule.max_length)
+    if rule.charset is None:
+        return RuleWindow(width=None)
+    # matching one character with the rule's own flags case-folds exactly like the rule does
+    charset = re.compile(f"[{rule.charset}]", rule.regex.flags)
+    return RuleWindow(width=None, alphabet=lambda char: charset.fullmatch(char) is not None)
+
+
+@dataclass
+class _RuleState:
+    rule: PatternRule
+    window: RuleWindow
+    group: int
+    critical: bool
+    matched: bool = False
+    run_start: int = 0
+
+
+class StreamingComplianceScanner:
+    """Compliance-scan output that arrives in chunks without re-scanning it.
+
+    :meth:`feed` returns the verdict for the text seen so far and
+    :meth:`finish` the final one, which equals ``ComplianceEngine.scan`` on the
+    concatenated text. A rule that has matched is not searched again. For the
+    rest only a short tail is kept: the longest possible match of each bounded
+    pattern or, for unbounded ones, the trailing run of characters the
+    pattern can match (capped at ``max_retained``).
+    """
+
+    def __init__(
+        self,
+        engine: Optional[ComplianceEngine] = None,
+        request_id: Optional[str] = None,
+        max_retained: int = 64 * 1024,
+        tenant: Optional[str] = None,
+    ) -> None:
+        self.engine = engine or ComplianceEngine()
+        self.request_id = request_id
+        self.tenant = tenant
+        self.max_retained = max_retained
+        self._groups: Tuple[Tuple[PatternSet, IssueBuilder], ...] = (
+            (pii_patterns(), pii_issue),
+            (secret_patterns(), secrets_issue),
+        )
+        self._rules = [
+            _RuleState(rule=rule, window=rule_window(rule), group=index, critical=critical)
+            for index, (patterns, _) in enumerate(self._groups)
+            for critical, rules in ((True, patterns.critical), (False, patterns.soft))
+            for rule in rules
+        ]
+        self._buffer = ""
+        self._base = 0
+        self._length = 0
+        self._result = self.engine.evaluate(self._issues())
+        self._final: Optional[ComplianceResult] = None
+
+    @property
+    def length(self) -> int:
+        return self._length
+
+    @property
+    def retained(self) -> int:
+        """Characters currently kept for matches that may continue in the next chunk."""
+        return len(self._buffer)
+
+    @property
+    def result(self) -> ComplianceResult:
+        return self._result
+
+    def feed(self, chunk: str) -> ComplianceResult:
+        """Scan the next chunk; returns the verdict for all text fed so far."""
+        if self._final is not None:
+            raise RuntimeError("scanner is finished")
+        if chunk:
+            previous_end = self._length
+            self._buffer += chunk
+            self._length += len(chunk)
+            self._scan(previous_end, final=False)
+            self._track_runs(chunk, previous_end)
+            self._trim()
+        return self._result
+
+    def finish(self) -> ComplianceResult:
+        """Resolve matches at the end of the text and emit the compliance event."""
+        if self._final is None:
+            self._scan(self._length, final=True)
+            self._buffer = ""
+            self._base = self._length
+            self._final = self._result
+            self.engine._emit_event(self._final, self._length, self.request_id, self.tenant)
+        return self._final
+
+    def _scan(self, previous_end: int, final: bool) -> None:
+        found = False
+        floor = self._base + 1 if self._base else 0  # buffer[0] is only context for \b
+        for state in self._rules:
+            if state.matched:
+                continue
+            if state.window.width is not None:
+                start = previous_end - state.window.width
+            elif state.window.alphabet is not None:
+                start = state.run_start
+            else:
+                start = floor
+            regex, validator, width = state.rule.regex, state.rule.validator, state.window.width
+            match = regex.search(self._buffer, max(start, floor) - self._base)
+            while match is not None:
+                if final:
+                    settled = True
+                elif validator is not None and width is not None:
+                    # the candidate at this position can still change until ``width`` more chars are known
+                    settled = match.start() + width < len(self._buffer)
+                else:
+                    # a match touching the end may still change with the next chunk (e.g. a trailing \b)
+                    settled = match.end() < len(self._buffer)
+                if not settled:
+                    break
+                if validator is None or validator(match.group()):
+                    state.matched = found = True
+                    break
+                match = regex.search(self._buffer, match.start() + 1)
+        if found:
+            self._result = self.engine.evaluate(self._issues())
+
+    def _track_runs(self, chunk: str, previous_end: int) -> None:
+        for state in self._rules:
+            alphabet = state.window.alphabet
+            if state.matched or alphabet is None:
+                continue
+            index = len(chunk)
+            while index and alphabet(chunk[index - 1]):
+                index -= 1
+            if index:
+                state.run_start = previous_end + index
+
+    def _trim(self) -> None:
+        keep = self._length
+        for state in self._rules:
+            if state.matched:
+                continue
+            if state.window.width is not None:
+                needed = self._length - state.window.width
+            elif state.window.alphabet is not None:
+                needed = state.run_start
+            else:
+                needed = self._base + 1
+            keep = min(keep, needed - 1)
+        keep = max(keep, self._base, self._length - self.max_retained)
+        if keep > self._base:
+            self._buffer = self._buffer[keep - self._base :]
+            self._base = keep
+
+    def _issues(self) -> List[ComplianceIssue]:
+        issues = []
+        for index, (_, build) in enumerate(self._groups):
+            rules = [state for state in self._rules if state.group == index and state.matched]
+            issues.append(
+                build(
+                    [state.rule.name for state in rules if state.critical],
+                    [state.rule.name for state in rules if not state.critical],
+                )
+            )
+        return issues
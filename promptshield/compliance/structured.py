@@ -0,0 +1,173 @@
+"""Compliance scanning of structured (JSON) outputs."""
+
+from __future__ import annotations
+
+import re
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .redact import find_spans
+from .types import ComplianceResult
+
+if TYPE_CHECKING:
+    from .scanner import ComplianceEngine
+
+Step = Union[str, int]
+
+LEAF_SEPARATOR = "\x00"
+
+_SIMPLE_KEY = re.compile(r"[A-Za-z_][A-Za-z0-9_-]*")
+_PATTERN_STEP = re.compile(r"\[(\*|\d+)\]|([^.\[\]]+)")
+
+
+@dataclass(frozen=True)
+class StructuredHit:
+    """A sensitive value inside the string at ``path`` (offsets are within that string)."""
+
+    path: str
+    category: str
+    rules: Tuple[str, ...]
+    start: int
+    end: int
+
+
+@dataclass(frozen=True)
+class StructuredScanResult:
+    result: ComplianceResult
+    hits: List[StructuredHit]
+    leaves: int
+    scanned_chars: int
+
+
+def format_path(steps: Iterable[Step]) -> str:
+    """Render steps as ``choices[0].message.content``; unusual keys are quoted."""
+    parts: List[str] = []
+    for step in steps:
+        if isinstance(step, int):
+            parts.append(f"[{step}]")
+        elif _SIMPLE_KEY.fullmatch(step):
+            parts.append(f".{step}" if parts else step)
+        else:
+            parts.append(f"[{step!r}]")
+    return "".join(parts) or "$"
+
+
+def _compile_skip(path: str) -> Tuple[Optional[Step], ...]:
+    # ``None`` is a wildcard: ``*`` for any key, ``[*]`` for any index
+    steps: List[Optional[Step]] = []
+    for part in path.split("."):
+        matches = list(_PATTERN_STEP.finditer(part))
+        if not part or sum(len(match.group()) for match in matches) != len(part):
+            raise ValueError(f"invalid skip path: {path!r}")
+        for match in matches:
+            index, key = match.groups()
+            if index is not None:
+                steps.append(None if index == "*" else int(index))
+            else:
+                steps.append(None if key == "*" else key)
+    return tuple(steps)
+
+
+def _skipped(steps: Tuple[Step, ...], patterns: Tuple[Tuple[Optional[Step], ...], ...]) -> bool:
+    for pattern in patterns:
+        if len(pattern) == len(steps) and all(
+            expected is None or expected == step for expected, step in zip(pattern, steps)
+        ):
+            return True
+    return False
+
+
+def iter_string_leaves(
+    value: Any,
+    skip_keys: Iterable[str] = (),
+    skip_paths: Iterable[str] = (),
+    scan_numbers: bool = True,
+    scan_keys: bool = False,
+) -> Iterator[Tuple[Tuple[Step, ...], str]]:
+    """Yield ``(steps, text)`` for every string leaf of ``value`` in document order.
+
+    The value is walked in place with an explicit stack, so deep payloads do
+    not hit the recursion limit and nothing is serialized. Values under a key
+    in ``skip_keys`` or at a path in ``skip_paths`` (``usage.*``,
+    ``data[*].id``) are skipped with their subtrees. Integers (phone or card
+    numbers stored as numbers) are yielded as text unless ``scan_numbers`` is
+    off. Floats, booleans and nulls never are: the digits of a float's
+    fraction would only produce false card and phone matches. With
+    ``scan_keys`` mapping keys are yielded too, at the path of their value.
+    """
+    keys = frozenset(skip_keys)
+    patterns = tuple(_compile_skip(path) for path in skip_paths)
+    stack: List[Tuple[Tuple[Step, ...], Any]] = [((), value)]
+    while stack:
+        steps, node = stack.pop()
+        if patterns and steps and _skipped(steps, patterns):
+            continue
+        if isinstance(node, str):
+            yield steps, node
+        elif isinstance(node, dict):
+            children = []
+            for key, child in node.items():
+                if key in keys:
+                    continue
+                if scan_keys and isinstance(key, str):
+                    yield steps + (key,), key
+                children.append((steps + (key,), child))
+            stack.extend(reversed(children))
+        elif isinstance(node, (list, tuple)):
+            stack.extend((steps + (index,), child) for index, child in reversed(list(enumerate(node))))
+        elif scan_numbers and isinstance(node, int) and not isinstance(node, bool):
+            yield steps, str(node)
+
+
+def scan_structured(
+    value: Any,
+    engine: Optional["ComplianceEngine"] = None,
+    request_id: Optional[str] = None,
+    skip_keys: Iterable[str] = (),
+    skip_paths: Iterable[str] = (),
+    scan_numbers: bool = True,
+    scan_keys: bool = False,
+    tenant: Optional[str] = None,
+) -> StructuredScanResult:
+    """Scan the string leaves of a JSON-like value and report the path of every hit.
+
+    Leaves are joined with NUL characters, which no built-in rule matches
+    across, and scanned once. Critical PII and secret matches are mapped back to the
+    leaf they occur in; soft hints only contribute to ``result``.
+    """
+    from .scanner import ComplianceEngine
+
+    engine = engine or ComplianceEngine()
+    leaf_steps: List[Tuple[Step, ...]] = []
+    pieces: List[str] = []
+    offsets: List[int] = []
+    position = 0
+    for steps, text in iter_string_leaves(value, skip_keys, skip_paths, scan_numbers, scan_keys):
+        leaf_steps.append(steps)
+        pieces.append(text)
+        offsets.append(position)
+        position += len(text) + len(LEAF_SEPARATOR)
+    joined = LEAF_SEPARATOR.join(pieces)
+
+    if not joined.strip():
+        result = engine.evaluate([])
+        engine._emit_event(result, len(joined), request_id, tenant)
+        return StructuredScanResult(result=result, hits=[], leaves=len(pieces), scanned_chars=len(joined))
+
+    result = engine.scan(joined, request_id=request_id, tenant=tenant)
+    hits = []
+    # locating spans costs another pass, so only do it when something matched
+    if any(issue.matches for issue in result.issues):
+        for span in find_spans(joined):
+            leaf = bisect_right(offsets, span.start) - 1
+            hits.append(
+                StructuredHit(
+                    path=format_path(leaf_steps[leaf]),
+                    category=span.category,
+                    rules=span.rules,
+                    start=span.start - offsets[leaf],
+                    end=min(span.end - offsets[leaf], len(pieces[leaf])),
+                )
+            )
+    return StructuredScanResult(result=result, hits=hits, leaves=len(pieces), scanned_chars=len(joined))
@@ -0,0 +1,103 @@
+"""Read recent audit events from the end of a JSONL log."""
+
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class EventFilter:
+    event_type: Optional[str] = None
+    category: Optional[str] = None
+    blocked: Optional[bool] = None
+
+    def matches(self, record: Dict[str, Any]) -> bool:
+        if self.event_type is not None and record.get("event_type") != self.event_type:
+            return False
+        metadata = record.get("metadata") or {}
+        if self.category is not None and metadata.get("category") != self.category:
+            return False
+        if self.blocked is not None and bool(metadata.get("blocked")) != self.blocked:
+            return False
+        return True
+
+
+@dataclass(frozen=True)
+class TailPage:
+    events: List[Dict[str, Any]] = field(default_factory=list)
+    next_cursor: Optional[int] = None
+
+
+def iter_lines_reversed(
+    path: Path,
+    before: Optional[int] = None,
+    block_size: int = 64 * 1024,
+) -> Iterator[Tuple[int, bytes]]:
+    """Yield ``(offset, line)`` pairs from newest to oldest, starting below byte ``before``."""
+    with path.open("rb") as handle:
+        handle.seek(0, os.SEEK_END)
+        end = handle.tell() if before is None else min(before, handle.tell())
+        position = end
+        remainder = b""
+        while position > 0:
+            read_size = min(block_size, position)
+            position -= read_size
+            handle.seek(position)
+            block = handle.read(read_size) + remainder
+            lines = block.split(b"\n")
+            remainder = lines[0]
+            offset = position + len(remainder) + 1
+            tail: List[Tuple[int, bytes]] = []
+            for line in lines[1:]:
+                tail.append((offset, line))
+                offset += len(line) + 1
+            for item in reversed(tail):
+                if item[1].strip():
+                    yield item
+        if remainder.strip():
+            yield 0, remainder
+
+
+def read_tail(
+    path: Path,
+    limit: int = 200,
+    before: Optional[int] = None,
+    event_filter: Optional[EventFilter] = None,
+    max_scan_bytes: int = 16 * 1024 * 1024,
+) -> TailPage:
+    """Return up to ``limit`` matching events ending at byte offset ``before`` (oldest first).
+
+    Only the end of the file is read. ``next_cursor`` is the offset to pass as
+    ``before`` for the previous page, or ``None`` once the start of the file is
+    reached. A selective filter stops after ``max_scan_bytes`` and returns a
+    cursor where it stopped, so a request never reads the whole log.
+    """
+    if limit <= 0 or not path.exists():
+        return TailPage()
+
+    events: List[Dict[str, Any]] = []
+    cursor: Optional[int] = None
+    start: Optional[int] = None
+    for offset, line in iter_lines_reversed(path, before=before):
+        if start is None:
+            start = offset + len(line)
+        elif start - offset > max_scan_bytes:
+            break
+        cursor = offset
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        if event_filter is None or event_filter.matches(record):
+            events.append(record)
+            if len(events) >= limit:
+                break
+    else:
+        cursor = None
+
+    events.reverse()
+    return TailPage(events=events, next_cursor=cursor or None)
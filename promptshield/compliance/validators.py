@@ -0,0 +1,58 @@
+"""Validators that confirm digit-based pattern matches."""
+
+from __future__ import annotations
+
+_DIGITS = "0123456789"
+
+
+def digit_count(text: str) -> int:
+    """Count ASCII digits; cheap enough to run before any digit-based regex."""
+    return sum(map(text.count, _DIGITS))
+
+
+def _digits(value: str) -> str:
+    return "".join(char for char in value if char in _DIGITS)
+
+
+def luhn_valid(value: str) -> bool:
+    """Card number check: 13-19 digits, a major-network leading digit and a valid Luhn checksum."""
+    digits = _digits(value)
+    if not 13 <= len(digits) <= 19 or digits[0] not in "23456":
+        return False
+    total = 0
+    for index, char in enumerate(reversed(digits)):
+        digit = ord(char) - 48
+        if index % 2:
+            digit *= 2
+            if digit > 9:
+                digit -= 9
+        total += digit
+    return total % 10 == 0
+
+
+def ssn_valid(value: str) -> bool:
+    """US SSN structure: area not 000, 666 or 9xx; group not 00; serial not 0000."""
+    digits = _digits(value)
+    if len(digits) != 9:
+        return False
+    area, group, serial = digits[:3], digits[3:5], digits[5:]
+    if area in ("000", "666") or area[0] == "9":
+        return False
+    return group != "00" and serial != "0000"
+
+
+def _nanp_valid(digits: str) -> bool:
+    # area code and exchange both start with 2-9
+    return len(digits) == 10 and digits[0] in "23456789" and digits[3] in "23456789"
+
+
+def phone_plausible(value: str) -> bool:
+    """Plausible phone number: a valid NANP number, or E.164 (``+``, 11-15 digits)."""
+    if "\n" in value:
+        return False
+    digits = _digits(value)
+    if len(digits) == 11 and digits[0] == "1":
+        return _nanp_valid(digits[1:])
+    if value.lstrip().startswith("+"):
+        return 11 <= len(digits) <= 15 and digits[0] != "0"
+    return _nanp_valid(digits)
@@ -2,44 +2,147 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import AsyncIterator, Optional
+
+from promptshield.compliance.store import SQLiteAuditStore
+from promptshield.compliance.tail import EventFilter, TailPage, read_tail
+
+from .rollups import RESOLUTIONS, RollupAggregator
+from .stream import EventBroadcaster, LogFollower, sse_stream
 
 try:
     from fastapi import FastAPI
-    from fastapi.responses import HTMLResponse, JSONResponse
+    from fastapi.responses import HTMLResponse, JSONResponse, StreamingResponse
 except ImportError as exc:  # pragma: no cover - optional dependency
     raise ImportError(
         "Dashboard requires fastapi. Install with: pip install promptshield[dashboard]"
     ) from exc
 
 
-def _load_events(path: Path, limit: int = 200) -> List[dict]:
-    if not path.exists():
-        return []
+def _load_events(
+    path: Path,
+    limit: int = 200,
+    before: Optional[int] = None,
+    event_filter: Optional[EventFilter] = None,
+) -> TailPage:
+    return read_tail(path, limit=limit, before=before, event_filter=event_filter)
 
-    lines = path.read_text(encoding="utf-8").splitlines()
-    data: List[dict] = []
-    for line in lines[-limit:]:
-        try:
-            data.append(json.loads(line))
-        except json.JSONDecodeError:
-            continue
-    return data
 
+def create_app(
+    audit_log_path: str = "audit.log.jsonl",
+    audit_db_path: Optional[str] = None,
+    follow_log: bool = True,
+    rollup_snapshot_path: Optional[str] = None,
+    rollup_snapshot_interval: float = 60.0,
+) -> FastAPI:
+    """Build the dashboard app.
+
+    ``/events/stream`` pushes new events to connected clients. By default they
+    come from following the audit log; with ``follow_log=False`` feed them
+    in-process instead via ``app.state.broadcaster.publish_security_event``
+    as an ``event_sink``.
 
-def create_app(audit_log_path: str = "audit.log.jsonl") -> FastAPI:
-    app = FastAPI(title="PromptShield Dashboard")
+    Every event seen by the broadcaster also updates per-minute and per-hour
+    rollups served from ``/rollups/{resolution}``. They are snapshotted to
+    ``rollup_snapshot_path`` (default ``<audit log>.rollups.json``) and
+    reloaded, with the log position, on start.
+    """
     log_path = Path(audit_log_path)
+    store = SQLiteAuditStore(audit_db_path) if audit_db_path else None
+    follower = LogFollower(log_path) if follow_log else None
+    broadcaster = EventBroadcaster(follower)
+    rollups = RollupAggregator(snapshot_path=rollup_snapshot_path or f"{log_path}.rollups.json")
+    broadcaster.listeners.append(rollups.add)
+
+    async def _save_rollups() -> None:
+        # the pump publishes a batch and advances the position without yielding to the
+        # loop, so counters and position taken here in one step always agree
+        snapshot = rollups.snapshot(broadcaster.position)
+        await asyncio.to_thread(rollups.write, snapshot)
+
+    async def _snapshot_rollups() -> None:
+        while True:
+            await asyncio.sleep(rollup_snapshot_interval)
+            await _save_rollups()
+
+    @asynccontextmanager
+    async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+        position = await asyncio.to_thread(rollups.load)
+        if follower is not None and position is not None:
+            follower.resume(*position)
+        broadcaster.start()
+        snapshots = asyncio.create_task(_snapshot_rollups())
+        try:
+            yield
+        finally:
+            snapshots.cancel()
+            await broadcaster.stop()
+            await _save_rollups()
+
+    app = FastAPI(title="PromptShield Dashboard", lifespan=lifespan)
+    app.state.broadcaster = broadcaster
+    app.state.rollups = rollups
 
     @app.get("/health")
     async def health() -> dict:
         return {"status": "ok"}
 
     @app.get("/events")
-    async def events(limit: int = 200) -> JSONResponse:
-        return JSONResponse(_load_events(log_path, limit=limit))
+    async def events(
+        limit: int = 200,
+        before: Optional[int] = None,
+        event_type: Optional[str] = None,
+        category: Optional[str] = None,
+        blocked: Optional[bool] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+    ) -> JSONResponse:
+        if store is not None:
+            rows = store.query(
+                event_type=event_type,
+                category=category,
+                blocked=blocked,
+                since=since,
+                until=until,
+                limit=limit,
+            )
+            return JSONResponse(rows[::-1])
+        page = _load_events(
+            log_path,
+            limit=min(limit, 1000),
+            before=before,
+            event_filter=EventFilter(event_type=event_type, category=category, blocked=blocked),
+        )
+        headers = {"X-Next-Cursor": str(page.next_cursor)} if page.next_cursor is not None else None
+        return JSONResponse(page.events, headers=headers)
+
+    @app.get("/events/stream")
+    async def event_stream() -> StreamingResponse:
+        return StreamingResponse(
+            sse_stream(broadcaster),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
+    @app.get("/rollups/{resolution}")
+    async def rollup_buckets(resolution: str, since: Optional[str] = None, limit: int = 60) -> JSONResponse:
+        if resolution not in RESOLUTIONS:
+            return JSONResponse({"error": f"resolution must be one of {sorted(RESOLUTIONS)}"}, status_code=404)
+        try:
+            since_dt = datetime.fromisoformat(since) if since else None
+        except ValueError:
+            return JSONResponse({"error": "since must be an ISO 8601 timestamp"}, status_code=400)
+        return JSONResponse(rollups.query(resolution, since=since_dt, limit=limit))
+
+    @app.get("/stats/categories")
+    async def category_stats(blocked: Optional[bool] = None, since: Optional[str] = None) -> JSONResponse:
+        if store is None:
+            return JSONResponse({"error": "requires audit_db_path"}, status_code=404)
+        return JSONResponse(store.counts_by_category(blocked=blocked, since=since))
 
     @app.get("/")
     async def index() -> HTMLResponse:
@@ -57,16 +160,26 @@ def create_app(audit_log_path: str = "audit.log.jsonl") -> FastAPI:
           </head>
           <body>
             <h1>PromptShield Events</h1>
-            <p>Showing recent audit events from <code>audit.log.jsonl</code>.</p>
+            <p>Showing recent audit events from <code>audit.log.jsonl</code> (live).</p>
             <pre id="events">Loading...</pre>
             <script>
+              const view = document.getElementById('events');
+              let events = [];
+              const render = () => { view.textContent = JSON.stringify(events, null, 2); };
               fetch('/events')
                 .then(res => res.json())
                 .then(data => {
-                  document.getElementById('events').textContent = JSON.stringify(data, null, 2);
+                  events = data.reverse();
+                  render();
+                  const source = new EventSource('/events/stream');
+                  source.onmessage = (msg) => {
+                    events.unshift(JSON.parse(msg.data));
+                    events = events.slice(0, 200);
+                    render();
+                  };
                 })
                 .catch(() => {
-                  document.getElementById('events').textContent = 'Failed to load events.';
+                  view.textContent = 'Failed to load events.';
                 });
             </script>
           </body>
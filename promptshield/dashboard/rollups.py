@@ -0,0 +1,182 @@
+"""Incremental, time-bucketed rollups of audit events."""
+
+from __future__ import annotations
+
+import json
+import math
+import os
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from promptshield.engine.events import SecurityEvent
+
+RESOLUTIONS: Dict[str, int] = {"minute": 60, "hour": 3600}
+RISK_BINS = 10
+
+
+def _finite(value: Any, default: Optional[float]) -> Optional[float]:
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return default
+    return number if math.isfinite(number) else default
+
+
+@dataclass
+class RollupBucket:
+    total: int = 0
+    blocked: int = 0
+    weight: float = 0.0
+    categories: Dict[str, int] = field(default_factory=dict)
+    event_types: Dict[str, int] = field(default_factory=dict)
+    risk_histogram: List[int] = field(default_factory=lambda: [0] * RISK_BINS)
+
+    def add(self, event_type: str, metadata: Dict[str, Any]) -> None:
+        self.total += 1
+        # values written by other tools may be missing or malformed; count the event anyway
+        self.weight += _finite(metadata.get("sample_weight"), 1.0)
+        if metadata.get("blocked"):
+            self.blocked += 1
+        category = str(metadata.get("category", "NONE"))
+        self.categories[category] = self.categories.get(category, 0) + 1
+        self.event_types[event_type] = self.event_types.get(event_type, 0) + 1
+        risk_score = _finite(metadata.get("risk_score"), None)
+        if risk_score is not None:
+            index = min(RISK_BINS - 1, max(0, int(risk_score) * RISK_BINS // 100))
+            self.risk_histogram[index] += 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "total": self.total,
+            "blocked": self.blocked,
+            "weight": self.weight,
+            "categories": dict(self.categories),
+            "event_types": dict(self.event_types),
+            "risk_histogram": list(self.risk_histogram),
+        }
+
+
+class RollupAggregator:
+    """Keep per-minute and per-hour counters for events as they arrive.
+
+    Each resolution retains a fixed number of buckets, so memory and query
+    cost are bounded regardless of total event volume. Counters can be
+    snapshotted to JSON and reloaded on start.
+    """
+
+    def __init__(
+        self,
+        retention: Optional[Dict[str, int]] = None,
+        snapshot_path: Optional[str] = None,
+    ) -> None:
+        self.retention = retention or {"minute": 24 * 60, "hour": 30 * 24}
+        self.snapshot_path = Path(snapshot_path) if snapshot_path else None
+        self._lock = threading.Lock()
+        self._buckets: Dict[str, Dict[int, RollupBucket]] = {name: {} for name in RESOLUTIONS}
+        self._latest: Dict[str, int] = {name: 0 for name in RESOLUTIONS}
+
+    def add(self, record: Dict[str, Any]) -> None:
+        """Count one audit record (the JSONL shape written by ``AuditLogger``)."""
+        timestamp = record.get("timestamp")
+        try:
+            epoch = datetime.fromisoformat(str(timestamp)).timestamp()
+        except ValueError:
+            return
+        self._add(epoch, str(record.get("event_type", "")), record.get("metadata") or {})
+
+    def log_security_event(self, event: SecurityEvent) -> None:
+        self._add(event.timestamp.timestamp(), event.event_type, event.metadata)
+
+    def _add(self, epoch: float, event_type: str, metadata: Dict[str, Any]) -> None:
+        with self._lock:
+            for name, seconds in RESOLUTIONS.items():
+                start = int(epoch // seconds) * seconds
+                buckets = self._buckets[name]
+                bucket = buckets.get(start)
+                if bucket is None:
+                    if start < self._latest[name] - self.retention[name] * seconds:
+                        continue
+                    bucket = buckets[start] = RollupBucket()
+                    if start > self._latest[name]:
+                        self._latest[name] = start
+                        self._prune(name)
+                bucket.add(event_type, metadata)
+
+    def _prune(self, name: str) -> None:
+        buckets = self._buckets[name]
+        if len(buckets) <= self.retention[name]:
+            return
+        cutoff = self._latest[name] - self.retention[name] * RESOLUTIONS[name]
+        for start in [start for start in buckets if start <= cutoff]:
+            del buckets[start]
+
+    def query(
+        self,
+        resolution: str = "minute",
+        since: Optional[datetime] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Return buckets (oldest first) with block rate, category mix and risk histogram."""
+        if resolution not in RESOLUTIONS:
+            raise ValueError(f"resolution must be one of {sorted(RESOLUTIONS)}")
+        since_epoch = since.timestamp() if since else None
+        with self._lock:
+            items = sorted(self._buckets[resolution].items())
+            if since_epoch is not None:
+                items = [(start, bucket) for start, bucket in items if start + RESOLUTIONS[resolution] > since_epoch]
+            if limit is not None:
+                items = items[-limit:] if limit > 0 else []
+            rows = [(start, bucket.to_dict()) for start, bucket in items]
+        return [
+            {
+                "start": datetime.fromtimestamp(start, timezone.utc).isoformat(),
+                "block_rate": data["blocked"] / data["total"] if data["total"] else 0.0,
+                **data,
+            }
+            for start, data in rows
+        ]
+
+    def snapshot(self, position: Optional[Tuple[int, int]] = None) -> Dict[str, Any]:
+        """Copy the counters, with the log ``position`` they cover, for :meth:`write`."""
+        with self._lock:
+            return {
+                "position": list(position) if position else None,
+                "buckets": {
+                    name: {str(start): bucket.to_dict() for start, bucket in buckets.items()}
+                    for name, buckets in self._buckets.items()
+                },
+            }
+
+    def save(self, position: Optional[Tuple[int, int]] = None) -> None:
+        self.write(self.snapshot(position))
+
+    def write(self, snapshot: Dict[str, Any]) -> None:
+        """Write a :meth:`snapshot` to ``snapshot_path``."""
+        if self.snapshot_path is None:
+            return
+        payload = json.dumps(snapshot)
+        tmp_path = self.snapshot_path.with_name(f"{self.snapshot_path.name}.tmp")
+        tmp_path.write_text(payload, encoding="utf-8")
+        os.replace(tmp_path, self.snapshot_path)
+
+    def load(self) -> Optional[Tuple[int, int]]:
+        """Restore counters from the snapshot file; returns the saved log position."""
+        if self.snapshot_path is None or not self.snapshot_path.exists():
+            return None
+        try:
+            data = json.loads(self.snapshot_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        with self._lock:
+            for name, buckets in data.get("buckets", {}).items():
+                if name not in RESOLUTIONS:
+                    continue
+                restored = {int(start): RollupBucket(**values) for start, values in buckets.items()}
+                self._buckets[name] = restored
+                self._latest[name] = max(restored, default=0)
+                self._prune(name)
+        position = data.get("position")
+        return (int(position[0]), int(position[1])) if position else None
@@ -0,0 +1,230 @@
+"""Live audit event streaming for the dashboard."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+from dataclasses import asdict
+from pathlib import Path
+from typing import IO, Any, AsyncIterator, Callable, Dict, List, Optional, Set, Tuple
+
+from promptshield.engine.events import SecurityEvent
+
+logger = logging.getLogger(__name__)
+
+
+class LogFollower:
+    """Incrementally read new lines from an append-only JSONL log.
+
+    Tracks the byte offset of the open file and reopens the path when it is
+    rotated (inode change) or truncated, after draining the old file.
+    """
+
+    def __init__(self, path: Path, from_start: bool = False) -> None:
+        self.path = path
+        self.from_start = from_start
+        self._seek_end = not from_start
+        self._handle: Optional[IO[bytes]] = None
+        self._inode: Optional[int] = None
+        self._offset = 0
+        self._partial = b""
+        self._resume: Optional[Tuple[int, int]] = None
+
+    @property
+    def offset(self) -> int:
+        return self._offset
+
+    @property
+    def position(self) -> Optional[Tuple[int, int]]:
+        """``(inode, offset)`` of the last complete line read, for :meth:`resume`."""
+        if self._inode is None:
+            return None
+        return self._inode, self._offset - len(self._partial)
+
+    def resume(self, inode: int, offset: int) -> None:
+        """Continue from a saved :attr:`position` if the log has not been rotated since."""
+        self.close()
+        self._resume = (inode, offset)
+
+    def poll(self) -> List[Dict[str, Any]]:
+        records: List[Dict[str, Any]] = []
+        if self._handle is None:
+            opened = self._open(not self._seek_end)
+            # a log created after we started following is read from its first line
+            self._seek_end = False
+            if not opened:
+                return records
+        records.extend(self._read_available())
+
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return records
+        if stat.st_ino != self._inode or stat.st_size < self._offset:
+            self.close()
+            if self._open(True):
+                records.extend(self._read_available())
+        return records
+
+    def reset(self) -> None:
+        """Close the log; the next poll starts following from the current end again."""
+        self.close()
+        self._seek_end = not self.from_start
+
+    def close(self) -> None:
+        if self._handle is not None:
+            self._handle.close()
+        self._handle = None
+        self._inode = None
+        self._offset = 0
+        self._partial = b""
+
+    def _open(self, from_start: bool) -> bool:
+        try:
+            handle = self.path.open("rb")
+        except FileNotFoundError:
+            return False
+        stat = os.fstat(handle.fileno())
+        self._inode = stat.st_ino
+        self._offset = 0 if from_start else stat.st_size
+        if self._resume is not None:
+            inode, offset = self._resume
+            if inode == stat.st_ino and offset <= stat.st_size:
+                self._offset = offset
+            self._resume = None
+        self._handle = handle
+        return True
+
+    def _read_available(self) -> List[Dict[str, Any]]:
+        assert self._handle is not None
+        self._handle.seek(self._offset)
+        chunk = self._handle.read()
+        if not chunk:
+            return []
+        self._offset += len(chunk)
+        lines = (self._partial + chunk).split(b"\n")
+        self._partial = lines.pop()
+        records: List[Dict[str, Any]] = []
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+        return records
+
+
+class EventBroadcaster:
+    """Fan out audit events from one shared reader to many subscribers.
+
+    Each subscriber has its own bounded queue; when a slow client's queue is
+    full its oldest event is dropped, so it never stalls the reader or other
+    clients. Events can also be published in-process (for example from an
+    ``event_sink``) through :meth:`publish_security_event`.
+
+    Listeners (such as rollup aggregators) are called synchronously for every
+    event and keep the reader running while no client is connected.
+    """
+
+    def __init__(
+        self,
+        follower: Optional[LogFollower] = None,
+        poll_interval: float = 0.5,
+        client_queue_size: int = 1000,
+    ) -> None:
+        self.follower = follower
+        self.poll_interval = poll_interval
+        self.client_queue_size = client_queue_size
+        self.dropped = 0
+        self.listeners: List[Callable[[Dict[str, Any]], None]] = []
+        self.position: Optional[Tuple[int, int]] = None
+        self._subscribers: Set[asyncio.Queue] = set()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def start(self) -> None:
+        """Start following the log; must run on the event loop."""
+        self._loop = asyncio.get_running_loop()
+        if self.follower is not None and (self._task is None or self._task.done()):
+            self._task = asyncio.create_task(self._pump())
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    def add_subscriber(self) -> asyncio.Queue:
+        """Register a client queue; must run on the event loop."""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.client_queue_size)
+        self._subscribers.add(queue)
+        self.start()
+        return queue
+
+    def remove_subscriber(self, queue: asyncio.Queue) -> None:
+        self._subscribers.discard(queue)
+
+    def publish(self, record: Dict[str, Any]) -> None:
+        """Deliver ``record`` to every listener and subscriber; must run on the event loop."""
+        for listener in self.listeners:
+            listener(record)
+        for queue in self._subscribers:
+            if queue.full():
+                queue.get_nowait()
+                self.dropped += 1
+            queue.put_nowait(record)
+
+    def publish_security_event(self, event: SecurityEvent) -> None:
+        """Thread-safe event sink that forwards ``event`` to connected clients."""
+        loop = self._loop
+        if loop is None or loop.is_closed() or not (self._subscribers or self.listeners):
+            return
+        record = {**asdict(event), "timestamp": event.timestamp.isoformat()}
+        loop.call_soon_threadsafe(self.publish, record)
+
+    async def _pump(self) -> None:
+        assert self.follower is not None
+        follower = self.follower
+        try:
+            records = await asyncio.to_thread(follower.poll)
+            if not self.listeners:
+                records = []  # clients only see events written after they connect
+            while True:
+                for record in records:
+                    try:
+                        self.publish(record)
+                    except Exception as exc:
+                        # one bad record must not stop the stream for every client
+                        logger.warning("Skipping audit record the dashboard could not handle: %s", exc)
+                self.position = follower.position
+                if not (self._subscribers or self.listeners):
+                    break
+                await asyncio.sleep(self.poll_interval)
+                records = await asyncio.to_thread(follower.poll)
+        finally:
+            follower.reset()
+
+
+async def sse_stream(broadcaster: EventBroadcaster, heartbeat: float = 15.0) -> AsyncIterator[str]:
+    """Format broadcast events as Server-Sent Events, with periodic keep-alives."""
+    queue = broadcaster.add_subscriber()
+    try:
+        while True:
+            try:
+                record = await asyncio.wait_for(queue.get(), timeout=heartbeat)
+            except asyncio.TimeoutError:
+                yield ": keep-alive\n\n"
+                continue
+            yield f"data: {json.dumps(record)}\n\n"
+    finally:
+        broadcaster.remove_subscriber(queue)
@@ -1,6 +1,8 @@
 """Core scanning engine."""
 
 from .config import EngineConfig, Thresholds
+from .dispatch import DispatcherStats, EventDispatcher, OverflowPolicy
+from .sampling import SamplingPolicy, SamplingSink
 from .context import Message, PromptContext, build_context
 from .scanner import PromptShieldEngine, scan_messages, scan_prompt
 from .types import RiskCategory
@@ -8,6 +10,11 @@ from .types import RiskCategory
 __all__ = [
     "EngineConfig",
     "Thresholds",
+    "EventDispatcher",
+    "DispatcherStats",
+    "OverflowPolicy",
+    "SamplingPolicy",
+    "SamplingSink",
     "Message",
     "PromptContext",
     "build_context",
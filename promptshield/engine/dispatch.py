@@ -0,0 +1,206 @@
+"""Queued, non-blocking event dispatch."""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from enum import Enum
+from typing import Callable, Deque, Iterable, List, Optional, Sequence
+
+from .config import EventSink
+from .events import SecurityEvent
+
+logger = logging.getLogger(__name__)
+
+BatchEventSink = Callable[[Sequence[SecurityEvent]], None]
+
+
+class OverflowPolicy(str, Enum):
+    DROP_OLDEST = "drop_oldest"
+    DROP_ALLOWED = "drop_allowed"
+    BLOCK = "block"
+
+
+@dataclass(frozen=True)
+class DispatcherStats:
+    queue_depth: int
+    enqueued: int
+    delivered: int
+    dropped: int
+    dropped_allowed: int
+    sink_errors: int
+
+
+def is_blocked_event(event: SecurityEvent) -> bool:
+    return bool(event.metadata.get("blocked"))
+
+
+class EventDispatcher:
+    """Deliver security events to sinks from a background worker thread.
+
+    An instance is itself an event sink, so it can be passed as
+    ``EngineConfig(event_sink=...)`` or ``ComplianceConfig(event_sink=...)``.
+    """
+
+    def __init__(
+        self,
+        sinks: Iterable[EventSink] = (),
+        batch_sinks: Iterable[BatchEventSink] = (),
+        max_queue: int = 10_000,
+        batch_size: int = 256,
+        flush_interval: float = 0.05,
+        overflow: OverflowPolicy | str = OverflowPolicy.DROP_OLDEST,
+    ) -> None:
+        if max_queue < 1:
+            raise ValueError("max_queue must be >= 1")
+        if batch_size < 1:
+            raise ValueError("batch_size must be >= 1")
+        self.sinks: List[EventSink] = list(sinks)
+        self.batch_sinks: List[BatchEventSink] = list(batch_sinks)
+        if not self.sinks and not self.batch_sinks:
+            raise ValueError("EventDispatcher requires at least one sink")
+        self.max_queue = max_queue
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.overflow = OverflowPolicy(overflow)
+
+        self._queue: Deque[SecurityEvent] = deque()
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+        self._idle = threading.Condition(self._lock)
+        self._in_flight = 0
+        self._closed = False
+
+        self._enqueued = 0
+        self._delivered = 0
+        self._dropped = 0
+        self._dropped_allowed = 0
+        self._sink_errors = 0
+
+        self._worker = threading.Thread(target=self._run, name="promptshield-events", daemon=True)
+        self._worker.start()
+        atexit.register(self.close)
+
+    def __call__(self, event: SecurityEvent) -> None:
+        self.submit(event)
+
+    def submit(self, event: SecurityEvent) -> bool:
+        """Queue an event; return False if it was dropped."""
+        with self._lock:
+            if self._closed:
+                self._dropped += 1
+                return False
+            if len(self._queue) >= self.max_queue and not self._make_room(event):
+                return False
+            self._queue.append(event)
+            self._enqueued += 1
+            if len(self._queue) >= self.batch_size:
+                self._not_empty.notify()
+        return True
+
+    def _make_room(self, event: SecurityEvent) -> bool:
+        if self.overflow is OverflowPolicy.BLOCK:
+            while len(self._queue) >= self.max_queue and not self._closed:
+                self._not_empty.notify()
+                self._not_full.wait()
+            if self._closed:
+                self._dropped += 1
+                return False
+            return True
+
+        if self.overflow is OverflowPolicy.DROP_ALLOWED:
+            for idx, queued in enumerate(self._queue):
+                if not is_blocked_event(queued):
+                    del self._queue[idx]
+                    self._dropped += 1
+                    self._dropped_allowed += 1
+                    return True
+            if not is_blocked_event(event):
+                self._dropped += 1
+                self._dropped_allowed += 1
+                return False
+
+        dropped = self._queue.popleft()
+        self._dropped += 1
+        if not is_blocked_event(dropped):
+            self._dropped_allowed += 1
+        return True
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every queued event has been delivered."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._lock:
+            self._not_empty.notify()
+            while self._queue or self._in_flight:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._idle.wait(remaining)
+        return True
+
+    def close(self, timeout: Optional[float] = 5.0) -> None:
+        """Deliver pending events and stop the worker thread."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._not_empty.notify_all()
+            self._not_full.notify_all()
+        self._worker.join(timeout)
+        atexit.unregister(self.close)
+
+    def stats(self) -> DispatcherStats:
+        with self._lock:
+            return DispatcherStats(
+                queue_depth=len(self._queue),
+                enqueued=self._enqueued,
+                delivered=self._delivered,
+                dropped=self._dropped,
+                dropped_allowed=self._dropped_allowed,
+                sink_errors=self._sink_errors,
+            )
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                if not self._queue and not self._closed:
+                    self._not_empty.wait(self.flush_interval)
+                if not self._queue:
+                    if self._closed:
+                        return
+                    continue
+                count = min(self.batch_size, len(self._queue))
+                batch = [self._queue.popleft() for _ in range(count)]
+                self._in_flight = count
+                self._not_full.notify_all()
+
+            errors = self._deliver(batch)
+
+            with self._lock:
+                self._in_flight = 0
+                self._delivered += count
+                self._sink_errors += errors
+                if not self._queue:
+                    self._idle.notify_all()
+
+    def _deliver(self, batch: List[SecurityEvent]) -> int:
+        errors = 0
+        for batch_sink in self.batch_sinks:
+            try:
+                batch_sink(batch)
+            except Exception as exc:  # pragma: no cover - defensive
+                errors += 1
+                logger.warning("Batch event sink failed: %s", exc)
+        for sink in self.sinks:
+            for event in batch:
+                try:
+                    sink(event)
+                except Exception as exc:  # pragma: no cover - defensive
+                    errors += 1
+                    logger.warning("Event sink failed: %s", exc)
+        return errors
@@ -0,0 +1,93 @@
+"""Deterministic sampling of security events."""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from dataclasses import dataclass, field, replace
+from typing import Dict, Optional
+
+from .config import EventSink
+from .events import SecurityEvent
+
+_HASH_SPACE = float(1 << 64)
+
+
+@dataclass(frozen=True)
+class SamplingPolicy:
+    """Which events to keep.
+
+    Blocked events and events with ``risk_score >= keep_risk_score`` are always
+    kept. Other events are kept at the tenant rate, else the category rate,
+    else ``default_rate``. Engines record the tenant when a scan is given
+    one (``engine.scan(..., tenant="acme")``).
+    """
+
+    default_rate: float = 1.0
+    category_rates: Dict[str, float] = field(default_factory=dict)
+    tenant_rates: Dict[str, float] = field(default_factory=dict)
+    keep_risk_score: int = 70
+    key_field: str = "request_id"
+    tenant_field: str = "tenant"
+
+    def rate_for(self, event: SecurityEvent) -> float:
+        metadata = event.metadata
+        if metadata.get("blocked") or int(metadata.get("risk_score") or 0) >= self.keep_risk_score:
+            return 1.0
+        tenant = metadata.get(self.tenant_field)
+        if tenant is not None and str(tenant) in self.tenant_rates:
+            rate = self.tenant_rates[str(tenant)]
+        else:
+            rate = self.category_rates.get(str(metadata.get("category")), self.default_rate)
+        return max(0.0, min(1.0, rate))
+
+    def sample_key(self, event: SecurityEvent) -> str:
+        key = event.metadata.get(self.key_field)
+        if key is not None:
+            return str(key)
+        return f"{event.event_type}|{event.timestamp.isoformat()}|{event.message}"
+
+
+def sample_fraction(key: str) -> float:
+    """Map ``key`` to a stable value in [0, 1)."""
+    digest = hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big") / _HASH_SPACE
+
+
+@dataclass(frozen=True)
+class SamplingStats:
+    seen: int
+    kept: int
+    dropped: int
+
+
+class SamplingSink:
+    """Event sink that forwards a deterministic sample of events to ``sink``.
+
+    The keep decision hashes the event's ``request_id`` (when present), so all
+    events of one request are kept or dropped together. Forwarded events carry
+    ``metadata["sample_weight"] = 1 / rate`` for re-weighting aggregates.
+    """
+
+    def __init__(self, sink: EventSink, policy: Optional[SamplingPolicy] = None) -> None:
+        self.sink = sink
+        self.policy = policy or SamplingPolicy()
+        self._lock = threading.Lock()
+        self._seen = 0
+        self._kept = 0
+
+    def __call__(self, event: SecurityEvent) -> None:
+        rate = self.policy.rate_for(event)
+        keep = rate >= 1.0 or (rate > 0.0 and sample_fraction(self.policy.sample_key(event)) < rate)
+        with self._lock:
+            self._seen += 1
+            if keep:
+                self._kept += 1
+        if not keep:
+            return
+        metadata = {**event.metadata, "sample_weight": 1.0 / rate}
+        self.sink(replace(event, metadata=metadata))
+
+    def stats(self) -> SamplingStats:
+        with self._lock:
+            return SamplingStats(seen=self._seen, kept=self._kept, dropped=self._seen - self._kept)
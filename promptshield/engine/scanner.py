@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from functools import lru_cache
 from typing import Iterable, Optional
 
 from .config import EngineConfig
@@ -33,18 +34,29 @@ class PromptShieldEngine:
         prompt: Optional[str] = None,
         system_prompt: Optional[str] = None,
         messages: Optional[MessageSequence] = None,
+        request_id: Optional[str] = None,
+        tenant: Optional[str] = None,
     ) -> ScanResult:
         context = build_context(prompt=prompt, system_prompt=system_prompt, messages=messages)
-        return self._scan_context(context)
+        return self._scan_context(context, request_id=request_id, tenant=tenant)
 
     def scan_messages(
         self,
         messages: MessageSequence,
         system_prompt: Optional[str] = None,
+        request_id: Optional[str] = None,
+        tenant: Optional[str] = None,
     ) -> ScanResult:
-        return self.scan(prompt=None, system_prompt=system_prompt, messages=messages)
+        return self.scan(
+            prompt=None, system_prompt=system_prompt, messages=messages, request_id=request_id, tenant=tenant
+        )
 
-    def _scan_context(self, context: PromptContext) -> ScanResult:
+    def _scan_context(
+        self,
+        context: PromptContext,
+        request_id: Optional[str] = None,
+        tenant: Optional[str] = None,
+    ) -> ScanResult:
         signals = [detector.detect(context) for detector in self.detectors]
 
         risk_score, category, confidence, explanation = aggregate_risk(
@@ -67,24 +79,35 @@ class PromptShieldEngine:
             },
         )
 
-        self._emit_event(context, result)
+        self._emit_event(context, result, request_id, tenant)
         return result
 
-    def _emit_event(self, context: PromptContext, result: ScanResult) -> None:
+    def _emit_event(
+        self,
+        context: PromptContext,
+        result: ScanResult,
+        request_id: Optional[str] = None,
+        tenant: Optional[str] = None,
+    ) -> None:
         if not self.config.event_sink:
             return
 
+        metadata = {
+            "risk_score": result.risk_score,
+            "blocked": result.block,
+            "category": result.category,
+            "confidence": result.confidence,
+            "prompt_length": len(context.prompt),
+            "message_count": len(context.messages),
+        }
+        if request_id is not None:
+            metadata["request_id"] = request_id
+        if tenant is not None:
+            metadata["tenant"] = tenant
         event = SecurityEvent(
             event_type="promptshield.scan",
             message="Prompt scanned",
-            metadata={
-                "risk_score": result.risk_score,
-                "blocked": result.block,
-                "category": result.category,
-                "confidence": result.confidence,
-                "prompt_length": len(context.prompt),
-                "message_count": len(context.messages),
-            },
+            metadata=metadata,
         )
         try:
             self.config.event_sink(event)
@@ -92,16 +115,18 @@ class PromptShieldEngine:
             logger.warning("Event sink failed: %s", exc)
 
 
-_DEFAULT_ENGINE = PromptShieldEngine()
+@lru_cache(maxsize=None)
+def _default_engine() -> PromptShieldEngine:
+    return PromptShieldEngine()
 
 
 def scan_prompt(prompt: str, system_prompt: Optional[str] = None) -> ScanResult:
     """Scan a prompt (and optional system prompt) for attack signals."""
     if prompt is None or not str(prompt).strip():
         raise ValueError("prompt must be a non-empty string")
-    return _DEFAULT_ENGINE.scan(prompt=str(prompt), system_prompt=system_prompt)
+    return _default_engine().scan(prompt=str(prompt), system_prompt=system_prompt)
 
 
 def scan_messages(messages: MessageSequence, system_prompt: Optional[str] = None) -> ScanResult:
     """Scan a multi-turn message list for attack signals."""
-    return _DEFAULT_ENGINE.scan_messages(messages=messages, system_prompt=system_prompt)
+    return _default_engine().scan_messages(messages=messages, system_prompt=system_prompt)
@@ -1,14 +1,23 @@
 """Red-team tooling for PromptShield."""
 
-from .packs import AttackPack, AttackCase, load_attack_pack
-from .runner import run_attack_pack, RedTeamRun
-from .report import write_reports
+from .cache import PackCache
+from .packs import AttackPack, AttackCase, combine_packs, load_attack_pack, resolve_pack_paths
+from .runner import iter_attack_pack, run_attack_pack, RedTeamRun
+from .parallel import WorkerTiming, run_attack_pack_parallel
+from .report import StreamingReportWriter, write_reports
 
 __all__ = [
     "AttackPack",
     "AttackCase",
     "load_attack_pack",
+    "resolve_pack_paths",
+    "combine_packs",
+    "PackCache",
     "run_attack_pack",
+    "iter_attack_pack",
     "RedTeamRun",
+    "run_attack_pack_parallel",
+    "WorkerTiming",
     "write_reports",
+    "StreamingReportWriter",
 ]
@@ -0,0 +1,124 @@
+"""On-disk cache of parsed, validated attack packs."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+from dataclasses import asdict
+from importlib import resources
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+from promptshield.engine.types import Message
+
+if TYPE_CHECKING:
+    from .packs import AttackPack
+
+logger = logging.getLogger(__name__)
+
+# bump when AttackPack/AttackCase, pack normalization or the entry format change
+CACHE_VERSION = 2
+
+
+def default_cache_dir() -> Path:
+    override = os.getenv("PROMPTSHIELD_PACK_CACHE")
+    if override:
+        return Path(override)
+    base = os.getenv("XDG_CACHE_HOME") or os.path.join(Path.home(), ".cache")
+    return Path(base) / "promptshield" / "packs"
+
+
+def _schema_digest() -> str:
+    schema = resources.files("promptshield.redteam").joinpath("schema.json").read_bytes()
+    return hashlib.sha256(schema).hexdigest()
+
+
+def _pack_to_json(pack: "AttackPack") -> Dict[str, Any]:
+    data = asdict(pack)
+    data["source_path"] = str(pack.source_path)
+    return data
+
+
+def _pack_from_json(data: Dict[str, Any]) -> "AttackPack":
+    from .packs import AttackCase, AttackPack
+
+    attacks = [
+        AttackCase(**{**case, "messages": [Message(**message) for message in case["messages"]]})
+        for case in data["attacks"]
+    ]
+    return AttackPack(**{**data, "attacks": attacks, "source_path": Path(data["source_path"])})
+
+
+class PackCache:
+    """Validated ``AttackPack``s keyed by path, mtime and content hash.
+
+    A hit skips YAML parsing and schema validation. Entries also depend on
+    the cache format version and the pack schema, so changing either
+    invalidates them. Lookups go to memory first, then to ``directory``.
+
+    Entries are stored as plain JSON, never as pickles, so a cache
+    directory writable by others cannot run code. Only the newest entry
+    per pack file is kept. Packs whose metadata does not survive a JSON
+    round trip (dates, non-string keys) are not cached.
+    """
+
+    def __init__(self, directory: Optional[Path] = None) -> None:
+        self.directory = Path(directory) if directory is not None else default_cache_dir()
+        self._memory: Dict[str, "AttackPack"] = {}
+        self._schema: Optional[str] = None
+
+    def key(self, path: Path, content: bytes) -> str:
+        """``<path digest>-<entry digest>``; entries for one file share the prefix."""
+        if self._schema is None:
+            self._schema = _schema_digest()
+        resolved = str(path.resolve())
+        digest = hashlib.sha256()
+        for part in (str(CACHE_VERSION), self._schema, resolved, str(path.stat().st_mtime_ns)):
+            digest.update(part.encode("utf-8") + b"\0")
+        digest.update(hashlib.sha256(content).digest())
+        prefix = hashlib.sha256(resolved.encode("utf-8")).hexdigest()[:16]
+        return f"{prefix}-{digest.hexdigest()}"
+
+    def get(self, key: str) -> Optional["AttackPack"]:
+        pack = self._memory.get(key)
+        if pack is not None:
+            return pack
+        try:
+            with (self.directory / f"{key}.json").open("r", encoding="utf-8") as handle:
+                pack = _pack_from_json(json.load(handle))
+        except FileNotFoundError:
+            return None
+        except Exception as exc:  # pragma: no cover - defensive
+            logger.warning("Ignoring unreadable pack cache entry %s: %s", key, exc)
+            return None
+        self._memory[key] = pack
+        return pack
+
+    def put(self, key: str, pack: "AttackPack") -> None:
+        data = _pack_to_json(pack)
+        try:
+            payload = json.dumps(data)
+            cacheable = json.loads(payload) == data
+        except (TypeError, ValueError):
+            cacheable = False
+        if not cacheable:
+            logger.debug("Not caching %s: it does not round-trip through JSON", pack.source_path)
+            return
+        prefix = key.split("-", 1)[0]
+        for stale in [cached for cached in self._memory if cached.startswith(f"{prefix}-")]:
+            del self._memory[stale]
+        self._memory[key] = pack
+        try:
+            self.directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+            target = self.directory / f"{key}.json"
+            temporary = target.with_suffix(f".{os.getpid()}.tmp")
+            temporary.write_text(payload, encoding="utf-8")
+            os.replace(temporary, target)
+            # earlier versions of the same pack file can never be hit again
+            for stale in self.directory.glob(f"{prefix}-*.json"):
+                if stale != target:
+                    stale.unlink(missing_ok=True)
+        except OSError as exc:  # pragma: no cover - defensive
+            logger.warning("Could not write pack cache entry %s: %s", key, exc)
@@ -2,14 +2,20 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import glob
+import os
+from collections import Counter
+from dataclasses import dataclass, field, replace
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Sequence
 
 from promptshield.engine.context import normalize_messages
 from promptshield.engine.types import Message
 
-from .schema import validate_attack_pack_data
+if TYPE_CHECKING:
+    from .cache import PackCache
+
+PACK_SUFFIXES = (".yaml", ".yml")
 
 
 @dataclass(frozen=True)
@@ -35,7 +41,7 @@ class AttackPack:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-def _load_yaml(path: Path) -> Dict[str, Any]:
+def _load_yaml(content: bytes) -> Dict[str, Any]:
     try:
         import yaml
     except ImportError as exc:  # pragma: no cover - optional dependency
@@ -43,20 +49,37 @@ def _load_yaml(path: Path) -> Dict[str, Any]:
             "PyYAML is required for attack packs. Install with: pip install promptshield[redteam]"
         ) from exc
 
-    with path.open("r", encoding="utf-8") as handle:
-        data = yaml.safe_load(handle) or {}
+    # the libyaml-backed loader is several times faster when PyYAML was built with it
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    data = yaml.load(content, Loader=loader) or {}
 
     if not isinstance(data, dict):
         raise ValueError("Attack pack must be a YAML mapping")
     return data
 
 
-def load_attack_pack(path_str: str) -> AttackPack:
+def load_attack_pack(path_str: str, cache: Optional["PackCache"] = None) -> AttackPack:
+    """Load and validate a pack; with ``cache``, unchanged packs are returned from it."""
     path = Path(path_str)
     if not path.exists():
         raise FileNotFoundError(f"Attack pack not found: {path}")
 
-    data = _load_yaml(path)
+    content = path.read_bytes()
+    if cache is None:
+        return _parse_attack_pack(path, content)
+    key = cache.key(path, content)
+    pack = cache.get(key)
+    if pack is None:
+        pack = _parse_attack_pack(path, content)
+        cache.put(key, pack)
+    # the entry may have been stored under another spelling of the same path
+    return pack if pack.source_path == path else replace(pack, source_path=path)
+
+
+def _parse_attack_pack(path: Path, content: bytes) -> AttackPack:
+    from .schema import validate_attack_pack_data
+
+    data = _load_yaml(content)
     errors = validate_attack_pack_data(data)
     if errors:
         formatted = "\n".join(f"- {error}" for error in errors)
@@ -102,3 +125,65 @@ def load_attack_pack(path_str: str) -> AttackPack:
         source_path=path,
         metadata=metadata,
     )
+
+
+def resolve_pack_paths(inputs: Iterable[str]) -> List[Path]:
+    """Expand files, directories (their ``*.yaml``/``*.yml``) and glob patterns, without duplicates."""
+    paths: List[Path] = []
+    for item in inputs:
+        if os.path.isdir(item):
+            matches = sorted(str(path) for path in Path(item).iterdir() if path.suffix in PACK_SUFFIXES)
+        elif glob.has_magic(item):
+            matches = sorted(glob.glob(item, recursive=True))
+            if not matches:
+                raise FileNotFoundError(f"No attack packs match: {item}")
+        else:
+            matches = [item]
+        paths.extend(Path(match) for match in matches)
+    unique: Dict[Path, Path] = {}
+    for path in paths:
+        unique.setdefault(path.resolve(), path)
+    return list(unique.values())
+
+
+def combine_packs(packs: Sequence[AttackPack]) -> AttackPack:
+    """Merge packs into one for a single run and report.
+
+    Attack ids are prefixed with their pack file's stem (``starter/attack-1``),
+    or with its path from the packs' common directory (``web/starter/attack-1``)
+    when several files share a stem. The packs are listed in
+    ``metadata["packs"]``. Raises ``ValueError`` if ids still collide.
+    """
+    if len(packs) == 1:
+        return packs[0]
+    if not packs:
+        raise ValueError("No attack packs to combine")
+    resolved = [pack.source_path.resolve() for pack in packs]
+    root = Path(os.path.commonpath([str(path.parent) for path in resolved]))
+    stems = Counter(path.stem for path in resolved)
+    attacks = []
+    for pack, path in zip(packs, resolved):
+        label = path.stem if stems[path.stem] == 1 else path.relative_to(root).with_suffix("").as_posix()
+        attacks.extend(replace(case, attack_id=f"{label}/{case.attack_id}") for case in pack.attacks)
+    counts = Counter(case.attack_id for case in attacks)
+    duplicates = sorted(attack_id for attack_id, count in counts.items() if count > 1)
+    if duplicates:
+        raise ValueError(f"Duplicate attack ids across packs: {', '.join(duplicates)}")
+    return AttackPack(
+        name=f"combined ({len(packs)} packs)",
+        version="combined",
+        description=", ".join(pack.name for pack in packs),
+        attacks=attacks,
+        source_path=root,
+        metadata={
+            "packs": [
+                {
+                    "name": pack.name,
+                    "version": pack.version,
+                    "source_path": str(pack.source_path),
+                    "attacks": len(pack.attacks),
+                }
+                for pack in packs
+            ]
+        },
+    )
@@ -0,0 +1,127 @@
+"""Run attack packs across a pool of worker processes."""
+
+from __future__ import annotations
+
+import os
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Callable, Deque, Dict, Iterator, List, Optional, Tuple
+
+from promptshield import PromptShieldEngine
+
+from .packs import AttackCase, AttackPack
+from .runner import AttackOutcome, RedTeamRun, run_attack_pack, run_case
+
+EngineFactory = Callable[[], PromptShieldEngine]
+
+_ENGINE: Optional[PromptShieldEngine] = None
+
+
+@dataclass(frozen=True)
+class WorkerTiming:
+    """Time one worker process spent scanning cases (excluding engine start-up)."""
+
+    pid: int
+    cases: int
+    chunks: int
+    seconds: float
+
+
+def _init_worker(engine_factory: EngineFactory) -> None:
+    global _ENGINE
+    _ENGINE = engine_factory()
+    # the first scan compiles patterns and fills caches; keep it out of the timings
+    _ENGINE.scan(prompt="warm up")
+
+
+def _run_chunk(
+    cases: List[AttackCase],
+    threshold: int,
+    system_prompt: Optional[str],
+) -> Tuple[List[AttackOutcome], int, float]:
+    assert _ENGINE is not None
+    started = time.perf_counter()
+    outcomes = [run_case(_ENGINE, case, threshold, system_prompt) for case in cases]
+    return outcomes, os.getpid(), time.perf_counter() - started
+
+
+def iter_attack_pack_chunks(
+    pack: AttackPack,
+    threshold: int = 70,
+    system_prompt: Optional[str] = None,
+    workers: Optional[int] = None,
+    chunk_size: int = 256,
+    engine_factory: EngineFactory = PromptShieldEngine,
+) -> Iterator[Tuple[List[AttackOutcome], int, float]]:
+    """Yield ``(outcomes, worker pid, scan seconds)`` per chunk of cases, in pack order.
+
+    Each of the ``workers`` processes (default: CPU count) builds and warms
+    one engine with ``engine_factory``, which must be picklable (e.g. a
+    module-level function). At most two chunks per worker are in flight.
+    """
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(engine_factory,)) as pool:
+        pending: Deque[Future] = deque()
+        for offset in range(0, len(pack.attacks), chunk_size):
+            chunk = pack.attacks[offset : offset + chunk_size]
+            pending.append(pool.submit(_run_chunk, chunk, threshold, system_prompt))
+            if len(pending) >= workers * 2:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+class TimingCollector:
+    """Per-worker totals from the chunks of ``iter_attack_pack_chunks``."""
+
+    def __init__(self) -> None:
+        self._totals: Dict[int, Tuple[int, int, float]] = {}
+
+    def add(self, outcomes: List[AttackOutcome], pid: int, seconds: float) -> None:
+        cases, chunks, total = self._totals.get(pid, (0, 0, 0.0))
+        self._totals[pid] = (cases + len(outcomes), chunks + 1, total + seconds)
+
+    def timings(self) -> List[WorkerTiming]:
+        return [WorkerTiming(pid, *self._totals[pid]) for pid in sorted(self._totals)]
+
+
+def run_attack_pack_parallel(
+    pack: AttackPack,
+    threshold: int = 70,
+    system_prompt: Optional[str] = None,
+    workers: Optional[int] = None,
+    chunk_size: int = 256,
+    engine_factory: EngineFactory = PromptShieldEngine,
+) -> Tuple[RedTeamRun, List[WorkerTiming]]:
+    """Like ``run_attack_pack``, spread over ``workers`` processes (see ``iter_attack_pack_chunks``).
+
+    Results keep the pack's case order. Returns the run and the per-worker
+    timings, sorted by process id.
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1:
+        started = time.perf_counter()
+        run = run_attack_pack(pack, threshold=threshold, system_prompt=system_prompt, engine=engine_factory())
+        timing = WorkerTiming(os.getpid(), len(run.results), 1, time.perf_counter() - started)
+        return run, [timing]
+
+    started_at = datetime.now(timezone.utc)
+    results: List[AttackOutcome] = []
+    collector = TimingCollector()
+    for outcomes, pid, seconds in iter_attack_pack_chunks(
+        pack, threshold, system_prompt, workers, chunk_size, engine_factory
+    ):
+        results.extend(outcomes)
+        collector.add(outcomes, pid, seconds)
+
+    run = RedTeamRun(
+        pack=pack,
+        results=results,
+        threshold=threshold,
+        started_at=started_at,
+        finished_at=datetime.now(timezone.utc),
+    )
+    return run, collector.timings()
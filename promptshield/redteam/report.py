@@ -7,9 +7,10 @@ import shlex
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List
+from typing import IO, Dict, List, Optional
 
-from .runner import RedTeamRun, summarize_run
+from .packs import AttackPack
+from .runner import AttackOutcome, RedTeamRun, RunSummary, summarize_run
 
 
 @dataclass(frozen=True)
@@ -19,6 +20,14 @@ class ReportPaths:
     repro_script_path: Path
 
 
+@dataclass(frozen=True)
+class StreamingReportPaths:
+    jsonl_path: Path
+    markdown_path: Path
+    repro_script_path: Path
+    summary_path: Path
+
+
 def _slugify(value: str) -> str:
     return "".join(ch.lower() if ch.isalnum() else "-" for ch in value).strip("-")
 
@@ -28,59 +37,113 @@ def _timestamp() -> str:
 
 
 def _run_id(run: RedTeamRun) -> str:
-    return f"{_slugify(run.pack.name)}_{_timestamp()}"
+    return _pack_run_id(run.pack)
+
+
+def _pack_run_id(pack: AttackPack) -> str:
+    return f"{_slugify(pack.name)}_{_timestamp()}"
+
+
+def _pack_json(pack: AttackPack) -> Dict[str, object]:
+    return {
+        "name": pack.name,
+        "version": pack.version,
+        "description": pack.description,
+        "source_path": str(pack.source_path),
+        "metadata": pack.metadata,
+    }
+
+
+def _result_json(result: AttackOutcome) -> Dict[str, object]:
+    return {
+        "id": result.case.attack_id,
+        "category": result.case.category or result.scan.category,
+        "prompt": result.case.prompt,
+        "messages": [
+            {"role": message.role, "content": message.content}
+            for message in result.case.messages
+        ]
+        if result.case.messages
+        else None,
+        "system_prompt": result.system_prompt,
+        "block": result.block,
+        "risk_score": result.scan.risk_score,
+        "confidence": result.scan.confidence,
+        "explanation": result.scan.explanation,
+        "expect_block": result.case.expect_block,
+        "matched_expected": result.matched_expected,
+        "metadata": result.case.metadata,
+        "signals": [
+            {
+                "name": signal.name,
+                "category": signal.category,
+                "score": signal.score,
+                "confidence": signal.confidence,
+                "explanation": signal.explanation,
+                "matches": signal.matches,
+            }
+            for signal in result.scan.signals
+        ],
+    }
 
 
 def _render_json(run: RedTeamRun) -> Dict[str, object]:
     summary = summarize_run(run)
     return {
-        "pack": {
-            "name": run.pack.name,
-            "version": run.pack.version,
-            "description": run.pack.description,
-            "source_path": str(run.pack.source_path),
-            "metadata": run.pack.metadata,
-        },
+        "pack": _pack_json(run.pack),
         "threshold": run.threshold,
         "started_at": run.started_at.isoformat(),
         "finished_at": run.finished_at.isoformat(),
         "summary": summary,
-        "results": [
-            {
-                "id": result.case.attack_id,
-                "category": result.case.category or result.scan.category,
-                "prompt": result.case.prompt,
-                "messages": [
-                    {"role": message.role, "content": message.content}
-                    for message in result.case.messages
-                ]
-                if result.case.messages
-                else None,
-                "system_prompt": result.system_prompt,
-                "block": result.block,
-                "risk_score": result.scan.risk_score,
-                "confidence": result.scan.confidence,
-                "explanation": result.scan.explanation,
-                "expect_block": result.case.expect_block,
-                "matched_expected": result.matched_expected,
-                "metadata": result.case.metadata,
-                "signals": [
-                    {
-                        "name": signal.name,
-                        "category": signal.category,
-                        "score": signal.score,
-                        "confidence": signal.confidence,
-                        "explanation": signal.explanation,
-                        "matches": signal.matches,
-                    }
-                    for signal in result.scan.signals
-                ],
-            }
-            for result in run.results
-        ],
+        "results": [_result_json(result) for result in run.results],
     }
 
 
+def _summary_markdown(summary: Dict[str, object]) -> List[str]:
+    return [
+        "## Summary",
+        "",
+        f"- Total attacks: {summary['total']}",
+        f"- Blocked: {summary['blocked']}",
+        f"- Allowed: {summary['allowed']}",
+        f"- Expected mismatches: {summary['expected_mismatches']}",
+        "",
+    ]
+
+
+def _result_markdown(result: AttackOutcome) -> List[str]:
+    lines: List[str] = []
+    status = "BLOCKED" if result.block else "ALLOWED"
+    lines.append(f"### {result.case.attack_id} — {status}")
+    lines.append("")
+    lines.append(f"- Category: {result.case.category or result.scan.category}")
+    lines.append(f"- Risk score: {result.scan.risk_score}")
+    lines.append(f"- Confidence: {result.scan.confidence:.2f}")
+    lines.append(f"- Explanation: {result.scan.explanation}")
+    if result.case.expect_block is not None:
+        lines.append(f"- Expected block: {result.case.expect_block}")
+        lines.append(f"- Matched expected: {result.matched_expected}")
+    if result.system_prompt:
+        lines.append("- System prompt override: yes")
+    lines.append("")
+
+    if result.case.messages:
+        lines.append("Messages:")
+        lines.append("")
+        lines.append("```text")
+        for message in result.case.messages:
+            lines.append(f"[{message.role.upper()}] {message.content}")
+        lines.append("```")
+    else:
+        lines.append("Prompt:")
+        lines.append("")
+        lines.append("```text")
+        lines.append(result.case.prompt or "")
+        lines.append("```")
+    lines.append("")
+    return lines
+
+
 def _render_markdown(run: RedTeamRun) -> str:
     summary = summarize_run(run)
     lines: List[str] = []
@@ -91,70 +154,40 @@ def _render_markdown(run: RedTeamRun) -> str:
     lines.append(f"- Started: {run.started_at.isoformat()}")
     lines.append(f"- Finished: {run.finished_at.isoformat()}")
     lines.append("")
-    lines.append("## Summary")
-    lines.append("")
-    lines.append(f"- Total attacks: {summary['total']}")
-    lines.append(f"- Blocked: {summary['blocked']}")
-    lines.append(f"- Allowed: {summary['allowed']}")
-    lines.append(f"- Expected mismatches: {summary['expected_mismatches']}")
-    lines.append("")
+    lines.extend(_summary_markdown(summary))
     lines.append("## Results")
     lines.append("")
 
     for result in run.results:
-        status = "BLOCKED" if result.block else "ALLOWED"
-        lines.append(f"### {result.case.attack_id} — {status}")
-        lines.append("")
-        lines.append(f"- Category: {result.case.category or result.scan.category}")
-        lines.append(f"- Risk score: {result.scan.risk_score}")
-        lines.append(f"- Confidence: {result.scan.confidence:.2f}")
-        lines.append(f"- Explanation: {result.scan.explanation}")
-        if result.case.expect_block is not None:
-            lines.append(f"- Expected block: {result.case.expect_block}")
-            lines.append(f"- Matched expected: {result.matched_expected}")
-        if result.system_prompt:
-            lines.append("- System prompt override: yes")
-        lines.append("")
-
-        if result.case.messages:
-            lines.append("Messages:")
-            lines.append("")
-            lines.append("```text")
-            for message in result.case.messages:
-                lines.append(f"[{message.role.upper()}] {message.content}")
-            lines.append("```")
-        else:
-            lines.append("Prompt:")
-            lines.append("")
-            lines.append("```text")
-            lines.append(result.case.prompt or "")
-            lines.append("```")
-        lines.append("")
+        lines.extend(_result_markdown(result))
 
     return "\n".join(lines)
 
 
+_REPRO_HEADER = ["#!/usr/bin/env bash", "set -euo pipefail", ""]
+
+
+def _repro_line(result: AttackOutcome) -> str:
+    if result.case.messages:
+        payload = json.dumps(
+            [{"role": msg.role, "content": msg.content} for msg in result.case.messages]
+        )
+        payload_arg = shlex.quote(payload)
+        if result.system_prompt:
+            system_prompt = shlex.quote(result.system_prompt)
+            return f"promptshield scan --system {system_prompt} --messages {payload_arg}"
+        return f"promptshield scan --messages {payload_arg}"
+    prompt = shlex.quote(result.case.prompt or "")
+    if result.system_prompt:
+        system_prompt = shlex.quote(result.system_prompt)
+        return f"promptshield scan --system {system_prompt} {prompt}"
+    return f"promptshield scan {prompt}"
+
+
 def _render_repro_script(run: RedTeamRun) -> str:
-    lines: List[str] = ["#!/usr/bin/env bash", "set -euo pipefail", ""]
+    lines: List[str] = list(_REPRO_HEADER)
     for result in run.results:
-        if result.case.messages:
-            payload = json.dumps(
-                [{"role": msg.role, "content": msg.content} for msg in result.case.messages]
-            )
-            payload_arg = shlex.quote(payload)
-            if result.system_prompt:
-                system_prompt = shlex.quote(result.system_prompt)
-                line = f"promptshield scan --system {system_prompt} --messages {payload_arg}"
-            else:
-                line = f"promptshield scan --messages {payload_arg}"
-        else:
-            prompt = shlex.quote(result.case.prompt or "")
-            if result.system_prompt:
-                system_prompt = shlex.quote(result.system_prompt)
-                line = f"promptshield scan --system {system_prompt} {prompt}"
-            else:
-                line = f"promptshield scan {prompt}"
-        lines.append(line)
+        lines.append(_repro_line(result))
     lines.append("")
     return "\n".join(lines)
 
@@ -182,3 +215,94 @@ def write_reports(run: RedTeamRun, reports_dir: str = "reports") -> ReportPaths:
         markdown_path=markdown_path,
         repro_script_path=repro_script_path,
     )
+
+
+class StreamingReportWriter:
+    """Write a run's reports incrementally as outcomes are produced.
+
+    Each outcome is appended to a JSONL file, a Markdown results section and
+    the repro script, then dropped; only ``RunSummary`` counters are kept.
+    ``close`` appends the summary to the Markdown report and writes it, with
+    the pack details and run times, to a sidecar ``.summary.json``. When the
+    run was aborted (``close(error)``, or an exception leaving the ``with``
+    block) both are marked incomplete and name the error.
+    """
+
+    def __init__(self, pack: AttackPack, threshold: int = 70, reports_dir: str = "reports") -> None:
+        output_dir = Path(reports_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        run_id = _pack_run_id(pack)
+        self.paths = StreamingReportPaths(
+            jsonl_path=output_dir / f"{run_id}.jsonl",
+            markdown_path=output_dir / f"{run_id}.md",
+            repro_script_path=output_dir / f"{run_id}.sh",
+            summary_path=output_dir / f"{run_id}.summary.json",
+        )
+        self.pack = pack
+        self.threshold = threshold
+        self.summary = RunSummary()
+        self.started_at = datetime.now(timezone.utc)
+        self._jsonl: Optional[IO[str]] = self.paths.jsonl_path.open("w", encoding="utf-8")
+        self._markdown = self.paths.markdown_path.open("w", encoding="utf-8")
+        self._repro = self.paths.repro_script_path.open("w", encoding="utf-8")
+
+        header = [
+            f"# PromptShield Red-Team Report: {pack.name}",
+            "",
+            f"- Pack version: {pack.version}",
+            f"- Threshold: {threshold}",
+            f"- Started: {self.started_at.isoformat()}",
+            "",
+            "## Results",
+            "",
+        ]
+        self._markdown.write("\n".join(header) + "\n")
+        self._repro.write("\n".join(_REPRO_HEADER) + "\n")
+
+    def add(self, result: AttackOutcome) -> None:
+        assert self._jsonl is not None, "writer is closed"
+        self.summary.add(result)
+        self._jsonl.write(json.dumps(_result_json(result)) + "\n")
+        self._markdown.write("\n".join(_result_markdown(result)) + "\n")
+        self._repro.write(_repro_line(result) + "\n")
+
+    def close(self, error: Optional[BaseException] = None) -> StreamingReportPaths:
+        if self._jsonl is None:
+            return self.paths
+        finished_at = datetime.now(timezone.utc)
+        summary = self.summary.as_dict()
+        lines = _summary_markdown(summary)
+        reason: Optional[str] = None
+        if error is None:
+            lines.insert(2, f"- Finished: {finished_at.isoformat()}")
+        else:
+            reason = f"{type(error).__name__}: {error}" if str(error) else type(error).__name__
+            lines[2:2] = [f"- Aborted: {finished_at.isoformat()} ({reason})", "- Complete: no"]
+        self._markdown.write("\n".join(lines))
+        for handle in (self._jsonl, self._markdown, self._repro):
+            handle.close()
+        self._jsonl = None
+
+        payload = {
+            "pack": _pack_json(self.pack),
+            "threshold": self.threshold,
+            "started_at": self.started_at.isoformat(),
+            "finished_at": finished_at.isoformat(),
+            "complete": error is None,
+            "summary": summary,
+            "results_path": str(self.paths.jsonl_path),
+        }
+        if reason is not None:
+            payload["error"] = reason
+        self.paths.summary_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        try:
+            self.paths.repro_script_path.chmod(0o755)
+        except OSError:
+            pass
+        return self.paths
+
+    def __enter__(self) -> "StreamingReportWriter":
+        return self
+
+    def __exit__(self, exc_type: object, exc: Optional[BaseException], traceback: object) -> None:
+        self.close(exc)
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 
 from promptshield import PromptShieldEngine
 from promptshield.engine.verdict import ScanResult
@@ -30,6 +30,46 @@ class RedTeamRun:
     finished_at: datetime
 
 
+def run_case(
+    engine: PromptShieldEngine,
+    case: AttackCase,
+    threshold: int = 70,
+    system_prompt: Optional[str] = None,
+) -> AttackOutcome:
+    run_system_prompt = system_prompt if system_prompt is not None else case.system_prompt
+    if case.messages:
+        messages = list(case.messages)
+        if case.prompt:
+            messages.append({"role": "user", "content": case.prompt})
+        scan = engine.scan_messages(messages=messages, system_prompt=run_system_prompt)
+    else:
+        scan = engine.scan(prompt=case.prompt, system_prompt=run_system_prompt)
+    block = scan.risk_score >= threshold
+    if case.expect_block is None:
+        matched_expected = None
+    else:
+        matched_expected = block == case.expect_block
+    return AttackOutcome(
+        case=case,
+        scan=scan,
+        block=block,
+        matched_expected=matched_expected,
+        system_prompt=run_system_prompt,
+    )
+
+
+def iter_attack_pack(
+    pack: AttackPack,
+    threshold: int = 70,
+    system_prompt: Optional[str] = None,
+    engine: Optional[PromptShieldEngine] = None,
+) -> Iterator[AttackOutcome]:
+    """Yield each case's outcome as soon as it is scanned."""
+    engine = engine or PromptShieldEngine()
+    for case in pack.attacks:
+        yield run_case(engine, case, threshold, system_prompt)
+
+
 def run_attack_pack(
     pack: AttackPack,
     threshold: int = 70,
@@ -37,33 +77,7 @@ def run_attack_pack(
     engine: Optional[PromptShieldEngine] = None,
 ) -> RedTeamRun:
     started_at = datetime.now(timezone.utc)
-    results: List[AttackOutcome] = []
-
-    engine = engine or PromptShieldEngine()
-
-    for case in pack.attacks:
-        run_system_prompt = system_prompt if system_prompt is not None else case.system_prompt
-        if case.messages:
-            messages = list(case.messages)
-            if case.prompt:
-                messages.append({"role": "user", "content": case.prompt})
-            scan = engine.scan_messages(messages=messages, system_prompt=run_system_prompt)
-        else:
-            scan = engine.scan(prompt=case.prompt, system_prompt=run_system_prompt)
-        block = scan.risk_score >= threshold
-        if case.expect_block is None:
-            matched_expected = None
-        else:
-            matched_expected = block == case.expect_block
-        results.append(
-            AttackOutcome(
-                case=case,
-                scan=scan,
-                block=block,
-                matched_expected=matched_expected,
-                system_prompt=run_system_prompt,
-            )
-        )
+    results = list(iter_attack_pack(pack, threshold=threshold, system_prompt=system_prompt, engine=engine))
 
     finished_at = datetime.now(timezone.utc)
     return RedTeamRun(
@@ -75,23 +89,34 @@ def run_attack_pack(
     )
 
 
-def summarize_run(run: RedTeamRun) -> Dict[str, object]:
-    total = len(run.results)
-    blocked = sum(1 for result in run.results if result.block)
-    allowed = total - blocked
-    expected_mismatches = sum(
-        1 for result in run.results if result.matched_expected is False
-    )
+class RunSummary:
+    """Running counters behind ``summarize_run``, fed one outcome at a time."""
 
-    by_category: Dict[str, int] = {}
-    for result in run.results:
+    def __init__(self) -> None:
+        self.total = 0
+        self.blocked = 0
+        self.expected_mismatches = 0
+        self.by_category: Dict[str, int] = {}
+
+    def add(self, result: AttackOutcome) -> None:
+        self.total += 1
+        self.blocked += result.block
+        self.expected_mismatches += result.matched_expected is False
         category = result.case.category or result.scan.category
-        by_category[category] = by_category.get(category, 0) + 1
-
-    return {
-        "total": total,
-        "blocked": blocked,
-        "allowed": allowed,
-        "expected_mismatches": expected_mismatches,
-        "by_category": by_category,
-    }
+        self.by_category[category] = self.by_category.get(category, 0) + 1
+
+    def as_dict(self) -> Dict[str, object]:
+        return {
+            "total": self.total,
+            "blocked": self.blocked,
+            "allowed": self.total - self.blocked,
+            "expected_mismatches": self.expected_mismatches,
+            "by_category": dict(self.by_category),
+        }
+
+
+def summarize_run(run: RedTeamRun) -> Dict[str, object]:
+    summary = RunSummary()
+    for result in run.results:
+        summary.add(result)
+    return summary.as_dict()
@@ -0,0 +1,420 @@
+"""Pure ASGI middleware for PromptShield."""
+
+from __future__ import annotations
+
+import codecs
+import json
+import re
+from collections import deque
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from promptshield import PromptShieldEngine
+from promptshield.compliance.scanner import ComplianceEngine
+from promptshield.compliance.streaming import StreamingComplianceScanner
+
+from .extract import CompiledProfile, ExtractionProfile, FieldPath, compile_path, text_of
+
+Scope = MutableMapping[str, Any]
+Message = MutableMapping[str, Any]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+ASGIApp = Callable[[Scope, Receive, Send], Awaitable[None]]
+
+_MUTATING_METHODS = frozenset({"POST", "PUT", "PATCH"})
+_TEXT_CONTENT_TYPES = (b"text/", b"application/json", b"+json")
+# a blank line ends an SSE event; lines may end in CRLF, LF or CR
+_EVENT_BOUNDARY = re.compile(rb"\r\n\r\n|\r\r|\n\n")
+
+
+def _header(scope: Scope, name: bytes) -> Optional[bytes]:
+    for key, value in scope.get("headers", ()):
+        if key.lower() == name:
+            return value
+    return None
+
+
+def _block_payload(result: Any, error: str = "blocked") -> Dict[str, Any]:
+    return {
+        "error": error,
+        "risk_score": result.risk_score,
+        "category": result.category,
+        "confidence": result.confidence,
+        "explanation": result.explanation,
+    }
+
+
+async def send_json(send: Send, status_code: int, content: Dict[str, Any]) -> None:
+    body = json.dumps(content).encode("utf-8")
+    await send(
+        {
+            "type": "http.response.start",
+            "status": status_code,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode("ascii")),
+            ],
+        }
+    )
+    await send({"type": "http.response.body", "body": body})
+
+
+def replay_receive(messages: List[Message], receive: Receive) -> Receive:
+    """Return a ``receive`` that yields ``messages`` first, then defers to ``receive``."""
+    pending = list(messages)
+
+    async def _receive() -> Message:
+        if pending:
+            return pending.pop(0)
+        return await receive()
+
+    return _receive
+
+
+SSE_TEXT_PATHS = (
+    "choices[*].delta.content",
+    "choices[*].text",
+    "delta.text",
+    "text",
+    "content",
+)
+
+
+def sse_event_text(event: bytes, text_paths: Tuple[FieldPath, ...]) -> str:
+    """Return the generated text carried by one Server-Sent Event.
+
+    The ``data`` lines are joined; JSON payloads contribute the strings at
+    ``text_paths`` (OpenAI/Anthropic delta chunks), anything else is used
+    verbatim.
+    """
+    lines = event.decode("utf-8", errors="replace").splitlines()
+    data = "\n".join(line[5:].removeprefix(" ") for line in lines if line.startswith("data:"))
+    if not data or data == "[DONE]":
+        return ""
+    if data[0] not in "{[":
+        return data
+    try:
+        payload = json.loads(data)
+    except json.JSONDecodeError:
+        return data
+    for path in text_paths:
+        texts = [text for text in map(text_of, path.extract(payload)) if text]
+        if texts:
+            return "".join(texts)
+    return ""
+
+
+def _tail_start(data: bytes, chars: int) -> int:
+    """Byte offset at which the last ``chars`` UTF-8 characters of ``data`` start."""
+    position = len(data)
+    while chars > 0 and position > 0:
+        position -= 1
+        if data[position] & 0xC0 != 0x80:  # not a continuation byte
+            chars -= 1
+    return position
+
+
+class ResponseGuard:
+    """Wraps ``send`` to run compliance scanning over a response as it is sent.
+
+    A response sent in a single body message is scanned whole and replaced by
+    a JSON error if it blocks. Streamed responses (``more_body``) are fed to a
+    :class:`StreamingComplianceScanner`, and the last ``overlap`` characters of
+    output are held back until the next chunk has been scanned. For
+    ``text/event-stream`` the text of each event (see :func:`sse_event_text`)
+    is scanned and only whole events are released.
+
+    When a chunk blocks, the stream is cut: SSE clients receive a final
+    ``promptshield.blocked`` event, other responses simply end.
+
+    Responses that are neither text nor JSON, or that carry a
+    ``content-encoding`` (gzip, br, ...), are passed through unscanned. The
+    streaming scanner is only created once a streamed response needs it.
+    """
+
+    def __init__(
+        self,
+        send: Send,
+        compliance: ComplianceEngine,
+        block_status_code: int = 403,
+        overlap: int = 256,
+        text_paths: Sequence[str] = SSE_TEXT_PATHS,
+    ) -> None:
+        self._send = send
+        self.compliance = compliance
+        self.block_status_code = block_status_code
+        self.overlap = overlap
+        self.text_paths = tuple(compile_path(path) for path in text_paths)
+        self.blocked = False
+        self._start: Optional[Message] = None
+        self._passthrough = False
+        self._sse = False
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._scanner: Optional[StreamingComplianceScanner] = None
+        self._pending = b""
+        self._events: Deque[Tuple[bytes, int]] = deque()
+        self._event_text = 0
+
+    async def __call__(self, message: Message) -> None:
+        kind = message["type"]
+        if kind == "http.response.start":
+            content_type = b""
+            encoded = False
+            for key, value in message.get("headers", ()):
+                key = key.lower()
+                if key == b"content-type":
+                    content_type = value.lower()
+                elif key == b"content-encoding":
+                    # compressed bytes cannot be scanned as text
+                    encoded = value.strip().lower() not in (b"", b"identity")
+            self._sse = content_type.startswith(b"text/event-stream")
+            self._passthrough = encoded or not any(marker in content_type for marker in _TEXT_CONTENT_TYPES)
+            if self._passthrough:
+                await self._send(message)
+            else:
+                self._start = message
+            return
+        if kind != "http.response.body" or self._passthrough:
+            await self._send(message)
+            return
+        if self.blocked:
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if self._start is not None and not more_body and not self._pending and not self._events:
+            await self._send_whole(message, body)
+            return
+
+        if self._sse:
+            events = self._split_events(body, final=not more_body)
+            text = "".join(event_text for _, event_text in events)
+        else:
+            text = self._decoder.decode(body, final=not more_body)
+        if self._scanner is None:
+            self._scanner = self.compliance.stream()
+        result = self._scanner.feed(text)
+        if not more_body:
+            result = self._scanner.finish()
+        if result.block:
+            await self._cut(result)
+            return
+
+        if self._sse:
+            chunk = self._release_events(events, more_body)
+        else:
+            self._pending += body
+            release = _tail_start(self._pending, self.overlap) if more_body else len(self._pending)
+            chunk, self._pending = self._pending[:release], self._pending[release:]
+        if chunk or not more_body:
+            await self._flush_start()
+            await self._send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+
+    def _split_events(self, body: bytes, final: bool) -> List[Tuple[bytes, str]]:
+        self._pending += body
+        events: List[Tuple[bytes, str]] = []
+        start = 0
+        for boundary in _EVENT_BOUNDARY.finditer(self._pending):
+            part = self._pending[start : boundary.start()]
+            events.append((self._pending[start : boundary.end()], sse_event_text(part, self.text_paths)))
+            start = boundary.end()
+        self._pending = self._pending[start:]
+        if final and self._pending:
+            events.append((self._pending, sse_event_text(self._pending, self.text_paths)))
+            self._pending = b""
+        return events
+
+    def _release_events(self, events: List[Tuple[bytes, str]], more_body: bool) -> bytes:
+        for raw, text in events:
+            self._events.append((raw, len(text)))
+            self._event_text += len(text)
+        released: List[bytes] = []
+        while self._events and (not more_body or self._event_text - self._events[0][1] >= self.overlap):
+            raw, length = self._events.popleft()
+            self._event_text -= length
+            released.append(raw)
+        return b"".join(released)
+
+    async def _send_whole(self, message: Message, body: bytes) -> None:
+        if self._sse:
+            text = "".join(sse_event_text(part, self.text_paths) for part in _EVENT_BOUNDARY.split(body))
+        else:
+            text = body.decode("utf-8", errors="replace")
+        result = self.compliance.scan(text) if text.strip() else None
+        if result is not None and result.block:
+            self.blocked = True
+            self._start = None
+            await send_json(self._send, self.block_status_code, _block_payload(result, "compliance_blocked"))
+            return
+        await self._flush_start()
+        await self._send(message)
+
+    async def _flush_start(self) -> None:
+        if self._start is not None:
+            start, self._start = self._start, None
+            await self._send(start)
+
+    async def _cut(self, result: Any) -> None:
+        self.blocked = True
+        if self._scanner is not None:
+            self._scanner.finish()
+        self._pending = b""
+        self._events.clear()
+        payload = _block_payload(result, "compliance_blocked")
+        if self._start is not None:
+            self._start = None
+            await send_json(self._send, self.block_status_code, payload)
+        elif self._sse:
+            event = f"event: promptshield.blocked\ndata: {json.dumps(payload)}\n\n".encode("utf-8")
+            await self._send({"type": "http.response.body", "body": event, "more_body": False})
+        else:
+            await self._send({"type": "http.response.body", "body": b"", "more_body": False})
+
+
+class PromptShieldASGIMiddleware:
+    """Blocks requests with high-risk prompt content, without Starlette.
+
+    Only JSON ``POST``/``PUT``/``PATCH`` requests are inspected; everything else
+    is passed to the app untouched. The body is read chunk by chunk and
+    reading stops as soon as ``max_body_bytes`` is exceeded. The chunks that
+    were received are replayed to the app as-is.
+
+    Prompt text is located with an :class:`ExtractionProfile` (by default the
+    top-level ``prompt_field``/``system_field``). ``route_profiles`` maps path
+    prefixes to profiles, e.g. ``{"/v1/chat": OPENAI_CHAT_PROFILE}``; the
+    longest matching prefix wins.
+
+    With ``scan_responses=True`` every text or JSON response is also passed
+    through ``compliance_engine`` (see :class:`ResponseGuard`), including
+    Server-Sent Event streams.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        block_threshold: int = 70,
+        prompt_field: str = "prompt",
+        system_field: str = "system_prompt",
+        block_status_code: int = 403,
+        max_body_bytes: int = 100_000,
+        engine: Optional[PromptShieldEngine] = None,
+        profile: Optional[ExtractionProfile] = None,
+        route_profiles: Optional[Mapping[str, ExtractionProfile]] = None,
+        scan_responses: bool = False,
+        compliance_engine: Optional[ComplianceEngine] = None,
+        response_overlap: int = 256,
+    ) -> None:
+        self.app = app
+        self.block_threshold = block_threshold
+        self.prompt_field = prompt_field
+        self.system_field = system_field
+        self.block_status_code = block_status_code
+        self.max_body_bytes = max_body_bytes
+        self.engine = engine or PromptShieldEngine()
+        self.scan_responses = scan_responses or compliance_engine is not None
+        self.compliance_engine = compliance_engine or (ComplianceEngine() if self.scan_responses else None)
+        self.response_overlap = response_overlap
+        default = profile or ExtractionProfile(prompt_paths=(prompt_field,), system_paths=(system_field,))
+        self._default_profile = default.compile()
+        self._route_profiles: Tuple[Tuple[str, CompiledProfile], ...] = tuple(
+            sorted(
+                ((prefix, route_profile.compile()) for prefix, route_profile in (route_profiles or {}).items()),
+                key=lambda item: len(item[0]),
+                reverse=True,
+            )
+        )
+
+    def profile_for(self, path: str) -> CompiledProfile:
+        for prefix, compiled in self._route_profiles:
+            if path.startswith(prefix):
+                return compiled
+        return self._default_profile
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # the app's responses are scanned; the middleware's own 403/413 replies go out directly
+        app_send = send
+        if scope["type"] == "http" and self.compliance_engine is not None:
+            app_send = ResponseGuard(send, self.compliance_engine, self.block_status_code, self.response_overlap)
+        if scope["type"] != "http" or scope.get("method") not in _MUTATING_METHODS:
+            await self.app(scope, receive, app_send)
+            return
+
+        content_type = _header(scope, b"content-type") or b""
+        if b"application/json" not in content_type:
+            await self.app(scope, receive, app_send)
+            return
+
+        content_length = _header(scope, b"content-length")
+        if content_length and content_length.isdigit() and int(content_length) > self.max_body_bytes:
+            await self._too_large(send)
+            return
+
+        messages: List[Message] = []
+        chunks: List[bytes] = []
+        size = 0
+        while True:
+            message = await receive()
+            messages.append(message)
+            if message["type"] != "http.request":
+                # client disconnected before the body was complete
+                await self.app(scope, replay_receive(messages, receive), app_send)
+                return
+            chunk = message.get("body", b"")
+            if chunk:
+                size += len(chunk)
+                if size > self.max_body_bytes:
+                    await self._too_large(send)
+                    return
+                chunks.append(chunk)
+            if not message.get("more_body", False):
+                break
+
+        downstream = replay_receive(messages, receive)
+        if not chunks:
+            await self.app(scope, downstream, app_send)
+            return
+
+        body = chunks[0] if len(chunks) == 1 else b"".join(chunks)
+        blocked = self._inspect(body, self.profile_for(scope.get("path", "")))
+        if blocked is not None:
+            await send_json(send, self.block_status_code, blocked)
+            return
+        await self.app(scope, downstream, app_send)
+
+    def _inspect(self, body: bytes, profile: CompiledProfile) -> Optional[Dict[str, Any]]:
+        """Return the block response payload, or ``None`` to let the request through."""
+        root_keys = profile.root_keys
+        # keys can be written with escapes (``"\\u0070rompt"``), so only trust the
+        # byte check when the body has none
+        if root_keys and b"\\" not in body and not any(key in body for key in root_keys):
+            return None
+        try:
+            payload = json.loads(body)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            return None
+
+        extracted = profile.extract(payload)
+        if extracted.empty:
+            return None
+        result = self.engine.scan(
+            prompt=extracted.prompt,
+            system_prompt=extracted.system_prompt,
+            messages=extracted.messages or None,
+        )
+        if result.risk_score < self.block_threshold:
+            return None
+        return _block_payload(result)
+
+    async def _too_large(self, send: Send) -> None:
+        await send_json(send, 413, {"error": "payload_too_large", "max_body_bytes": self.max_body_bytes})
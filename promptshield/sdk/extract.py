@@ -0,0 +1,161 @@
+"""Precompiled field-path extraction for request payloads."""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from typing import Any, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
+
+from promptshield.engine.types import Message
+
+_WILDCARD = object()
+_SEGMENT = re.compile(r"([^.\[\]]+)?((?:\[(?:\*|\d+)\])*)")
+_INDEX = re.compile(r"\[(\*|\d+)\]")
+
+Step = Union[str, int, object]
+
+
+@dataclass(frozen=True)
+class FieldPath:
+    """A compiled path such as ``messages[*].content`` or ``input.text``."""
+
+    source: str
+    steps: Tuple[Step, ...]
+
+    @property
+    def root_key(self) -> Optional[str]:
+        first = self.steps[0] if self.steps else None
+        return first if isinstance(first, str) else None
+
+    def extract(self, payload: Any) -> Iterator[Any]:
+        """Yield every value at this path, walking ``payload`` in place."""
+        yield from _walk(payload, self.steps, 0)
+
+
+def compile_path(path: str) -> FieldPath:
+    steps: List[Step] = []
+    for part in path.split("."):
+        match = _SEGMENT.fullmatch(part)
+        if match is None or not part:
+            raise ValueError(f"invalid field path: {path!r}")
+        name, indexes = match.groups()
+        if name:
+            steps.append(name)
+        for index in _INDEX.findall(indexes or ""):
+            steps.append(_WILDCARD if index == "*" else int(index))
+    if not steps:
+        raise ValueError(f"invalid field path: {path!r}")
+    return FieldPath(source=path, steps=tuple(steps))
+
+
+def _walk(node: Any, steps: Tuple[Step, ...], position: int) -> Iterator[Any]:
+    if position == len(steps):
+        yield node
+        return
+    step = steps[position]
+    if step is _WILDCARD:
+        if isinstance(node, list):
+            for item in node:
+                yield from _walk(item, steps, position + 1)
+    elif isinstance(step, int):
+        if isinstance(node, list) and -len(node) <= step < len(node):
+            yield from _walk(node[step], steps, position + 1)
+    elif isinstance(node, dict) and step in node:
+        yield from _walk(node[step], steps, position + 1)
+
+
+def text_of(value: Any) -> Optional[str]:
+    """Return the text of a string or an OpenAI-style content-part list."""
+    if isinstance(value, str):
+        return value
+    if isinstance(value, list):
+        parts = [text_of(item) for item in value]
+        joined = "\n".join(part for part in parts if part)
+        return joined or None
+    if isinstance(value, dict):
+        for key in ("text", "content"):
+            if key in value:
+                return text_of(value[key])
+    return None
+
+
+@dataclass(frozen=True)
+class ExtractedPrompt:
+    prompt: Optional[str] = None
+    system_prompt: Optional[str] = None
+    messages: List[Message] = field(default_factory=list)
+
+    @property
+    def empty(self) -> bool:
+        return not self.prompt and not self.messages
+
+
+@dataclass(frozen=True)
+class ExtractionProfile:
+    """Where to find prompt text in a JSON payload.
+
+    ``prompt_paths`` and ``system_paths`` resolve to text. ``message_paths``
+    resolve to chat messages (mappings with ``role`` and ``content``), which
+    are routed into ``scan_messages``.
+    """
+
+    name: str = "default"
+    prompt_paths: Sequence[str] = ("prompt",)
+    system_paths: Sequence[str] = ("system_prompt",)
+    message_paths: Sequence[str] = ()
+
+    def compile(self) -> "CompiledProfile":
+        return CompiledProfile(
+            name=self.name,
+            prompt_paths=tuple(compile_path(path) for path in self.prompt_paths),
+            system_paths=tuple(compile_path(path) for path in self.system_paths),
+            message_paths=tuple(compile_path(path) for path in self.message_paths),
+        )
+
+
+@dataclass(frozen=True)
+class CompiledProfile:
+    name: str
+    prompt_paths: Tuple[FieldPath, ...]
+    system_paths: Tuple[FieldPath, ...]
+    message_paths: Tuple[FieldPath, ...]
+
+    @property
+    def root_keys(self) -> Tuple[bytes, ...]:
+        """Quoted top-level keys; a body without backslashes or any of them needs no parsing."""
+        keys = {
+            path.root_key
+            for path in (*self.prompt_paths, *self.system_paths, *self.message_paths)
+        }
+        if None in keys:
+            return ()
+        return tuple(f'"{key}"'.encode("utf-8") for key in sorted(keys))  # type: ignore[arg-type]
+
+    def extract(self, payload: Any) -> ExtractedPrompt:
+        messages: List[Message] = []
+        for path in self.message_paths:
+            for item in path.extract(payload):
+                if not isinstance(item, Mapping):
+                    continue
+                content = text_of(item.get("content"))
+                role = item.get("role")
+                if role and content:
+                    messages.append(Message(role=str(role), content=content))
+        prompt = _join_text(self.prompt_paths, payload)
+        system_prompt = _join_text(self.system_paths, payload)
+        return ExtractedPrompt(prompt=prompt, system_prompt=system_prompt, messages=messages)
+
+
+def _join_text(paths: Tuple[FieldPath, ...], payload: Any) -> Optional[str]:
+    texts = [text for path in paths for text in map(text_of, path.extract(payload)) if text]
+    return "\n".join(texts) if texts else None
+
+
+DEFAULT_PROFILE = ExtractionProfile()
+
+OPENAI_CHAT_PROFILE = ExtractionProfile(
+    name="openai_chat",
+    prompt_paths=("prompt",),
+    system_paths=("system_prompt",),
+    message_paths=("messages[*]",),
+)
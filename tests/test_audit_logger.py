@@ -0,0 +1,155 @@
+import json
+import time
+
+from promptshield.compliance.audit import AuditLogger
+from promptshield.engine.events import SecurityEvent
+
+
+def test_buffered_logger_flushes_on_close(tmp_path):
+    path = tmp_path / "audit.log.jsonl"
+    logger = AuditLogger(str(path), buffered=True, batch_size=1000, flush_interval=60, fsync="batch")
+    for idx in range(10):
+        logger.log_security_event(SecurityEvent(event_type="test", message=str(idx)))
+    assert not path.exists() or path.read_text() == ""
+
+    logger.close()
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["message"] for line in lines] == [str(idx) for idx in range(10)]
+
+
+def test_buffered_writer_survives_a_failed_write(tmp_path):
+    path = tmp_path / "audit.log.jsonl"
+    logger = AuditLogger(str(path), buffered=True, batch_size=1, flush_interval=0.01)
+    original = logger._write_data
+    failures = []
+
+    def failing_once(data):
+        if not failures:
+            failures.append(data)
+            raise OSError("disk full")
+        original(data)
+
+    logger._write_data = failing_once
+    deadline = time.monotonic() + 5
+    logger.log_custom("test", "lost")
+    while not failures and time.monotonic() < deadline:
+        time.sleep(0.01)
+    # the background thread keeps running and writes the next batch itself
+    logger.log_custom("test", "kept")
+    while not (path.exists() and path.read_text(encoding="utf-8")) and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert logger._writer.is_alive()
+    logger.close()
+    assert [json.loads(line)["message"] for line in path.read_text(encoding="utf-8").splitlines()] == ["kept"]
+
+
+def test_unbuffered_logger_writes_immediately(tmp_path):
+    path = tmp_path / "audit.log.jsonl"
+    logger = AuditLogger(str(path))
+    logger.log_custom("custom", "hello", {"a": 1})
+    record = json.loads(path.read_text(encoding="utf-8"))
+    assert record["event_type"] == "custom"
+    assert record["metadata"] == {"a": 1}
+
+
+def test_rotation_compresses_segments_and_records_manifest(tmp_path):
+    from promptshield.compliance.rotation import RotationPolicy, find_segments, iter_segment_lines, load_manifest
+
+    path = tmp_path / "audit.log.jsonl"
+    logger = AuditLogger(str(path), rotation=RotationPolicy(max_bytes=400, backup_count=3))
+    for idx in range(40):
+        logger.log_custom("test", f"event-{idx}")
+    logger.close()
+
+    segments = load_manifest(path)
+    assert len(segments) == 3
+    assert all(segment.compressed and segment.path.endswith(".gz") for segment in segments)
+    assert all(segment.start <= segment.end for segment in segments)
+    assert sorted(p.name for p in tmp_path.glob("*.gz")) == [segment.path for segment in segments]
+
+    archived = [json.loads(line)["message"] for seg in find_segments(path) for line in iter_segment_lines(seg)]
+    current = [json.loads(line)["message"] for line in path.read_text(encoding="utf-8").splitlines()]
+    assert (archived + current)[-1] == "event-39"
+    assert path.stat().st_size <= 400
+
+
+def _write_worker(path, worker, count):
+    logger = AuditLogger(path, buffered=True, batch_size=64, multiprocess=True, max_write_bytes=16 * 1024)
+    payload = "x" * 6000
+    for idx in range(count):
+        logger.log_custom("stress", f"{worker}-{idx}", {"payload": payload})
+    logger.close()
+
+
+def test_multiprocess_appends_do_not_tear(tmp_path):
+    import multiprocessing
+
+    path = str(tmp_path / "audit.log.jsonl")
+    workers, count = 4, 300
+    procs = [multiprocessing.Process(target=_write_worker, args=(path, w, count)) for w in range(workers)]
+    for proc in procs:
+        proc.start()
+    for proc in procs:
+        proc.join()
+
+    lines = (tmp_path / "audit.log.jsonl").read_text(encoding="utf-8").splitlines()
+    messages = {json.loads(line)["message"] for line in lines}
+    assert len(lines) == workers * count
+    assert len(messages) == workers * count
+
+
+def test_merge_worker_logs_orders_by_timestamp(tmp_path):
+    from promptshield.compliance.audit import AuditEvent, merge_audit_logs, worker_log_path
+
+    base = str(tmp_path / "audit.log.jsonl")
+    first = AuditLogger(worker_log_path(base, "a"))
+    second = AuditLogger(worker_log_path(base, "b"))
+    for idx, logger in enumerate([first, second, first, second]):
+        logger.log_event(AuditEvent(event_type="t", timestamp=f"2026-01-01T00:00:0{idx}+00:00", message=str(idx)))
+
+    output = tmp_path / "merged.jsonl"
+    assert merge_audit_logs([first.path, second.path], str(output)) == 4
+    assert [json.loads(line)["message"] for line in output.read_text().splitlines()] == ["0", "1", "2", "3"]
+
+
+def test_sqlite_store_queries_by_category_and_verdict(tmp_path):
+    from datetime import datetime, timedelta, timezone
+
+    from promptshield.compliance.store import SQLiteAuditStore
+
+    store = SQLiteAuditStore(str(tmp_path / "audit.db"), batch_size=10)
+    now = datetime.now(timezone.utc)
+    for idx in range(30):
+        store(
+            SecurityEvent(
+                event_type="promptshield.scan",
+                message=str(idx),
+                metadata={"blocked": idx % 3 == 0, "category": "JAILBREAK" if idx % 2 else "NONE", "risk_score": idx},
+                timestamp=now - timedelta(minutes=idx * 5),
+            )
+        )
+    store.flush()
+
+    recent_blocks = store.query(category="JAILBREAK", blocked=True, since=now - timedelta(hours=1))
+    assert [row["message"] for row in recent_blocks] == ["3", "9"]
+    assert store.count(blocked=True) == 10
+    assert store.counts_by_category() == {"JAILBREAK": 15, "NONE": 15}
+    store.close()
+
+
+def test_read_tail_pages_backwards_with_filters(tmp_path):
+    from promptshield.compliance.tail import EventFilter, read_tail
+
+    path = tmp_path / "audit.log.jsonl"
+    logger = AuditLogger(str(path))
+    for idx in range(50):
+        logger.log_custom("promptshield.scan", str(idx), {"blocked": idx % 5 == 0, "category": "JAILBREAK"})
+
+    page = read_tail(path, limit=10)
+    assert [event["message"] for event in page.events] == [str(idx) for idx in range(40, 50)]
+    older = read_tail(path, limit=10, before=page.next_cursor)
+    assert [event["message"] for event in older.events] == [str(idx) for idx in range(30, 40)]
+
+    blocked = read_tail(path, limit=100, event_filter=EventFilter(blocked=True))
+    assert [event["message"] for event in blocked.events] == [str(idx) for idx in range(0, 50, 5)]
+    assert blocked.next_cursor is None
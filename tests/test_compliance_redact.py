@@ -0,0 +1,45 @@
+import random
+
+from promptshield.compliance import ComplianceEngine, RedactionMode, redact_output
+from promptshield.compliance.patterns import find_matches, pii_patterns, secret_patterns
+
+KEY = "AKIA" + "ABCDEFGHIJKLMNOP"
+
+
+def test_redacts_pii_and_secrets_with_placeholders():
+    text = f"Mail jane@example.com, key {KEY}. SSN 123-45-6789."
+    redacted = redact_output(text)
+    assert redacted.text == "Mail [EMAIL], key [AWS_ACCESS_KEY]. SSN [SSN]."
+    assert [span.category for span in redacted.spans] == ["PII", "SECRETS", "PII"]
+    assert redacted.result == ComplianceEngine().scan(text)
+
+
+def test_mask_keeps_length_and_hash_is_stable():
+    text = f"{KEY} and {KEY}"
+    masked = redact_output(text, RedactionMode.MASK)
+    assert masked.text == "*" * len(KEY) + " and " + "*" * len(KEY)
+    hashed = redact_output(text, "hash").text
+    first, second = hashed.split(" and ")
+    assert first == second and first.startswith("[AWS_ACCESS_KEY:")
+
+
+def test_large_output_is_redacted_in_linear_time():
+    text = "row jane@example.com ok\n" * 50_000
+    redacted = redact_output(text)
+    assert len(redacted.spans) == 50_000
+    assert redacted.text.count("[EMAIL]") == 50_000
+
+
+def test_every_critical_match_is_covered_by_a_span():
+    # "411 111 1111" fails the phone validator; the card starting at the same place must still be found
+    redacted = redact_output("Card on file: 411 111 1111 111 111.")
+    assert redacted.text == "Card on file: [CREDIT_CARD]."
+    rng = random.Random(3)
+    pieces = ["411 111 1111 111 111", "4111 1111 1111 1111", "123-45-6789", "212-555-0100", "jane@example.com", KEY]
+    pieces += [" ", "9", "x"]
+    rules = [rule for patterns in (pii_patterns(), secret_patterns()) for rule in patterns.critical]
+    for _ in range(300):
+        text = "x" + "".join(rng.choice(pieces) for _ in range(rng.randint(1, 8)))
+        spans = redact_output(text).spans
+        covered = {name for span in spans for name in span.rules}
+        assert covered == set(find_matches(text, rules)), text
@@ -0,0 +1,38 @@
+from promptshield.compliance import ComplianceEngine, iter_string_leaves, scan_structured
+
+KEY = "AKIA" + "ABCDEFGHIJKLMNOP"
+
+
+def test_reports_json_path_of_each_hit():
+    payload = {
+        "choices": [{"message": {"role": "assistant", "content": f"Mail jane@example.com, key {KEY}"}}],
+        "usage": {"total_tokens": 5551234567},
+    }
+    scanned = scan_structured(payload)
+    assert [(hit.path, hit.rules) for hit in scanned.hits] == [
+        ("choices[0].message.content", ("email",)),
+        ("choices[0].message.content", ("aws_access_key",)),
+    ]
+    content = payload["choices"][0]["message"]["content"]
+    assert content[scanned.hits[1].start : scanned.hits[1].end] == KEY
+    assert scanned.result.block
+
+
+def test_hits_include_matches_behind_rejected_candidates():
+    scanned = scan_structured({"note": "Card on file: 411 111 1111 111 111."})
+    assert [(hit.path, hit.rules, hit.start, hit.end) for hit in scanned.hits] == [("note", ("credit_card",), 14, 34)]
+
+
+def test_skip_lists_and_numbers():
+    payload = {"id": "jane@example.com", "data": [{"phone": 12125551234, "note": "call me"}], "odd key": "x"}
+    leaves = [(steps, text) for steps, text in iter_string_leaves(payload, skip_keys=["id"])]
+    assert leaves == [(("data", 0, "phone"), "12125551234"), (("data", 0, "note"), "call me"), (("odd key",), "x")]
+    assert [hit.path for hit in scan_structured(payload).hits] == ["id", "data[0].phone"]
+    assert scan_structured(payload, skip_keys=["id"], skip_paths=["data[*].phone"]).hits == []
+
+
+def test_keys_are_not_scanned_and_empty_payloads_allow():
+    engine = ComplianceEngine()
+    assert engine.scan_structured({"address": "ok"}).result.risk_score == 0
+    empty = engine.scan_structured({"items": [], "flag": True})
+    assert not empty.result.block and empty.leaves == 0
@@ -0,0 +1,28 @@
+from promptshield.compliance import ComplianceConfig, ComplianceEngine, redact_output
+from promptshield.compliance.patterns import find_matches, pii_patterns
+from promptshield.compliance.validators import luhn_valid, phone_plausible, ssn_valid
+
+
+def test_validators():
+    assert luhn_valid("4111 1111 1111 1111")
+    assert not luhn_valid("4111 1111 1111 1112")
+    assert not luhn_valid("1234567890123452")  # no card network starts with 1
+    assert ssn_valid("123-45-6789")
+    assert not ssn_valid("666-45-6789") and not ssn_valid("912-45-6789") and not ssn_valid("123-00-6789")
+    assert phone_plausible("(212) 555-0100") and phone_plausible("+1 212 555 0100")
+    assert not phone_plausible("(123) 555-0100") and not phone_plausible("212 155 0100")
+
+
+def test_digit_heavy_output_without_pii_is_not_flagged():
+    log = "\n".join(f"2024-05-01 12:00:{i % 60:02d} req=4111111111111112 took 1234567ms" for i in range(200))
+    assert find_matches(log, pii_patterns().critical) == []
+    assert ComplianceEngine(ComplianceConfig()).scan(log).risk_score == 0
+    assert find_matches("card 4111-1111-1111-1111", pii_patterns().critical) == ["credit_card"]
+
+
+def test_common_phone_formats_are_found():
+    numbers = ["212-555-0100", "(212) 555-0100", "212 555 0100", "1-212-555-0100", "+1 (212) 555-0100", "+44 20 7946 0958"]
+    for text in numbers:
+        assert find_matches(f"call {text} today", pii_patterns().critical) == ["phone"], text
+        assert redact_output(f"call {text} today").text == "call [PHONE] today", text
+    assert find_matches("call 212-155-0100 or x2125550100", pii_patterns().critical) == []
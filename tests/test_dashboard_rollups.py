@@ -0,0 +1,80 @@
+import time
+from datetime import datetime, timedelta, timezone
+
+from promptshield.dashboard.rollups import RollupAggregator
+from promptshield.engine.events import SecurityEvent
+
+
+def _event(minute: int, blocked: bool, category: str, risk_score: int) -> SecurityEvent:
+    timestamp = datetime(2026, 1, 1, 12, 0, tzinfo=timezone.utc) + timedelta(minutes=minute, seconds=5)
+    return SecurityEvent(
+        event_type="promptshield.scan",
+        message="Prompt scanned",
+        metadata={"blocked": blocked, "category": category, "risk_score": risk_score},
+        timestamp=timestamp,
+    )
+
+
+def test_rollups_bucket_and_snapshot(tmp_path):
+    snapshot = tmp_path / "rollups.json"
+    rollups = RollupAggregator(retention={"minute": 3, "hour": 24}, snapshot_path=str(snapshot))
+    for minute in range(5):
+        rollups.log_security_event(_event(minute, blocked=True, category="JAILBREAK", risk_score=95))
+        rollups.log_security_event(_event(minute, blocked=False, category="NONE", risk_score=5))
+
+    minutes = rollups.query("minute")
+    assert [bucket["start"][11:16] for bucket in minutes] == ["12:02", "12:03", "12:04"]
+    assert minutes[-1]["block_rate"] == 0.5
+    assert minutes[-1]["risk_histogram"][0] == 1 and minutes[-1]["risk_histogram"][9] == 1
+
+    hours = rollups.query("hour")
+    assert hours[0]["total"] == 10
+    assert hours[0]["categories"] == {"JAILBREAK": 5, "NONE": 5}
+
+    saved = rollups.snapshot(position=(1, 42))
+    rollups.log_security_event(_event(4, blocked=True, category="PII", risk_score=80))
+    # the snapshot is a copy, taken with the position it covers
+    [hour] = saved["buckets"]["hour"].values()
+    assert "PII" not in hour["categories"] and hour["total"] == 10
+    rollups.write(saved)
+    restored = RollupAggregator(retention={"minute": 3, "hour": 24}, snapshot_path=str(snapshot))
+    assert restored.load() == (1, 42)
+    assert restored.query("hour") == hours
+
+
+def test_rollups_tolerate_malformed_values():
+    rollups = RollupAggregator()
+    for risk_score, weight in (("high", "n/a"), (float("inf"), None), (None, float("nan")), ("80", "2")):
+        rollups.add(
+            {
+                "timestamp": "2026-01-01T12:00:05+00:00",
+                "event_type": "promptshield.scan",
+                "metadata": {"risk_score": risk_score, "sample_weight": weight},
+            }
+        )
+    [bucket] = rollups.query("minute")
+    assert bucket["total"] == 4
+    assert bucket["weight"] == 5.0
+    assert sum(bucket["risk_histogram"]) == 1 and bucket["risk_histogram"][8] == 1
+
+
+def test_dashboard_serves_rollups_from_log(tmp_path):
+    from fastapi.testclient import TestClient
+
+    from promptshield.compliance.audit import AuditLogger
+    from promptshield.dashboard.app import create_app
+
+    log_path = tmp_path / "audit.log.jsonl"
+    logger = AuditLogger(str(log_path))
+    app = create_app(str(log_path))
+    app.state.broadcaster.poll_interval = 0.01
+    with TestClient(app) as client:
+        logger.log_custom("promptshield.scan", "scan", {"blocked": True, "category": "JAILBREAK", "risk_score": 90})
+        for _ in range(100):
+            buckets = client.get("/rollups/minute").json()
+            if buckets:
+                break
+            time.sleep(0.02)
+        assert buckets[-1]["blocked"] == 1
+        assert client.get("/rollups/minute", params={"since": "yesterday"}).status_code == 400
+    assert (tmp_path / "audit.log.jsonl.rollups.json").exists()
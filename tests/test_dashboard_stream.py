@@ -0,0 +1,78 @@
+import asyncio
+import json
+
+from promptshield.compliance.audit import AuditLogger
+from promptshield.dashboard.stream import EventBroadcaster, LogFollower, sse_stream
+
+
+def test_log_follower_survives_rotation(tmp_path):
+    path = tmp_path / "audit.log.jsonl"
+    logger = AuditLogger(str(path))
+    logger.log_custom("t", "before-start")
+    follower = LogFollower(path)
+    assert follower.poll() == []
+
+    logger.log_custom("t", "one")
+    path.rename(tmp_path / "audit.log.jsonl.1")
+    logger.log_custom("t", "two")
+    assert [record["message"] for record in follower.poll()] == ["one", "two"]
+    follower.close()
+
+
+def test_slow_client_does_not_block_others():
+    async def scenario():
+        broadcaster = EventBroadcaster(client_queue_size=2)
+        slow = broadcaster.add_subscriber()
+        fast = sse_stream(broadcaster, heartbeat=1)
+        pending = asyncio.ensure_future(fast.__anext__())
+        received = []
+        for idx in range(5):
+            await asyncio.sleep(0)
+            broadcaster.publish({"message": str(idx)})
+            received.append(await pending)
+            pending = asyncio.ensure_future(fast.__anext__())
+        pending.cancel()
+        await fast.aclose()
+        return received, slow.qsize(), broadcaster
+
+    received, slow_depth, broadcaster = asyncio.run(scenario())
+    assert [json.loads(chunk[len("data: ") :])["message"] for chunk in received] == ["0", "1", "2", "3", "4"]
+    assert slow_depth == 2
+    assert broadcaster.dropped == 3
+    assert broadcaster.subscriber_count == 1
+
+
+def test_log_follower_reads_log_created_later(tmp_path):
+    path = tmp_path / "audit.log.jsonl"
+    follower = LogFollower(path)
+    assert follower.poll() == []
+    AuditLogger(str(path)).log_custom("t", "first")
+    assert [record["message"] for record in follower.poll()] == ["first"]
+
+
+def test_bad_record_does_not_stop_the_stream(tmp_path, caplog):
+    path = tmp_path / "audit.log.jsonl"
+    logger = AuditLogger(str(path))
+    for message in ("one", "bad", "two"):
+        logger.log_custom("t", message)
+
+    async def scenario():
+        broadcaster = EventBroadcaster(LogFollower(path, from_start=True), poll_interval=0.01)
+        seen = []
+
+        def listener(record):
+            if record["message"] == "bad":
+                raise ValueError("unexpected record")
+            seen.append(record["message"])
+
+        broadcaster.listeners.append(listener)
+        broadcaster.start()
+        for _ in range(200):
+            await asyncio.sleep(0.01)
+            if len(seen) == 2:
+                break
+        await broadcaster.stop()
+        return seen
+
+    assert asyncio.run(scenario()) == ["one", "two"]
+    assert "unexpected record" in caplog.text
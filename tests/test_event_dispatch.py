@@ -0,0 +1,62 @@
+import threading
+import time
+
+from promptshield import PromptShieldEngine
+from promptshield.engine.config import EngineConfig
+from promptshield.engine.dispatch import EventDispatcher
+from promptshield.engine.events import SecurityEvent
+from promptshield.engine.registry import default_detectors
+
+
+def _event(blocked: bool) -> SecurityEvent:
+    return SecurityEvent(event_type="test", message="", metadata={"blocked": blocked})
+
+
+def test_dispatcher_delivers_off_the_scan_path():
+    received = []
+
+    def slow_sink(event):
+        time.sleep(0.05)
+        received.append(event)
+
+    dispatcher = EventDispatcher([slow_sink])
+    engine = PromptShieldEngine(
+        config=EngineConfig(event_sink=dispatcher),
+        detectors=default_detectors(),
+        include_entry_points=False,
+    )
+    started = time.perf_counter()
+    for _ in range(5):
+        engine.scan(prompt="hello there")
+    assert time.perf_counter() - started < 0.25
+
+    assert dispatcher.flush(timeout=5)
+    dispatcher.close()
+    assert len(received) == 5
+    assert dispatcher.stats().delivered == 5
+
+
+def test_drop_allowed_keeps_blocked_events():
+    gate = threading.Event()
+    received = []
+
+    def gated_sink(events):
+        gate.wait()
+        received.extend(events)
+
+    dispatcher = EventDispatcher(batch_sinks=[gated_sink], max_queue=2, batch_size=1, overflow="drop_allowed")
+    dispatcher.submit(_event(False))
+    time.sleep(0.1)  # worker picks up the first event and waits on the gate
+    dispatcher.submit(_event(False))
+    dispatcher.submit(_event(True))
+    assert dispatcher.submit(_event(True)) is True
+    assert dispatcher.submit(_event(False)) is False
+
+    stats = dispatcher.stats()
+    assert stats.queue_depth == 2
+    assert stats.dropped == 2
+    assert stats.dropped_allowed == 2
+
+    gate.set()
+    dispatcher.close()
+    assert [event.metadata["blocked"] for event in received] == [False, True, True]
@@ -7,3 +7,127 @@ def test_load_attack_pack():
     root = Path(__file__).resolve().parents[1]
     pack = load_attack_pack(str(root / "attacks" / "packs" / "starter.yaml"))
     assert pack.attacks
+
+
+def test_parallel_run_matches_serial_run_in_order():
+    from dataclasses import replace
+
+    from promptshield.redteam import run_attack_pack, run_attack_pack_parallel
+    from promptshield.redteam.runner import summarize_run
+
+    root = Path(__file__).resolve().parents[1]
+    pack = load_attack_pack(str(root / "attacks" / "packs" / "starter.yaml"))
+    pack = replace(pack, attacks=pack.attacks * 10)
+
+    serial = run_attack_pack(pack)
+    parallel, timings = run_attack_pack_parallel(pack, workers=2, chunk_size=7)
+    assert [result.case.attack_id for result in parallel.results] == [result.case.attack_id for result in serial.results]
+    assert [result.scan for result in parallel.results] == [result.scan for result in serial.results]
+    assert summarize_run(parallel) == summarize_run(serial)
+    assert sum(timing.cases for timing in timings) == len(pack.attacks)
+
+
+def test_pack_cache_skips_parsing_until_the_file_changes(tmp_path, monkeypatch):
+    import os
+
+    from promptshield.redteam import PackCache, packs
+
+    root = Path(__file__).resolve().parents[1]
+    source = tmp_path / "starter.yaml"
+    source.write_bytes((root / "attacks" / "packs" / "starter.yaml").read_bytes())
+    first = load_attack_pack(str(source), cache=PackCache(tmp_path / "cache"))
+
+    parses = []
+    original = packs._parse_attack_pack
+    monkeypatch.setattr(packs, "_parse_attack_pack", lambda *args: parses.append(args) or original(*args))
+    cached = load_attack_pack(str(source), cache=PackCache(tmp_path / "cache"))
+    assert cached == first and parses == []
+
+    source.write_text(source.read_text().replace(first.name, "Edited Pack"))
+    os.utime(source, ns=(1, 1))
+    assert load_attack_pack(str(source), cache=PackCache(tmp_path / "cache")).name == "Edited Pack"
+    assert len(parses) == 1
+    # entries are JSON, and the entry for the old contents was evicted
+    entries = list((tmp_path / "cache").iterdir())
+    assert len(entries) == 1 and entries[0].suffix == ".json"
+
+
+def test_combined_packs_with_the_same_file_name_keep_ids_unique(tmp_path):
+    import pytest
+
+    from promptshield.redteam import combine_packs
+
+    root = Path(__file__).resolve().parents[1]
+    content = (root / "attacks" / "packs" / "starter.yaml").read_bytes()
+    for directory in ("a", "b"):
+        (tmp_path / directory).mkdir()
+        (tmp_path / directory / "starter.yaml").write_bytes(content)
+    first = load_attack_pack(str(tmp_path / "a" / "starter.yaml"))
+    second = load_attack_pack(str(tmp_path / "b" / "starter.yaml"))
+
+    combined = combine_packs([first, second])
+    assert combined.attacks[0].attack_id == f"a/starter/{first.attacks[0].attack_id}"
+    assert combined.attacks[-1].attack_id.startswith("b/starter/")
+    with pytest.raises(ValueError, match="Duplicate attack ids"):
+        combine_packs([first, first])
+
+
+def test_directories_resolve_to_one_combined_pack():
+    from promptshield.redteam import combine_packs, resolve_pack_paths
+
+    root = Path(__file__).resolve().parents[1]
+    paths = resolve_pack_paths([str(root / "attacks" / "packs"), str(root / "attacks" / "packs" / "starter.yaml")])
+    assert [path.name for path in paths] == sorted(path.name for path in (root / "attacks" / "packs").glob("*.yaml"))
+    loaded = [load_attack_pack(str(path)) for path in paths]
+    combined = combine_packs(loaded)
+    assert len(combined.attacks) == sum(len(pack.attacks) for pack in loaded)
+    assert len({case.attack_id for case in combined.attacks}) == len(combined.attacks)
+    assert combined.metadata["packs"][0]["name"] == loaded[0].name
+
+
+def test_streaming_reports_match_in_memory_reports(tmp_path):
+    import json
+
+    from promptshield.redteam import StreamingReportWriter, iter_attack_pack, run_attack_pack, write_reports
+    from promptshield.redteam.runner import summarize_run
+
+    root = Path(__file__).resolve().parents[1]
+    pack = load_attack_pack(str(root / "attacks" / "packs" / "hard_multiturn.yaml"))
+    run = run_attack_pack(pack)
+    full = write_reports(run, reports_dir=str(tmp_path / "full"))
+
+    with StreamingReportWriter(pack, reports_dir=str(tmp_path / "stream")) as writer:
+        for outcome in iter_attack_pack(pack):
+            writer.add(outcome)
+    paths = writer.paths
+
+    expected = json.loads(full.json_path.read_text())
+    streamed = [json.loads(line) for line in paths.jsonl_path.read_text().splitlines()]
+    assert streamed == expected["results"]
+    assert json.loads(paths.summary_path.read_text())["summary"] == summarize_run(run) == expected["summary"]
+    assert paths.repro_script_path.read_text() == full.repro_script_path.read_text()
+    markdown = paths.markdown_path.read_text()
+    assert markdown.count("### ") == len(pack.attacks) and "## Summary" in markdown
+    assert json.loads(paths.summary_path.read_text())["complete"] is True
+
+
+def test_aborted_streaming_run_is_marked_incomplete(tmp_path):
+    import json
+
+    import pytest
+
+    from promptshield.redteam import StreamingReportWriter, iter_attack_pack
+
+    root = Path(__file__).resolve().parents[1]
+    pack = load_attack_pack(str(root / "attacks" / "packs" / "hard_multiturn.yaml"))
+    with pytest.raises(KeyboardInterrupt):
+        with StreamingReportWriter(pack, reports_dir=str(tmp_path)) as writer:
+            for outcome in iter_attack_pack(pack):
+                writer.add(outcome)
+                raise KeyboardInterrupt
+
+    sidecar = json.loads(writer.paths.summary_path.read_text())
+    assert sidecar["complete"] is False and sidecar["error"] == "KeyboardInterrupt"
+    assert sidecar["summary"]["total"] == 1
+    markdown = writer.paths.markdown_path.read_text()
+    assert "- Complete: no" in markdown and "- Finished:" not in markdown